@@ -0,0 +1,40 @@
+#!/usr/bin/env node
+
+/**
+ * Post-build script to compile holiday rules into dist/data/holidays.bin
+ * The server maps this table at startup instead of evaluating rules per request
+ *
+ * Year span: HOLIDAY_TABLE_YEARS=1970-2200 (the default)
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const { compileHolidayTable } = require('../dist/data/holidays');
+const {
+  DEFAULT_TABLE_FIRST_YEAR,
+  DEFAULT_TABLE_LAST_YEAR,
+  HOLIDAY_TABLE_FILE,
+} = require('../dist/data/holidayTable');
+
+let firstYear = DEFAULT_TABLE_FIRST_YEAR;
+let lastYear = DEFAULT_TABLE_LAST_YEAR;
+
+if (process.env.HOLIDAY_TABLE_YEARS) {
+  const match = /^(\d{4})-(\d{4})$/.exec(process.env.HOLIDAY_TABLE_YEARS);
+  if (!match || Number(match[1]) > Number(match[2])) {
+    console.error(`Invalid HOLIDAY_TABLE_YEARS: ${process.env.HOLIDAY_TABLE_YEARS}`);
+    process.exit(1);
+  }
+  firstYear = Number(match[1]);
+  lastYear = Number(match[2]);
+}
+
+const table = compileHolidayTable(firstYear, lastYear);
+const tablePath = path.join(__dirname, '../dist/data', HOLIDAY_TABLE_FILE);
+fs.writeFileSync(tablePath, table);
+
+console.log('=== Holiday Table ===');
+console.log(`Years: ${firstYear}-${lastYear}`);
+console.log(`Size: ${(table.byteLength / 1024).toFixed(1)} KB`);
+console.log(`Written to: ${tablePath}`);
@@ -0,0 +1,128 @@
+#!/usr/bin/env node
+
+/**
+ * Optional post-build script to strip debug.* statements from dist/
+ * Production bundles then pay nothing for debug instrumentation, not even
+ * the namespace lookup and argument evaluation of a disabled call
+ *
+ * Usage: npm run build:strip-debug
+ *
+ * Only calls that are whole statements are removed; each becomes `void 0;`
+ * padded with the newlines it spanned, so source maps stay aligned and an
+ * unbraced if keeps a body. Calls used as values (debug.time()) stay.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const distDir = path.join(__dirname, '../dist');
+// tsc emits `debug.x(...)` as `debug_1.debug.x(...)`
+const DEBUG_STATEMENT = /^([ \t]*)debug_\d+\.debug\.\w+\(/gm;
+// The debug implementation itself is left alone
+const SKIP_FILES = /[\\/]utils[\\/]debug[^\\/]*\.js$/;
+
+/**
+ * Index just past the parenthesis that closes the one before `start`,
+ * skipping string and template literals, or -1 if unbalanced
+ */
+function findCallEnd(source, start) {
+  let depth = 1;
+  // Bracket depths at which template ${...} interpolations were opened
+  const interpolations = [];
+  for (let i = start; i < source.length; i++) {
+    let char = source[i];
+    if (char === '}' && interpolations.at(-1) === depth - 1) {
+      interpolations.pop();
+      depth--;
+      char = '`'; // back in template text
+    }
+    if (char === "'" || char === '"') {
+      i = skipString(source, i, char);
+    } else if (char === '`') {
+      i = skipTemplate(source, i + 1);
+      if (source[i] === '{') {
+        interpolations.push(depth);
+        depth++;
+      }
+    } else if ('([{'.includes(char)) {
+      depth++;
+    } else if (')]}'.includes(char) && --depth === 0) {
+      return i + 1;
+    }
+    if (i < 0) return -1;
+  }
+  return -1;
+}
+
+/**
+ * Index of a string's closing quote, or -1
+ */
+function skipString(source, start, quote) {
+  for (let i = start + 1; i < source.length; i++) {
+    if (source[i] === '\\') i++;
+    else if (source[i] === quote) return i;
+  }
+  return -1;
+}
+
+/**
+ * Index of the closing backtick or of the { of a ${, or -1
+ */
+function skipTemplate(source, start) {
+  for (let i = start; i < source.length; i++) {
+    if (source[i] === '\\') {
+      i++;
+    } else if (source[i] === '`') {
+      return i;
+    } else if (source[i] === '$' && source[i + 1] === '{') {
+      return i + 1;
+    }
+  }
+  return -1;
+}
+
+function stripFile(file) {
+  const source = fs.readFileSync(file, 'utf8');
+  let output = '';
+  let last = 0;
+  let stripped = 0;
+  for (const match of source.matchAll(DEBUG_STATEMENT)) {
+    if (match.index < last) continue;
+    const end = findCallEnd(source, match.index + match[0].length);
+    if (end < 0 || source[end] !== ';') continue;
+    const newlines = source.slice(match.index, end).split('\n').length - 1;
+    output += source.slice(last, match.index) + match[1] + 'void 0;' + '\n'.repeat(newlines);
+    last = end + 1;
+    stripped++;
+  }
+  if (stripped > 0) {
+    fs.writeFileSync(file, output + source.slice(last));
+  }
+  return stripped;
+}
+
+function listJsFiles(dir) {
+  return fs.readdirSync(dir, { withFileTypes: true }).flatMap((entry) => {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) return listJsFiles(full);
+    return entry.name.endsWith('.js') && !SKIP_FILES.test(full) ? [full] : [];
+  });
+}
+
+if (!fs.existsSync(distDir)) {
+  console.error('dist/ not found - run npm run build first');
+  process.exit(1);
+}
+
+let total = 0;
+let files = 0;
+for (const file of listJsFiles(distDir)) {
+  const count = stripFile(file);
+  if (count > 0) {
+    total += count;
+    files++;
+  }
+}
+
+console.log('=== Debug Stripping ===');
+console.log(`Removed ${total} debug statements from ${files} files`);
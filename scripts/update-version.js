@@ -3,6 +3,11 @@
 /**
  * Pre-build script to generate version.json
  * This captures build-time information for the server
+ *
+ * This is the only place git is asked: the server loads version.json once
+ * at startup (src/utils/buildInfo.ts) and never spawns git itself. The
+ * file goes to src/ for ts-node and tests, and to dist/, because tsc does
+ * not copy it and installed packages only ship dist/.
  */
 
 const fs = require('fs');
@@ -41,9 +46,13 @@ const versionInfo = {
   buildNumber: process.env.BUILD_NUMBER || Date.now().toString(36),
 };
 
-// Write version file
+// Write version files
+const versionText = JSON.stringify(versionInfo, null, 2);
 const versionPath = path.join(__dirname, '../src/version.json');
-fs.writeFileSync(versionPath, JSON.stringify(versionInfo, null, 2));
+const distVersionPath = path.join(__dirname, '../dist/version.json');
+fs.writeFileSync(versionPath, versionText);
+fs.mkdirSync(path.dirname(distVersionPath), { recursive: true });
+fs.writeFileSync(distVersionPath, versionText);
 
 // Display build info
 console.log('=== Build Version Info ===');
@@ -52,4 +61,4 @@ console.log(`Revision: ${versionInfo.revision}${isDirty ? ' (dirty)' : ''}`);
 console.log(`Branch: ${versionInfo.branch}`);
 console.log(`Build: ${versionInfo.buildNumber}`);
 console.log(`Date: ${versionInfo.buildDate}`);
-console.log(`Written to: ${versionPath}`);
+console.log(`Written to: ${versionPath}, ${distVersionPath}`);
@@ -7,6 +7,11 @@
 
 /**
  * Base error class for all time server errors
+ *
+ * Errors with a 4xx status are expected (bad user input) and are created
+ * without capturing a stack trace, which costs more than the rest of the
+ * error path together. Their stack is just the name and message. Internal
+ * errors (5xx) keep full stacks for diagnosis.
  */
 export class BaseError extends Error {
   public code: string;
@@ -14,13 +19,23 @@ export class BaseError extends Error {
   public readonly details?: unknown;
 
   constructor(message: string, code: string, status: number, details?: unknown) {
+    const expected = status < 500;
+    const stackTraceLimit = Error.stackTraceLimit;
+    if (expected) {
+      Error.stackTraceLimit = 0;
+    }
     super(message);
+    Error.stackTraceLimit = stackTraceLimit;
     this.name = this.constructor.name;
     this.code = code;
     this.status = status;
     this.details = details;
-    // Capture stack trace (excluding constructor)
-    Error.captureStackTrace(this, this.constructor);
+    if (expected) {
+      this.stack = `${this.name}: ${message}`;
+    } else {
+      // Capture stack trace (excluding constructor)
+      Error.captureStackTrace(this, this.constructor);
+    }
   }
 }
 
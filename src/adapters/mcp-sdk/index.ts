@@ -9,7 +9,8 @@
  */
 
 // Import mapper for internal use
-import { mapToMcpError } from './mapper';
+import { mapToMcpError, toErrorResponse } from './mapper';
+import type { ErrorResponse } from './mapper';
 
 // Export our error classes (what tools throw)
 export {
@@ -23,7 +24,11 @@ export {
 } from './errors';
 
 // Re-export the mapper (for index.ts to use)
-export { mapToMcpError };
+export { mapToMcpError, toErrorResponse };
+export type { ErrorResponse };
+
+// Pre-serialized static responses (for index.ts to use)
+export { preserializeResult, TemplatedStdioTransport } from './responseTemplates';
 
 // Re-export MCP types we need (with our fixes applied)
 export { McpError, ErrorCode, CallToolResult } from '@modelcontextprotocol/sdk/types.js';
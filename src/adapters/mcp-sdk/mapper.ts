@@ -21,6 +21,15 @@ import {
  */
 const MAX_DETAILS_SIZE = 10000; // 10KB
 
+/**
+ * JSON-RPC error payload of a failed tools/call
+ */
+export interface ErrorResponse {
+  code: number;
+  message: string;
+  data?: unknown;
+}
+
 /**
  * Error type to MCP ErrorCode mapping configuration
  */
@@ -38,6 +47,16 @@ const ERROR_TYPE_MAPPINGS = [
   { type: TimeCalculationError, code: ErrorCode.InternalError, prefix: 'Time calculation error' },
 ];
 
+/**
+ * Message prefixes of expected errors, as McpError would build them
+ */
+const EXPECTED_ERROR_TEMPLATES = ERROR_TYPE_MAPPINGS.map(({ type, code, prefix }) => ({
+  type,
+  code,
+  messagePrefix: `MCP error ${code}: ${prefix}: `,
+}));
+const GENERIC_EXPECTED_PREFIX = `MCP error ${ErrorCode.InvalidParams}: `;
+
 /**
  * Safely extracts error message from unknown error type
  */
@@ -244,3 +263,24 @@ export function mapToMcpError(error: unknown, toolName: string): McpError {
     errorDetails
   );
 }
+
+/**
+ * Maps an error straight to the payload of a tools/call error response
+ *
+ * Expected errors (our classes with a 4xx status) are filled into
+ * precomputed templates, giving the same payload mapToMcpError would
+ * without constructing an McpError and capturing its stack. Anything
+ * else goes through mapToMcpError.
+ */
+export function toErrorResponse(error: unknown, toolName: string): ErrorResponse {
+  if (error instanceof BaseError && error.status >= 400 && error.status < 500) {
+    const data = extractErrorDetails(error);
+    const template = EXPECTED_ERROR_TEMPLATES.find(({ type }) => error instanceof type);
+    return template
+      ? { code: template.code, message: template.messagePrefix + error.message, data }
+      : { code: ErrorCode.InvalidParams, message: GENERIC_EXPECTED_PREFIX + error.message, data };
+  }
+
+  const mcpError = error instanceof McpError ? error : mapToMcpError(error, toolName);
+  return { code: mcpError.code, message: mcpError.message, data: mcpError.data };
+}
@@ -0,0 +1,66 @@
+/**
+ * Pre-serialized responses for static results
+ *
+ * Some clients send tools/list on every turn, and the SDK serializes the
+ * whole tool list again each time. Results registered here are serialized
+ * once; TemplatedStdioTransport then writes the stored JSON with only the
+ * JSON-RPC id spliced in.
+ *
+ * Results are matched by identity, so a handler must return the very
+ * object it registered. Registered results must not be modified.
+ */
+
+import type { Readable, Writable } from 'stream';
+
+import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
+import type { JSONRPCMessage } from '@modelcontextprotocol/sdk/types.js';
+
+const templates = new WeakMap<object, string>();
+
+/**
+ * Serialize a static result once and return it for the handler to reuse
+ */
+export function preserializeResult<T extends object>(result: T): T {
+  templates.set(result, JSON.stringify(result));
+  return result;
+}
+
+/**
+ * Wire form of a response whose result was pre-serialized, or undefined
+ */
+export function serializeTemplated(message: JSONRPCMessage): string | undefined {
+  const { id, result } = message as { id?: string | number; result?: unknown };
+  if (id === undefined || typeof result !== 'object' || result === null) {
+    return undefined;
+  }
+  const template = templates.get(result);
+  return template === undefined
+    ? undefined
+    : `{"jsonrpc":"2.0","id":${JSON.stringify(id)},"result":${template}}\n`;
+}
+
+/**
+ * Stdio transport that writes pre-serialized results directly
+ */
+export class TemplatedStdioTransport extends StdioServerTransport {
+  private readonly output: Writable;
+
+  constructor(input: Readable = process.stdin, output: Writable = process.stdout) {
+    super(input, output);
+    this.output = output;
+  }
+
+  override send(message: JSONRPCMessage): Promise<void> {
+    const text = serializeTemplated(message);
+    if (text === undefined) {
+      return super.send(message);
+    }
+    return new Promise((resolve) => {
+      if (this.output.write(text)) {
+        resolve();
+      } else {
+        this.output.once('drain', resolve);
+      }
+    });
+  }
+}
@@ -0,0 +1,127 @@
+import { hashCacheKey } from './cacheKeyHash';
+
+/**
+ * Cache key strategies
+ *
+ * - sha256: SHA-256 hex digest of the raw key (default, unchanged behavior)
+ * - fast:   64-bit non-cryptographic hash for short keys; the raw key is
+ *           stored with the value and compared on every hit, so collisions
+ *           become misses
+ * - raw:    the raw key itself for short keys
+ *
+ * Keys longer than SHORT_KEY_MAX_LENGTH always use SHA-256: past ~200 chars
+ * the native digest beats a JS hash loop (see tests/performance).
+ *
+ * Selected with the CACHE_KEY_STRATEGY environment variable.
+ */
+export type CacheKeyStrategy = 'sha256' | 'fast' | 'raw';
+
+export interface ResolvedCacheKey {
+  /** Key used in the underlying cache */
+  storageKey: string;
+  /** Whether the stored entry carries the raw key and must be verified */
+  verify: boolean;
+}
+
+/** Keys up to this length use the configured fast path */
+export const SHORT_KEY_MAX_LENGTH = 128;
+
+const STRATEGIES: readonly CacheKeyStrategy[] = ['sha256', 'fast', 'raw'];
+
+let cachedStrategy: CacheKeyStrategy | null = null;
+
+/**
+ * Get the configured key strategy (read once from CACHE_KEY_STRATEGY)
+ */
+export function getCacheKeyStrategy(): CacheKeyStrategy {
+  if (cachedStrategy) {
+    return cachedStrategy;
+  }
+  const env = process.env.CACHE_KEY_STRATEGY?.toLowerCase();
+  cachedStrategy = STRATEGIES.find((s) => s === env) ?? 'sha256';
+  return cachedStrategy;
+}
+
+/**
+ * Reset the strategy cache (mainly for testing)
+ */
+export function resetCacheKeyStrategy(): void {
+  cachedStrategy = null;
+}
+
+/**
+ * 64-bit non-cryptographic hash (two 32-bit multiply-xor lanes with a
+ * final avalanche, cyrb53-style)
+ *
+ * Returned as four UTF-16 code units rather than hex - formatting the
+ * number as hex costs more than hashing a short key.
+ */
+export function fastHashCacheKey(key: string): string {
+  let h1 = 0xdeadbeef;
+  let h2 = 0x41c6ce57;
+  for (let i = 0; i < key.length; i++) {
+    const ch = key.charCodeAt(i);
+    h1 = Math.imul(h1 ^ ch, 2654435761);
+    h2 = Math.imul(h2 ^ ch, 1597334677);
+  }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return String.fromCharCode(h1 & 0xffff, h1 >>> 16, h2 & 0xffff, h2 >>> 16);
+}
+
+/**
+ * Map a raw cache key to the key stored in the cache
+ *
+ * Hashed and raw keys get distinct prefixes under the non-default
+ * strategies so a raw key can never equal another key's hash.
+ *
+ * @param rawKey - Raw cache key as built by the tool
+ * @param strategy - Strategy to use (defaults to the configured one)
+ */
+export function resolveCacheKey(
+  rawKey: string,
+  strategy: CacheKeyStrategy = getCacheKeyStrategy()
+): ResolvedCacheKey {
+  if (strategy === 'sha256' || rawKey.length > SHORT_KEY_MAX_LENGTH) {
+    return { storageKey: hashCacheKey(rawKey), verify: false };
+  }
+  if (strategy === 'raw') {
+    return { storageKey: `r:${rawKey}`, verify: false };
+  }
+  return { storageKey: `h:${fastHashCacheKey(rawKey)}`, verify: true };
+}
+
+interface KeyedEntry {
+  key: string;
+  value: unknown;
+}
+
+/**
+ * Prepare a value for storage under a resolved key
+ *
+ * Entries that need verification carry their raw key alongside the value.
+ */
+export function wrapCacheEntry(
+  resolved: ResolvedCacheKey,
+  rawKey: string,
+  value: unknown
+): unknown {
+  return resolved.verify ? { key: rawKey, value } : value;
+}
+
+/**
+ * Unpack a stored entry, treating a raw key mismatch (hash collision) as a miss
+ *
+ * @returns The cached value, or undefined on miss or collision
+ */
+export function unwrapCacheEntry<T>(
+  resolved: ResolvedCacheKey,
+  rawKey: string,
+  stored: unknown
+): T | undefined {
+  if (!resolved.verify || stored === undefined) {
+    return stored as T | undefined;
+  }
+  const entry = stored as KeyedEntry;
+  return entry.key === rawKey ? (entry.value as T) : undefined;
+}
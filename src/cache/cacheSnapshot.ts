@@ -0,0 +1,247 @@
+/**
+ * Persistent cache snapshot for warm restarts
+ *
+ * MCP clients restart the server often, and each restart used to throw away
+ * hour- and day-long calculation entries. When CACHE_SNAPSHOT_PATH is set,
+ * long-lived entries are written to an NDJSON file periodically and on
+ * shutdown, and read back in the background when the next process starts.
+ *
+ * Format (one JSON document per line):
+ *   {"tag":"<snapshot tag>"}
+ *   {"k":"<storage key>","e":<expiry, epoch ms>,"v":<value>}
+ *
+ * The tag covers the snapshot format, the build (package version, git
+ * revision, build number) and the cache key strategy. A snapshot written by
+ * any other build is ignored as a whole, since result shapes or storage keys
+ * may differ. Builds without a stamped revision and build number (no
+ * version.json) can't be told apart, so they don't use snapshots at all.
+ */
+
+import * as fs from 'fs';
+
+import { BUILD_INFO } from '../utils/buildInfo';
+import { debug } from '../utils/debug';
+
+import { getCacheKeyStrategy } from './cacheKeyStrategy';
+import type { MemoryAwareCache } from './memoryAwareCache';
+import { cache } from './timeCache';
+
+const SNAPSHOT_FORMAT = 1;
+
+/** Entries with less time left than this aren't worth persisting */
+export const MIN_SNAPSHOT_TTL_MS = 60_000;
+
+const DEFAULT_INTERVAL_SECONDS = 300;
+
+interface SnapshotLine {
+  k: string;
+  e: number;
+  v: unknown;
+}
+
+/**
+ * Tag identifying which build wrote a snapshot, or undefined if the build
+ * is not identifiable
+ */
+export function getSnapshotTag(): string | undefined {
+  const { version, revision, buildNumber } = BUILD_INFO;
+  if (revision === 'unknown' || buildNumber === undefined) {
+    return undefined;
+  }
+  return [SNAPSHOT_FORMAT, version, revision, buildNumber, getCacheKeyStrategy()].join(':');
+}
+
+/**
+ * Serialize entries that will still be valid for a while
+ *
+ * @returns NDJSON text and the number of entries it holds
+ */
+export function serializeSnapshot(
+  source: MemoryAwareCache,
+  tag: string,
+  now: number = Date.now()
+): { text: string; count: number } {
+  const lines = [JSON.stringify({ tag })];
+  for (const { key, value, expiresAt } of source.entries()) {
+    // Entries that never expire (0) could outlive their correctness on disk
+    if (expiresAt - now < MIN_SNAPSHOT_TTL_MS) {
+      continue;
+    }
+    const line: SnapshotLine = { k: key, e: expiresAt, v: value };
+    lines.push(JSON.stringify(line));
+  }
+  return { text: lines.join('\n') + '\n', count: lines.length - 1 };
+}
+
+/**
+ * Load entries from snapshot text, keeping their absolute expiry
+ *
+ * Entries already in the cache are left alone (they are at least as
+ * fresh). Malformed lines are skipped.
+ *
+ * @returns Number of entries restored (0 if the tag doesn't match)
+ */
+export function restoreSnapshot(
+  target: MemoryAwareCache,
+  text: string,
+  tag: string,
+  now: number = Date.now()
+): number {
+  const lines = text.split('\n');
+  try {
+    if ((JSON.parse(lines[0]) as { tag?: string }).tag !== tag) {
+      debug.cache('Cache snapshot ignored: written by a different build');
+      return 0;
+    }
+  } catch {
+    return 0;
+  }
+
+  let restored = 0;
+  for (let i = 1; i < lines.length; i++) {
+    const entry = parseLine(lines[i]);
+    if (!entry || entry.e <= now || target.has(entry.k)) {
+      continue;
+    }
+    if (target.set(entry.k, entry.v, (entry.e - now) / 1000)) {
+      restored++;
+    }
+  }
+  return restored;
+}
+
+function parseLine(line: string): SnapshotLine | null {
+  if (!line) {
+    return null;
+  }
+  try {
+    const entry = JSON.parse(line) as SnapshotLine;
+    return typeof entry.k === 'string' && typeof entry.e === 'number' && entry.v !== undefined
+      ? entry
+      : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Write a snapshot, replacing the file atomically
+ *
+ * Synchronous so it can run from an 'exit' handler.
+ */
+export function saveSnapshotSync(source: MemoryAwareCache, filePath: string): number {
+  const tag = getSnapshotTag();
+  if (tag === undefined) {
+    return 0;
+  }
+  const { text, count } = serializeSnapshot(source, tag);
+  const tmpPath = `${filePath}.tmp`;
+  // eslint-disable-next-line security/detect-non-literal-fs-filename -- Operator-configured path
+  fs.writeFileSync(tmpPath, text);
+  // eslint-disable-next-line security/detect-non-literal-fs-filename -- Operator-configured path
+  fs.renameSync(tmpPath, filePath);
+  debug.cache('Cache snapshot saved: %d entries to %s', count, filePath);
+  return count;
+}
+
+/**
+ * Write a snapshot without blocking the event loop on I/O
+ */
+export async function saveSnapshot(source: MemoryAwareCache, filePath: string): Promise<number> {
+  const tag = getSnapshotTag();
+  if (tag === undefined) {
+    return 0;
+  }
+  const { text, count } = serializeSnapshot(source, tag);
+  const tmpPath = `${filePath}.tmp`;
+  // eslint-disable-next-line security/detect-non-literal-fs-filename -- Operator-configured path
+  await fs.promises.writeFile(tmpPath, text);
+  // eslint-disable-next-line security/detect-non-literal-fs-filename -- Operator-configured path
+  await fs.promises.rename(tmpPath, filePath);
+  debug.cache('Cache snapshot saved: %d entries to %s', count, filePath);
+  return count;
+}
+
+/**
+ * Read a snapshot into the cache (a missing file is not an error)
+ */
+export async function loadSnapshot(target: MemoryAwareCache, filePath: string): Promise<number> {
+  const tag = getSnapshotTag();
+  if (tag === undefined) {
+    return 0;
+  }
+  let text: string;
+  try {
+    // eslint-disable-next-line security/detect-non-literal-fs-filename -- Operator-configured path
+    text = await fs.promises.readFile(filePath, 'utf8');
+  } catch {
+    debug.cache('No cache snapshot at %s', filePath);
+    return 0;
+  }
+  const restored = restoreSnapshot(target, text, tag);
+  debug.cache('Cache snapshot loaded: %d entries from %s', restored, filePath);
+  return restored;
+}
+
+function getSnapshotInterval(): number {
+  const parsed = parseInt(process.env.CACHE_SNAPSHOT_INTERVAL ?? '', 10);
+  return !isNaN(parsed) && parsed > 0 ? parsed : DEFAULT_INTERVAL_SECONDS;
+}
+
+/**
+ * Start warm-restart snapshots if CACHE_SNAPSHOT_PATH is set and the build
+ * is identifiable
+ *
+ * Loads the previous snapshot in the background, then saves every
+ * CACHE_SNAPSHOT_INTERVAL seconds (default 300) and on exit. SIGINT and
+ * SIGTERM are re-raised after saving so the exit status is unchanged.
+ *
+ * @returns Function that stops the snapshots (no-op when disabled)
+ */
+export function startCacheSnapshots(
+  target: MemoryAwareCache = cache,
+  filePath: string | undefined = process.env.CACHE_SNAPSHOT_PATH
+): () => void {
+  if (!filePath) {
+    return () => undefined;
+  }
+  if (getSnapshotTag() === undefined) {
+    debug.cache('Cache snapshots disabled: build has no revision or build number');
+    return () => undefined;
+  }
+
+  loadSnapshot(target, filePath).catch((error: unknown) => {
+    debug.error('Cache snapshot load failed: %O', error);
+  });
+
+  const timer = setInterval(() => {
+    saveSnapshot(target, filePath).catch((error: unknown) => {
+      debug.error('Cache snapshot save failed: %O', error);
+    });
+  }, getSnapshotInterval() * 1000);
+  timer.unref();
+
+  const onExit = (): void => {
+    try {
+      saveSnapshotSync(target, filePath);
+    } catch (error) {
+      debug.error('Cache snapshot save failed: %O', error);
+    }
+  };
+  const onSignal = (signal: NodeJS.Signals): void => {
+    stop();
+    onExit();
+    process.kill(process.pid, signal);
+  };
+  const stop = (): void => {
+    clearInterval(timer);
+    process.off('exit', onExit);
+    process.off('SIGINT', onSignal);
+    process.off('SIGTERM', onSignal);
+  };
+
+  process.on('exit', onExit);
+  process.once('SIGINT', onSignal);
+  process.once('SIGTERM', onSignal);
+  return stop;
+}
@@ -0,0 +1,128 @@
+/**
+ * Expiry index for cache entries
+ *
+ * NodeCache finds expired entries by walking every key on each
+ * `checkperiod` tick, so the cost of a sweep grows with the cache, not with
+ * the number of entries that actually expired. This binary min-heap keyed
+ * by deadline lets a sweep touch only the expired entries: O(1) to see that
+ * nothing is due, O(k log n) to collect k expired keys.
+ *
+ * Rescheduling or cancelling a key doesn't search the heap. The current
+ * deadline per key lives in a Map and stale heap nodes are skipped when
+ * they surface. The heap is rebuilt once stale nodes outnumber live ones.
+ */
+/* eslint-disable security/detect-object-injection -- heap indices are numeric */
+
+interface HeapNode {
+  deadline: number;
+  key: string;
+}
+
+// Rebuild once the heap holds this many more nodes than twice the live keys
+const COMPACT_SLACK = 64;
+
+export class ExpiryHeap {
+  private heap: HeapNode[] = [];
+  private deadlines: Map<string, number> = new Map();
+
+  /** Number of keys with a pending deadline */
+  get size(): number {
+    return this.deadlines.size;
+  }
+
+  /**
+   * Set (or replace) the deadline of a key
+   *
+   * @param key - Cache key
+   * @param deadline - Epoch milliseconds after which the key is expired
+   */
+  schedule(key: string, deadline: number): void {
+    if (this.deadlines.get(key) === deadline) {
+      return;
+    }
+    this.deadlines.set(key, deadline);
+    this.push({ deadline, key });
+    if (this.heap.length > this.deadlines.size * 2 + COMPACT_SLACK) {
+      this.compact();
+    }
+  }
+
+  /** Forget a key's deadline (deleted, or no longer expires) */
+  cancel(key: string): void {
+    this.deadlines.delete(key);
+  }
+
+  /**
+   * Remove and return every key whose deadline is before `now`
+   * (same rule as NodeCache: expired once the deadline has passed)
+   */
+  popExpired(now: number): string[] {
+    const expired: string[] = [];
+    while (this.heap.length > 0 && this.heap[0].deadline < now) {
+      const node = this.pop();
+      // Skip nodes superseded by a later schedule() or cancel()
+      if (this.deadlines.get(node.key) === node.deadline) {
+        this.deadlines.delete(node.key);
+        expired.push(node.key);
+      }
+    }
+    return expired;
+  }
+
+  clear(): void {
+    this.heap = [];
+    this.deadlines.clear();
+  }
+
+  private compact(): void {
+    this.heap = Array.from(this.deadlines, ([key, deadline]) => ({ deadline, key }));
+    for (let i = (this.heap.length >> 1) - 1; i >= 0; i--) {
+      this.siftDown(i);
+    }
+  }
+
+  private push(node: HeapNode): void {
+    this.heap.push(node);
+    let i = this.heap.length - 1;
+    while (i > 0) {
+      const parent = (i - 1) >> 1;
+      if (this.heap[parent].deadline <= node.deadline) {
+        break;
+      }
+      this.heap[i] = this.heap[parent];
+      i = parent;
+    }
+    this.heap[i] = node;
+  }
+
+  private pop(): HeapNode {
+    const top = this.heap[0];
+    const last = this.heap.pop() as HeapNode;
+    if (this.heap.length > 0) {
+      this.heap[0] = last;
+      this.siftDown(0);
+    }
+    return top;
+  }
+
+  private siftDown(start: number): void {
+    const node = this.heap[start];
+    const length = this.heap.length;
+    let i = start;
+    for (;;) {
+      let child = 2 * i + 1;
+      if (child >= length) {
+        break;
+      }
+      if (child + 1 < length && this.heap[child + 1].deadline < this.heap[child].deadline) {
+        child++;
+      }
+      if (this.heap[child].deadline >= node.deadline) {
+        break;
+      }
+      this.heap[i] = this.heap[child];
+      i = child;
+    }
+    this.heap[i] = node;
+  }
+}
@@ -3,6 +3,9 @@ import { EventEmitter } from 'events';
 import NodeCache from 'node-cache';
 import type { Options } from 'node-cache';
 
+import { ExpiryHeap } from './expiryHeap';
+import { EXPIRY_OVERHEAD, estimateEntrySize } from './sizeEstimator';
+
 interface MemoryAwareCacheOptions extends Options {
   maxMemory?: number; // Maximum memory in bytes (default: 10MB)
   evictOnFull?: boolean; // Evict oldest entries when full (default: false)
@@ -25,10 +28,14 @@ interface CacheEntry {
 export class MemoryAwareCache extends EventEmitter {
   private cache: NodeCache;
   private maxMemory: number;
+  private stdTTL: number;
   private usedMemory: number = 0;
   private evictOnFull: boolean;
   private entrySizes: Map<string, number> = new Map();
-  private entryOrder: CacheEntry[] = [];
+  // Insertion-ordered: re-setting a key moves it to the end, so iteration is oldest first
+  private entryOrder: Map<string, CacheEntry> = new Map();
+  private expiry = new ExpiryHeap();
+  private sweepTimer: NodeJS.Timeout | null = null;
   private hits: number = 0;
   private misses: number = 0;
 
@@ -37,11 +44,13 @@ export class MemoryAwareCache extends EventEmitter {
 
     this.maxMemory = options.maxMemory ?? 10 * 1024 * 1024; // 10MB default
     this.evictOnFull = options.evictOnFull ?? false;
+    this.stdTTL = options.stdTTL ?? 60;
 
-    // Create underlying NodeCache
+    // Create underlying NodeCache. Its own checkperiod walks every key, so
+    // it is disabled and expired entries are found through the expiry heap.
     this.cache = new NodeCache({
-      stdTTL: options.stdTTL ?? 60,
-      checkperiod: options.checkperiod ?? 120,
+      stdTTL: this.stdTTL,
+      checkperiod: 0,
       useClones: options.useClones ?? true,
       deleteOnExpire: options.deleteOnExpire ?? true,
       enableLegacyCallbacks: options.enableLegacyCallbacks ?? false,
@@ -56,14 +65,37 @@ export class MemoryAwareCache extends EventEmitter {
     this.cache.on('expired', (key: string) => {
       this.updateMemoryOnDelete(key);
     });
+
+    // Sweep cost is O(expired), so sweeps can run often without latency spikes
+    const checkperiod = options.checkperiod ?? 120;
+    if (checkperiod > 0) {
+      this.sweepTimer = setInterval(() => this.sweepExpired(), checkperiod * 1000);
+      this.sweepTimer.unref();
+    }
+  }
+
+  /**
+   * Delete entries whose deadline has passed, touching only those entries
+   */
+  sweepExpired(): number {
+    const expired = this.expiry.popExpired(Date.now());
+    return expired.length > 0 ? this.cache.del(expired) : 0;
+  }
+
+  private trackExpiry(key: string): void {
+    // NodeCache's own deadline: 0 means the entry never expires
+    const deadline = this.cache.getTtl(key);
+    if (deadline) {
+      this.expiry.schedule(key, deadline);
+    } else {
+      this.expiry.cancel(key);
+    }
   }
 
-  private calculateSize(key: string, value: unknown): number {
-    // Use JSON.stringify as a consistent measure
-    // Add overhead for object structure (based on research)
-    const jsonSize = JSON.stringify({ [key]: value }).length;
-    // Add ~30% overhead for JavaScript object representation (based on research)
-    return Math.ceil(jsonSize * 1.3);
+  private calculateSize(key: string, value: unknown, ttl: number | undefined): number {
+    // Structural walk modelling V8 heap layout - no serialization on the write path
+    const expires = (ttl ?? this.stdTTL) > 0;
+    return estimateEntrySize(key, value) + (expires ? EXPIRY_OVERHEAD : 0);
   }
 
   private updateMemoryOnDelete(key: string): void {
@@ -71,8 +103,9 @@ export class MemoryAwareCache extends EventEmitter {
     if (size) {
       this.usedMemory -= size;
       this.entrySizes.delete(key);
-      this.entryOrder = this.entryOrder.filter((entry) => entry.key !== key);
+      this.entryOrder.delete(key);
     }
+    this.expiry.cancel(key);
   }
 
   private checkMemoryWarning(): void {
@@ -91,7 +124,7 @@ export class MemoryAwareCache extends EventEmitter {
     const toEvict: string[] = [];
 
     // Find entries to evict (oldest first)
-    for (const entry of this.entryOrder) {
+    for (const entry of this.entryOrder.values()) {
       toEvict.push(entry.key);
       freedSpace += entry.size;
       if (freedSpace >= requiredSpace) {
@@ -108,7 +141,7 @@ export class MemoryAwareCache extends EventEmitter {
   }
 
   set(key: string, value: unknown, ttl?: number): boolean {
-    const size = this.calculateSize(key, value);
+    const size = this.calculateSize(key, value, ttl);
     const existingSize = this.entrySizes.get(key) ?? 0;
     const netSize = size - existingSize;
 
@@ -127,10 +160,11 @@ export class MemoryAwareCache extends EventEmitter {
       // Update memory tracking
       this.usedMemory += netSize;
       this.entrySizes.set(key, size);
+      this.trackExpiry(key);
 
       // Update order tracking
-      this.entryOrder = this.entryOrder.filter((entry) => entry.key !== key);
-      this.entryOrder.push({ key, size, timestamp: Date.now() });
+      this.entryOrder.delete(key);
+      this.entryOrder.set(key, { key, size, timestamp: Date.now() });
 
       // Check for memory warning
       this.checkMemoryWarning();
@@ -161,10 +195,15 @@ export class MemoryAwareCache extends EventEmitter {
     this.cache.flushAll();
     this.usedMemory = 0;
     this.entrySizes.clear();
-    this.entryOrder = [];
+    this.entryOrder.clear();
+    this.expiry.clear();
   }
 
   close(): void {
+    if (this.sweepTimer) {
+      clearInterval(this.sweepTimer);
+      this.sweepTimer = null;
+    }
     this.cache.close();
   }
 
@@ -201,8 +240,8 @@ export class MemoryAwareCache extends EventEmitter {
     let totalSize = 0;
     const sizes: Map<string, number> = new Map();
 
-    for (const { key, val } of values) {
-      const size = this.calculateSize(key, val);
+    for (const { key, val, ttl } of values) {
+      const size = this.calculateSize(key, val, ttl);
       sizes.set(key, size);
       const existingSize = this.entrySizes.get(key) ?? 0;
       totalSize += size - existingSize;
@@ -223,9 +262,10 @@ export class MemoryAwareCache extends EventEmitter {
         const existingSize = this.entrySizes.get(key) ?? 0;
         this.usedMemory += size - existingSize;
         this.entrySizes.set(key, size);
+        this.trackExpiry(key);
 
-        this.entryOrder = this.entryOrder.filter((entry) => entry.key !== key);
-        this.entryOrder.push({ key, size, timestamp: Date.now() });
+        this.entryOrder.delete(key);
+        this.entryOrder.set(key, { key, size, timestamp: Date.now() });
       });
 
       this.checkMemoryWarning();
@@ -239,16 +279,31 @@ export class MemoryAwareCache extends EventEmitter {
   }
 
   ttl(key: string, ttl?: number): boolean {
-    if (ttl !== undefined) {
-      return this.cache.ttl(key, ttl);
+    const result = ttl !== undefined ? this.cache.ttl(key, ttl) : this.cache.ttl(key);
+    if (result) {
+      this.trackExpiry(key);
     }
-    return this.cache.ttl(key);
+    return result;
   }
 
   getTtl(key: string): number | undefined {
     return this.cache.getTtl(key);
   }
 
+  /**
+   * Live entries with their absolute expiry (epoch ms, 0 = never expires).
+   * Reads NodeCache's store directly: no hit/miss stats, no clones. Values
+   * are the stored objects and must not be modified.
+   */
+  *entries(): Generator<{ key: string; value: unknown; expiresAt: number }> {
+    const now = Date.now();
+    for (const [key, { t: expiresAt, v: value }] of Object.entries(this.cache.data)) {
+      if ((expiresAt === 0 || expiresAt > now) && value !== undefined) {
+        yield { key, value, expiresAt };
+      }
+    }
+  }
+
   getStats(): NodeCache.Stats {
     return this.cache.getStats();
   }
@@ -0,0 +1,59 @@
+import { resolveCacheKey, unwrapCacheEntry, wrapCacheEntry } from './cacheKeyStrategy';
+import { MemoryAwareCache } from './memoryAwareCache';
+import type { MemoryStats } from './memoryAwareCache';
+
+/**
+ * Cache of serialized tool responses (the `content[0].text` payload)
+ *
+ * Sits in front of the per-tool result cache: a hit skips the tool, the
+ * NodeCache clone and JSON.stringify, and goes straight to the transport.
+ * Entries are only stored with the remaining lifetime of the result entries
+ * they were built from, so they never serve anything the result cache
+ * wouldn't have served.
+ */
+export const responseCache = new MemoryAwareCache({
+  maxMemory: 5 * 1024 * 1024, // 5MB limit
+  stdTTL: 60,
+  checkperiod: 1, // Expiry sweep - O(expired) per tick
+  useClones: false, // Strings are immutable - nothing to clone
+  evictOnFull: true,
+});
+
+/**
+ * Build the response cache key for a tool call
+ *
+ * @param toolName - Name of the tool
+ * @param args - Raw arguments from the request
+ * @returns Raw key (hashed per CACHE_KEY_STRATEGY on lookup)
+ */
+export function getResponseKey(toolName: string, args: unknown): string {
+  return `${toolName}:${JSON.stringify(args ?? {})}`;
+}
+
+/**
+ * Get a cached serialized response
+ */
+export function getCachedResponse(key: string): string | undefined {
+  const resolved = resolveCacheKey(key);
+  return unwrapCacheEntry<string>(resolved, key, responseCache.get(resolved.storageKey));
+}
+
+/**
+ * Store a serialized response until the given expiry timestamp (ms)
+ *
+ * @returns true if stored
+ */
+export function setCachedResponse(key: string, text: string, expiresAt: number): boolean {
+  const ttlSeconds = (expiresAt - Date.now()) / 1000;
+  // NodeCache treats 0 as "forever", so anything already due is skipped
+  if (ttlSeconds <= 0) {
+    return false;
+  }
+  const resolved = resolveCacheKey(key);
+  return responseCache.set(resolved.storageKey, wrapCacheEntry(resolved, key, text), ttlSeconds);
+}
+
+// Export memory stats for monitoring
+export function getResponseCacheMemoryStats(): MemoryStats {
+  return responseCache.getMemoryStats();
+}
@@ -0,0 +1,142 @@
+/**
+ * Heap size estimator for cache entries
+ *
+ * Replaces the old `JSON.stringify(...).length * 1.3` approximation with a
+ * structural walk that models how V8 actually lays out our result objects
+ * (64-bit heap, no pointer compression). No serialization happens, so the
+ * write path no longer pays for a full stringify just to estimate size.
+ *
+ * Model (bytes):
+ * - Sequential string: 16 header + 1 per Latin-1 char (2 if any char > 0xFF), 8-aligned
+ * - Heap number (non-Smi number): 16
+ * - Plain object: 24 header + 8 per in-object property slot
+ * - Array: 32 header + 16 backing store header + 8 per element
+ * - booleans, null, undefined, small integers: 0 (shared oddballs / Smis)
+ *
+ * Property names are not counted: V8 internalizes them and shares them across
+ * every object with the same shape, which is what made the JSON measure drift
+ * away from real heap use.
+ */
+
+const POINTER_SIZE = 8;
+const STRING_HEADER = 16;
+const HEAP_NUMBER_SIZE = 16;
+const OBJECT_HEADER = 24;
+const ARRAY_HEADER = 32;
+const FIXED_ARRAY_HEADER = 16;
+const MAX_DEPTH = 32;
+
+// Smi range on 64-bit builds without pointer compression (32-bit payload).
+// Unix timestamps in seconds fit, so they cost nothing beyond their slot.
+const SMI_MIN = -(2 ** 31);
+const SMI_MAX = 2 ** 31 - 1;
+
+/**
+ * Fixed cost of everything a single cache entry drags along besides its
+ * value: the NodeCache `{ t, v }` record and its timestamp, the dictionary
+ * slot in NodeCache's data store, our `entrySizes` Map slot and the
+ * `{ key, size, timestamp }` record (plus its Map slot) used for eviction
+ * ordering.
+ * Measured from v8.getHeapStatistics() deltas, like the value sizes that
+ * sizeEstimator.test.ts checks against the heap.
+ */
+export const ENTRY_OVERHEAD = 224;
+
+/**
+ * Extra cost of an entry that expires: its `{ deadline, key }` node and
+ * array slot in the expiry heap, and its slot in the deadline Map
+ */
+export const EXPIRY_OVERHEAD = 120;
+
+function align(size: number): number {
+  return Math.ceil(size / POINTER_SIZE) * POINTER_SIZE;
+}
+
+/**
+ * Estimate heap bytes used by a string
+ */
+export function estimateStringSize(str: string): number {
+  let bytesPerChar = 1;
+  for (let i = 0; i < str.length; i++) {
+    if (str.charCodeAt(i) > 0xff) {
+      bytesPerChar = 2;
+      break;
+    }
+  }
+  return align(STRING_HEADER + str.length * bytesPerChar);
+}
+
+function estimateNumberSize(num: number): number {
+  return Number.isInteger(num) && num >= SMI_MIN && num <= SMI_MAX ? 0 : HEAP_NUMBER_SIZE;
+}
+
+function estimatePrimitive(value: unknown): number {
+  switch (typeof value) {
+    case 'string':
+      return estimateStringSize(value);
+    case 'number':
+      return estimateNumberSize(value);
+    case 'bigint':
+      return align(STRING_HEADER + Math.ceil(value.toString(16).length / 2));
+    default:
+      // boolean, undefined, symbol, function - shared or not cached
+      return 0;
+  }
+}
+
+function estimateObject(value: object, depth: number): number {
+  if (Array.isArray(value)) {
+    let size = ARRAY_HEADER + FIXED_ARRAY_HEADER + value.length * POINTER_SIZE;
+    for (const item of value as unknown[]) {
+      size += estimate(item, depth + 1);
+    }
+    return size;
+  }
+
+  if (value instanceof Date) {
+    return OBJECT_HEADER + HEAP_NUMBER_SIZE;
+  }
+
+  let propertyCount = 0;
+  let size = 0;
+  const record = value as Record<string, unknown>;
+  for (const key in record) {
+    if (Object.prototype.hasOwnProperty.call(record, key)) {
+      propertyCount++;
+      // eslint-disable-next-line security/detect-object-injection -- iterating own keys
+      size += estimate(record[key], depth + 1);
+    }
+  }
+  return size + OBJECT_HEADER + propertyCount * POINTER_SIZE;
+}
+
+function estimate(value: unknown, depth: number): number {
+  if (typeof value !== 'object') {
+    return estimatePrimitive(value);
+  }
+  if (value === null || depth > MAX_DEPTH) {
+    return 0;
+  }
+  return estimateObject(value, depth);
+}
+
+/**
+ * Estimate the heap bytes retained by a value
+ *
+ * @param value - Any JSON-like value (tool results, primitives, arrays)
+ * @returns Estimated retained size in bytes
+ */
+export function estimateSize(value: unknown): number {
+  return estimate(value, 0);
+}
+
+/**
+ * Estimate the heap bytes retained by a complete cache entry
+ *
+ * @param key - The cache key (stored once and shared by the bookkeeping structures)
+ * @param value - The cached value
+ * @returns Estimated size in bytes, including per-entry bookkeeping
+ */
+export function estimateEntrySize(key: string, value: unknown): number {
+  return ENTRY_OVERHEAD + estimateStringSize(key) + estimate(value, 0);
+}
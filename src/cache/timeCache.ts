@@ -14,7 +14,7 @@ export const CacheTTL = {
 export const cache = new MemoryAwareCache({
   maxMemory: 10 * 1024 * 1024, // 10MB limit
   stdTTL: 60, // Default 60 seconds
-  checkperiod: 120, // Check for expired keys every 2 minutes
+  checkperiod: 1, // Expiry sweep - O(expired) per tick
   evictOnFull: true, // Enable eviction when memory limit reached
 });
 
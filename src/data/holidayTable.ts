@@ -0,0 +1,193 @@
+/**
+ * Compiled holiday tables
+ *
+ * The holiday rules (fixed, floating and Easter-based dates plus the
+ * observance rules) are evaluated once at build time for a span of years
+ * and written to dist/data/holidays.bin by scripts/compile-holidays.js.
+ * At startup the file is mapped into typed arrays as-is; only the short
+ * metadata header is JSON. Years or countries outside the table fall back
+ * to rule evaluation.
+ *
+ * Layout (native byte order - a table from a machine with the other byte
+ * order fails the magic check and is ignored):
+ *   Uint32 magic, Uint32 format, Uint32 header length in bytes
+ *   JSON header {firstYear, lastYear, countries, names}, padded to 4 bytes
+ *   Uint32 record offsets, one per (country, year) plus an end marker
+ *   Int16 records: [actual day, observed day, name id], days relative to Jan 1
+ */
+
+import * as fs from 'fs';
+
+import { debug } from '../utils/debug';
+
+import type { CalculatedHoliday } from './holidays';
+
+export const HOLIDAY_TABLE_FILE = 'holidays.bin';
+export const DEFAULT_TABLE_FIRST_YEAR = 1970;
+export const DEFAULT_TABLE_LAST_YEAR = 2200;
+
+const TABLE_MAGIC = 0x544c4f48; // "HOLT"
+const TABLE_FORMAT = 1;
+const PREAMBLE_BYTES = 12;
+const RECORD_FIELDS = 3;
+const NO_OBSERVED = -32768;
+const DAY_MS = 86_400_000;
+
+interface TableHeader {
+  firstYear: number;
+  lastYear: number;
+  countries: string[];
+  names: string[];
+}
+
+export interface HolidayTable extends TableHeader {
+  countryIndex: Map<string, number>;
+  offsets: Uint32Array;
+  records: Int16Array;
+}
+
+function dayOfYear(date: Date, year: number): number {
+  const day = Date.UTC(date.getFullYear(), date.getMonth(), date.getDate());
+  return Math.round((day - Date.UTC(year, 0, 1)) / DAY_MS);
+}
+
+/**
+ * Evaluate rules for every (country, year) and pack the results
+ *
+ * @param evaluate - Rule engine, called once per country and year
+ */
+export function encodeHolidayTable(
+  countries: readonly string[],
+  firstYear: number,
+  lastYear: number,
+  evaluate: (country: string, year: number) => CalculatedHoliday[]
+): Uint8Array {
+  const names: string[] = [];
+  const nameIds = new Map<string, number>();
+  const offsets: number[] = [0];
+  const records: number[] = [];
+
+  for (const country of countries) {
+    for (let year = firstYear; year <= lastYear; year++) {
+      for (const holiday of evaluate(country, year)) {
+        let nameId = nameIds.get(holiday.name);
+        if (nameId === undefined) {
+          nameId = names.push(holiday.name) - 1;
+          nameIds.set(holiday.name, nameId);
+        }
+        const observed = holiday.observedDate
+          ? dayOfYear(holiday.observedDate, year)
+          : NO_OBSERVED;
+        records.push(dayOfYear(holiday.date, year), observed, nameId);
+      }
+      offsets.push(records.length / RECORD_FIELDS);
+    }
+  }
+
+  const header: TableHeader = { firstYear, lastYear, countries: [...countries], names };
+  const headerBytes = Buffer.from(JSON.stringify(header), 'utf8');
+  const offsetsStart = PREAMBLE_BYTES + Math.ceil(headerBytes.length / 4) * 4;
+  const recordsStart = offsetsStart + offsets.length * 4;
+  const buffer = new ArrayBuffer(recordsStart + records.length * 2);
+
+  new Uint32Array(buffer, 0, 3).set([TABLE_MAGIC, TABLE_FORMAT, headerBytes.length]);
+  new Uint8Array(buffer, PREAMBLE_BYTES).set(headerBytes);
+  new Uint32Array(buffer, offsetsStart, offsets.length).set(offsets);
+  new Int16Array(buffer, recordsStart, records.length).set(records);
+  return new Uint8Array(buffer);
+}
+
+/**
+ * View a compiled table without copying its day data
+ *
+ * @returns The table, or null if the bytes aren't a table this build can read
+ */
+export function parseHolidayTable(bytes: Uint8Array): HolidayTable | null {
+  // Typed array views need 4-byte alignment; pooled Buffers may not have it
+  const aligned = bytes.byteOffset % 4 === 0 ? bytes : new Uint8Array(bytes);
+  if (aligned.byteLength < PREAMBLE_BYTES) {
+    return null;
+  }
+  const [magic, format, headerLength] = new Uint32Array(aligned.buffer, aligned.byteOffset, 3);
+  if (magic !== TABLE_MAGIC || format !== TABLE_FORMAT) {
+    debug.holidays('Holiday table ignored: unknown magic or format');
+    return null;
+  }
+
+  try {
+    const headerEnd = PREAMBLE_BYTES + headerLength;
+    const header = JSON.parse(
+      Buffer.from(aligned.subarray(PREAMBLE_BYTES, headerEnd)).toString('utf8')
+    ) as TableHeader;
+    const slots = header.countries.length * (header.lastYear - header.firstYear + 1);
+    const offsetsStart = aligned.byteOffset + Math.ceil(headerEnd / 4) * 4;
+    const offsets = new Uint32Array(aligned.buffer, offsetsStart, slots + 1);
+    const records = new Int16Array(
+      aligned.buffer,
+      offsetsStart + offsets.byteLength,
+      offsets[slots] * RECORD_FIELDS
+    );
+    const countryIndex = new Map(header.countries.map((country, i) => [country, i]));
+    return { ...header, countryIndex, offsets, records };
+  } catch (error) {
+    debug.holidays('Holiday table ignored: %s', (error as Error).message);
+    return null;
+  }
+}
+
+/**
+ * Read a compiled table from disk (a missing file is not an error)
+ */
+export function loadHolidayTable(filePath: string): HolidayTable | null {
+  let bytes: Buffer;
+  try {
+    // eslint-disable-next-line security/detect-non-literal-fs-filename -- Path built from __dirname
+    bytes = fs.readFileSync(filePath);
+  } catch {
+    debug.holidays('No compiled holiday table at %s, using rules', filePath);
+    return null;
+  }
+  const table = parseHolidayTable(bytes);
+  if (table) {
+    debug.holidays(
+      'Loaded holiday table %d-%d for %s',
+      table.firstYear,
+      table.lastYear,
+      table.countries.join(', ')
+    );
+  }
+  return table;
+}
+
+/**
+ * Holidays for a (country, year) from a compiled table
+ *
+ * @returns The holidays, or undefined if the table doesn't cover them
+ */
+export function readCompiledHolidays(
+  table: HolidayTable,
+  country: string,
+  year: number
+): CalculatedHoliday[] | undefined {
+  const countryId = table.countryIndex.get(country);
+  if (countryId === undefined || year < table.firstYear || year > table.lastYear) {
+    return undefined;
+  }
+
+  /* eslint-disable security/detect-object-injection -- numeric indices into typed arrays */
+  const slot = countryId * (table.lastYear - table.firstYear + 1) + (year - table.firstYear);
+  const holidays: CalculatedHoliday[] = [];
+  for (let r = table.offsets[slot]; r < table.offsets[slot + 1]; r++) {
+    const base = r * RECORD_FIELDS;
+    const holiday: CalculatedHoliday = {
+      name: table.names[table.records[base + 2]],
+      date: new Date(year, 0, 1 + table.records[base]),
+    };
+    if (table.records[base + 1] !== NO_OBSERVED) {
+      holiday.observedDate = new Date(year, 0, 1 + table.records[base + 1]);
+    }
+    holidays.push(holiday);
+  }
+  /* eslint-enable security/detect-object-injection */
+  return holidays;
+}
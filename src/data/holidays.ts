@@ -1,7 +1,17 @@
+import * as path from 'path';
+
 import { getDay, addDays, lastDayOfMonth, isValid } from 'date-fns';
 
 import { debug } from '../utils/debug';
 
+import {
+  encodeHolidayTable,
+  HOLIDAY_TABLE_FILE,
+  loadHolidayTable,
+  readCompiledHolidays,
+} from './holidayTable';
+import type { HolidayTable } from './holidayTable';
+
 // Types (keeping same as original)
 export interface Holiday {
   name: string;
@@ -454,8 +464,38 @@ export function getEasterBasedHoliday(holiday: Holiday, year: number): Date {
   return result;
 }
 
+// Compiled at build time (scripts/compile-holidays.js); absent when running from src
+let holidayTable: HolidayTable | null = loadHolidayTable(path.join(__dirname, HOLIDAY_TABLE_FILE));
+
+/**
+ * Replace the compiled holiday table (mainly for testing; null uses the rules)
+ */
+export function setHolidayTable(table: HolidayTable | null): void {
+  holidayTable = table;
+  holidayIndexes.clear();
+}
+
+/**
+ * Compile every country's rules for a span of years (see holidayTable.ts)
+ */
+export function compileHolidayTable(firstYear: number, lastYear: number): Uint8Array {
+  return encodeHolidayTable(Object.keys(HOLIDAY_DATA), firstYear, lastYear, evaluateHolidayRules);
+}
+
 export function getHolidaysForYear(country: string, year: number): CalculatedHoliday[] {
   debug.holidays('getHolidaysForYear called for %s in %d', country, year);
+  const compiled = holidayTable && readCompiledHolidays(holidayTable, country, year);
+  if (compiled) {
+    debug.holidays('Found %d compiled holidays for %s in %d', compiled.length, country, year);
+    return compiled;
+  }
+  return evaluateHolidayRules(country, year);
+}
+
+/**
+ * Calculate a year's holidays from the rules in HOLIDAY_DATA
+ */
+export function evaluateHolidayRules(country: string, year: number): CalculatedHoliday[] {
   const definitions = getHolidayDefinitions(country);
   const holidays: CalculatedHoliday[] = [];
 
@@ -503,31 +543,146 @@ export function getHolidaysForYear(country: string, year: number): CalculatedHol
   return holidays;
 }
 
-export function isHoliday(
-  date: Date,
-  country: string,
-  options: { checkObserved?: boolean } = {}
-): boolean {
-  debug.holidays('isHoliday called for %s in %s', date.toDateString(), country);
-  const year = date.getFullYear();
-  const holidays = getHolidaysForYear(country, year);
+/**
+ * Which dates a holiday index marks
+ * - actual:   each holiday's own date
+ * - observed: the observed date where one differs, otherwise the actual date
+ * - both:     actual and observed dates
+ */
+export type HolidayIndexMode = 'actual' | 'observed' | 'both';
+
+/**
+ * Holidays generated by one year's rules, as a bitset over days
+ *
+ * Observed dates can fall in a neighbouring year (New Year's Day on a
+ * Saturday is observed on Dec 31), so the index starts a week before
+ * Jan 1 and ends a week after Dec 31.
+ */
+export interface HolidayIndex {
+  /** Epoch day (days since 1970-01-01 of the local calendar date) of bit 0 */
+  firstDay: number;
+  /** One bit per day from firstDay */
+  bits: Uint32Array;
+  /** Holiday name per marked epoch day (first one wins on shared days) */
+  names: Map<number, string>;
+  /** Marked epoch days, ascending */
+  days: readonly number[];
+}
+
+const DAY_MS = 86_400_000;
+// Observation rules move dates by at most three days
+const INDEX_MARGIN_DAYS = 7;
+const INDEX_SPAN_DAYS = 366 + 2 * INDEX_MARGIN_DAYS;
+// (country, year, mode) combinations kept; tools validate country codes
+const MAX_HOLIDAY_INDEXES = 512;
+const holidayIndexes = new Map<string, HolidayIndex>();
+
+/**
+ * Local calendar date as a day number - equal for dates with equal toDateString()
+ */
+export function toEpochDay(date: Date): number {
+  return Math.floor(Date.UTC(date.getFullYear(), date.getMonth(), date.getDate()) / DAY_MS);
+}
+
+/**
+ * Local midnight of an epoch day
+ */
+export function fromEpochDay(day: number): Date {
+  const utc = new Date(day * DAY_MS);
+  return new Date(utc.getUTCFullYear(), utc.getUTCMonth(), utc.getUTCDate());
+}
+
+/**
+ * Build the index for a year's calculated holidays
+ */
+export function buildHolidayIndex(
+  holidays: CalculatedHoliday[],
+  year: number,
+  mode: HolidayIndexMode
+): HolidayIndex {
+  const firstDay = toEpochDay(new Date(year, 0, 1)) - INDEX_MARGIN_DAYS;
+  const bits = new Uint32Array(Math.ceil(INDEX_SPAN_DAYS / 32));
+  const names = new Map<number, string>();
+
+  const mark = (date: Date, name: string): void => {
+    const day = toEpochDay(date);
+    const offset = day - firstDay;
+    if (offset < 0 || offset >= INDEX_SPAN_DAYS) {
+      debug.holidays('Holiday %s outside index for %d: %s', name, year, date.toDateString());
+      return;
+    }
+    // eslint-disable-next-line security/detect-object-injection -- numeric index
+    bits[offset >> 5] |= 1 << (offset & 31);
+    if (!names.has(day)) {
+      names.set(day, name);
+    }
+  };
 
   for (const holiday of holidays) {
-    // Check actual date
-    if (holiday.date.toDateString() === date.toDateString()) {
-      debug.holidays('Date %s is holiday: %s', date.toDateString(), holiday.name);
-      return true;
+    if (mode !== 'observed' || !holiday.observedDate) {
+      mark(holiday.date, holiday.name);
+    }
+    if (mode !== 'actual' && holiday.observedDate) {
+      mark(holiday.observedDate, holiday.name);
     }
+  }
 
-    // Check observed date if requested
-    if (options.checkObserved && holiday.observedDate) {
-      if (holiday.observedDate.toDateString() === date.toDateString()) {
-        debug.holidays('Date %s is observed holiday: %s', date.toDateString(), holiday.name);
-        return true;
-      }
+  const days = Array.from(names.keys()).sort((a, b) => a - b);
+  return { firstDay, bits, names, days };
+}
+
+/**
+ * Memoized holiday index per (country, year, mode)
+ */
+export function getHolidayIndex(
+  country: string,
+  year: number,
+  mode: HolidayIndexMode
+): HolidayIndex {
+  const key = `${country}:${year}:${mode}`;
+  let index = holidayIndexes.get(key);
+  if (!index) {
+    index = buildHolidayIndex(getHolidaysForYear(country, year), year, mode);
+    if (holidayIndexes.size >= MAX_HOLIDAY_INDEXES) {
+      holidayIndexes.clear();
     }
+    holidayIndexes.set(key, index);
+  }
+  return index;
+}
+
+/**
+ * O(1) membership test for an epoch day
+ */
+export function holidayIndexHas(index: HolidayIndex, day: number): boolean {
+  const offset = day - index.firstDay;
+  if (offset < 0 || offset >= INDEX_SPAN_DAYS) {
+    return false;
   }
+  // eslint-disable-next-line security/detect-object-injection -- numeric index
+  return (index.bits[offset >> 5] & (1 << (offset & 31))) !== 0;
+}
 
-  debug.holidays('Date %s is not a holiday', date.toDateString());
-  return false;
+export function isHoliday(
+  date: Date,
+  country: string,
+  options: { checkObserved?: boolean } = {}
+): boolean {
+  const mode = options.checkObserved ? 'both' : 'actual';
+  const index = getHolidayIndex(country, date.getFullYear(), mode);
+  const result = holidayIndexHas(index, toEpochDay(date));
+  debug.holidays('isHoliday %s in %s: %s', date, country, result);
+  return result;
+}
+
+/**
+ * Name of the holiday on a date, if any (same matching rules as isHoliday)
+ */
+export function getHolidayName(
+  date: Date,
+  country: string,
+  options: { checkObserved?: boolean } = {}
+): string | undefined {
+  const mode = options.checkObserved ? 'both' : 'actual';
+  return getHolidayIndex(country, date.getFullYear(), mode).names.get(toEpochDay(date));
 }
@@ -1,10 +1,18 @@
 #!/usr/bin/env node
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
-import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import { CallToolRequestSchema, ListToolsRequestSchema } from '@modelcontextprotocol/sdk/types.js';
 import type { CallToolRequest } from '@modelcontextprotocol/sdk/types.js';
 
-import { mapToMcpError, McpError } from './adapters/mcp-sdk';
+import {
+  ErrorCode,
+  preserializeResult,
+  TemplatedStdioTransport,
+  toErrorResponse,
+  ValidationError,
+} from './adapters/mcp-sdk';
+import type { ErrorResponse } from './adapters/mcp-sdk';
+import { startCacheSnapshots } from './cache/cacheSnapshot';
+import { getCachedResponse, getResponseKey, setCachedResponse } from './cache/responseCache';
 import {
   getCurrentTime,
   convertTimezone,
@@ -12,6 +20,8 @@ import {
   subtractTime,
   calculateDuration,
   getBusinessDays,
+  addBusinessDays,
+  subtractBusinessDays,
   getServerInfo,
   nextOccurrence,
   formatTime,
@@ -19,8 +29,18 @@ import {
   daysUntil,
 } from './tools';
 import { debug, logEnvironment } from './utils/debug';
+import {
+  dumpDebugBuffer,
+  dumpDebugBufferOnError,
+  isDebugBufferActive,
+  startDebugBuffer,
+  withDebugRequest,
+} from './utils/debugBuffer';
 import { SlidingWindowRateLimiter } from './utils/rateLimit';
+import { compileSchema } from './utils/schemaValidator';
 import { configureServer } from './utils/serverConfig';
+import { LIMITS } from './utils/validation';
+import { captureCacheExpiry } from './utils/withCache';
 
 // Configure server settings to prevent warnings
 configureServer();
@@ -28,6 +48,46 @@ configureServer();
 // Log environment at startup
 logEnvironment();
 
+// Schema fragments carrying the limits the tools apply to these fields
+const DATE_STRING = { type: 'string' as const, maxLength: LIMITS.MAX_DATE_STRING_LENGTH };
+const TIMEZONE_STRING = { type: 'string' as const, maxLength: LIMITS.MAX_TIMEZONE_LENGTH };
+const FORMAT_STRING = { type: 'string' as const, maxLength: LIMITS.MAX_FORMAT_LENGTH };
+const DATE_ARRAY = {
+  type: 'array' as const,
+  items: DATE_STRING,
+  maxItems: LIMITS.MAX_ARRAY_LENGTH,
+};
+
+// Shared by add_business_days and subtract_business_days
+const BUSINESS_DAY_STEP_PROPERTIES = {
+  start_date: { ...DATE_STRING, description: 'Date to count from (not counted itself)' },
+  days: { type: 'number' as const, description: 'Number of business days to move' },
+  exclude_weekends: {
+    type: 'boolean' as const,
+    description: 'Skip weekends (default: true)',
+  },
+  holiday_calendar: {
+    type: 'string' as const,
+    description: 'Country code whose public holidays are skipped (e.g., US, UK)',
+  },
+  include_observed: {
+    type: 'boolean' as const,
+    description: 'Skip holidays on their observed dates (default: true)',
+  },
+  custom_holidays: {
+    ...DATE_ARRAY,
+    description: 'Additional holiday dates to skip',
+  },
+  holidays: {
+    ...DATE_ARRAY,
+    description: 'Array of holiday dates',
+  },
+  timezone: {
+    ...TIMEZONE_STRING,
+    description: 'Timezone for calculation (default: system timezone)',
+  },
+};
+
 // Tool definitions with metadata (keeping same as before)
 export const TOOL_DEFINITIONS = [
   {
@@ -45,10 +105,10 @@ export const TOOL_DEFINITIONS = [
       type: 'object' as const,
       properties: {
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'IANA timezone (default: system timezone)',
         },
-        format: { type: 'string' as const, description: 'date-fns format string' },
+        format: { ...FORMAT_STRING, description: 'date-fns format string' },
         include_offset: {
           type: 'boolean' as const,
           description: 'Include UTC offset (default: true)',
@@ -62,10 +122,10 @@ export const TOOL_DEFINITIONS = [
     inputSchema: {
       type: 'object' as const,
       properties: {
-        time: { type: 'string' as const, description: 'Input time' },
-        from_timezone: { type: 'string' as const, description: 'Source IANA timezone' },
-        to_timezone: { type: 'string' as const, description: 'Target IANA timezone' },
-        format: { type: 'string' as const, description: 'Output format' },
+        time: { ...DATE_STRING, description: 'Input time' },
+        from_timezone: { ...TIMEZONE_STRING, description: 'Source IANA timezone' },
+        to_timezone: { ...TIMEZONE_STRING, description: 'Target IANA timezone' },
+        format: { ...FORMAT_STRING, description: 'Output format' },
       },
       required: ['time', 'from_timezone', 'to_timezone'],
     },
@@ -76,7 +136,7 @@ export const TOOL_DEFINITIONS = [
     inputSchema: {
       type: 'object' as const,
       properties: {
-        time: { type: 'string' as const, description: 'Base time' },
+        time: { ...DATE_STRING, description: 'Base time' },
         amount: { type: 'number' as const, description: 'Amount to add' },
         unit: {
           type: 'string' as const,
@@ -84,7 +144,7 @@ export const TOOL_DEFINITIONS = [
           description: 'Unit of time',
         },
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'Timezone for calculation (default: system timezone)',
         },
       },
@@ -97,7 +157,7 @@ export const TOOL_DEFINITIONS = [
     inputSchema: {
       type: 'object' as const,
       properties: {
-        time: { type: 'string' as const, description: 'Base time' },
+        time: { ...DATE_STRING, description: 'Base time' },
         amount: { type: 'number' as const, description: 'Amount to subtract' },
         unit: {
           type: 'string' as const,
@@ -105,7 +165,7 @@ export const TOOL_DEFINITIONS = [
           description: 'Unit of time',
         },
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'Timezone for calculation (default: system timezone)',
         },
       },
@@ -118,11 +178,11 @@ export const TOOL_DEFINITIONS = [
     inputSchema: {
       type: 'object' as const,
       properties: {
-        start_time: { type: 'string' as const, description: 'Start time' },
-        end_time: { type: 'string' as const, description: 'End time' },
+        start_time: { ...DATE_STRING, description: 'Start time' },
+        end_time: { ...DATE_STRING, description: 'End time' },
         unit: { type: 'string' as const, description: 'Output unit (default: "auto")' },
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'Timezone for parsing (default: system timezone)',
         },
       },
@@ -135,25 +195,54 @@ export const TOOL_DEFINITIONS = [
     inputSchema: {
       type: 'object' as const,
       properties: {
-        start_date: { type: 'string' as const, description: 'Start date' },
-        end_date: { type: 'string' as const, description: 'End date' },
+        start_date: { ...DATE_STRING, description: 'Start date' },
+        end_date: { ...DATE_STRING, description: 'End date' },
         exclude_weekends: {
           type: 'boolean' as const,
           description: 'Exclude weekends (default: true)',
         },
         holidays: {
-          type: 'array' as const,
-          items: { type: 'string' as const },
+          ...DATE_ARRAY,
           description: 'Array of holiday dates',
         },
-        timezone: {
+        holiday_calendar: {
           type: 'string' as const,
+          description: 'Country code whose public holidays are excluded (e.g., US, UK)',
+        },
+        include_observed: {
+          type: 'boolean' as const,
+          description: 'Exclude holidays on their observed dates (default: true)',
+        },
+        custom_holidays: {
+          ...DATE_ARRAY,
+          description: 'Additional holiday dates to exclude',
+        },
+        timezone: {
+          ...TIMEZONE_STRING,
           description: 'Timezone for calculation (default: system timezone)',
         },
       },
       required: ['start_date', 'end_date'],
     },
   },
+  {
+    name: 'add_business_days',
+    description: 'Find the date a number of business days after a date',
+    inputSchema: {
+      type: 'object' as const,
+      properties: BUSINESS_DAY_STEP_PROPERTIES,
+      required: ['start_date', 'days'],
+    },
+  },
+  {
+    name: 'subtract_business_days',
+    description: 'Find the date a number of business days before a date',
+    inputSchema: {
+      type: 'object' as const,
+      properties: BUSINESS_DAY_STEP_PROPERTIES,
+      required: ['start_date', 'days'],
+    },
+  },
   {
     name: 'next_occurrence',
     description: 'Find next occurrence of a recurring event',
@@ -165,12 +254,12 @@ export const TOOL_DEFINITIONS = [
           enum: ['daily', 'weekly', 'monthly', 'yearly'],
           description: 'Recurrence pattern',
         },
-        start_from: { type: 'string' as const, description: 'Start searching from' },
+        start_from: { ...DATE_STRING, description: 'Start searching from' },
         day_of_week: { type: 'number' as const, description: 'For weekly (0-6, 0=Sunday)' },
         day_of_month: { type: 'number' as const, description: 'For monthly (1-31)' },
         time: { type: 'string' as const, description: 'Time in HH:mm format' },
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'Timezone for calculation (default: system timezone)',
         },
       },
@@ -183,15 +272,15 @@ export const TOOL_DEFINITIONS = [
     inputSchema: {
       type: 'object' as const,
       properties: {
-        time: { type: 'string' as const, description: 'Time to format' },
+        time: { ...DATE_STRING, description: 'Time to format' },
         format: {
           type: 'string' as const,
           enum: ['relative', 'calendar', 'custom'],
           description: 'Format type',
         },
-        custom_format: { type: 'string' as const, description: 'For custom format' },
+        custom_format: { ...FORMAT_STRING, description: 'For custom format' },
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'Timezone for display (default: system timezone)',
         },
       },
@@ -204,25 +293,38 @@ export const TOOL_DEFINITIONS = [
     inputSchema: {
       type: 'object' as const,
       properties: {
-        start_time: { type: 'string' as const, description: 'Start time' },
-        end_time: { type: 'string' as const, description: 'End time' },
+        start_time: { ...DATE_STRING, description: 'Start time' },
+        end_time: { ...DATE_STRING, description: 'End time' },
         business_hours: {
           type: 'object' as const,
           description: 'Business hours definition (default: 9 AM - 5 PM)',
         },
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'Timezone for calculation (default: system timezone)',
         },
         holidays: {
-          type: 'array' as const,
-          items: { type: 'string' as const },
+          ...DATE_ARRAY,
           description: 'Array of holiday dates',
         },
         include_weekends: {
           type: 'boolean' as const,
           description: 'Include weekends in calculation (default: false)',
         },
+        breakdown: {
+          type: 'string' as const,
+          enum: ['none', 'full', 'paged'],
+          description:
+            'Per-day breakdown: full (default), none (totals only) or paged (one page per call)',
+        },
+        page_size: {
+          type: 'number' as const,
+          description: 'Days per page when breakdown is paged (default: 31, max: 366)',
+        },
+        cursor: {
+          type: 'string' as const,
+          description: 'next_cursor from the previous page when breakdown is paged',
+        },
       },
       required: ['start_time', 'end_time'],
     },
@@ -238,7 +340,7 @@ export const TOOL_DEFINITIONS = [
           description: 'Target date (ISO string, natural language, or Unix timestamp)',
         },
         timezone: {
-          type: 'string' as const,
+          ...TIMEZONE_STRING,
           description: 'Timezone for calculation (default: system timezone)',
         },
         format_result: {
@@ -252,6 +354,23 @@ export const TOOL_DEFINITIONS = [
   },
 ];
 
+// Only listed while debug output goes to the ring buffer (DEBUG_BUFFER_SIZE)
+export const DEBUG_BUFFER_TOOL_DEFINITION = {
+  name: 'dump_debug_buffer',
+  description: 'Write the buffered debug events to a file and return its path',
+  inputSchema: {
+    type: 'object' as const,
+    properties: {},
+  },
+};
+
+function dumpDebugBufferTool(): { path: string; events: number } {
+  if (!isDebugBufferActive()) {
+    throw new ValidationError('Debug buffer is not enabled (set DEBUG_BUFFER_SIZE)');
+  }
+  return dumpDebugBuffer('dump_debug_buffer tool');
+}
+
 // Tool function mapping - wrapping each function to handle unknown params
 const TOOL_FUNCTIONS: Record<string, (params: unknown) => unknown> = {
   get_server_info: (params: unknown) => getServerInfo(params),
@@ -265,28 +384,56 @@ const TOOL_FUNCTIONS: Record<string, (params: unknown) => unknown> = {
     calculateDuration(params as Parameters<typeof calculateDuration>[0]),
   get_business_days: (params: unknown) =>
     getBusinessDays(params as Parameters<typeof getBusinessDays>[0]),
+  add_business_days: (params: unknown) =>
+    addBusinessDays(params as Parameters<typeof addBusinessDays>[0]),
+  subtract_business_days: (params: unknown) =>
+    subtractBusinessDays(params as Parameters<typeof subtractBusinessDays>[0]),
   next_occurrence: (params: unknown) =>
     nextOccurrence(params as Parameters<typeof nextOccurrence>[0]),
   format_time: (params: unknown) => formatTime(params as Parameters<typeof formatTime>[0]),
   calculate_business_hours: (params: unknown) =>
     calculateBusinessHours(params as Parameters<typeof calculateBusinessHours>[0]),
   days_until: (params: unknown) => daysUntil(params as Parameters<typeof daysUntil>[0]),
+  dump_debug_buffer: () => dumpDebugBufferTool(),
+};
+
+// Argument validators, compiled once from the input schemas
+const TOOL_VALIDATORS = new Map(
+  [...TOOL_DEFINITIONS, DEBUG_BUFFER_TOOL_DEFINITION].map((tool) => [
+    tool.name,
+    compileSchema(tool.inputSchema),
+  ])
+);
+
+// tools/list results, serialized once (see responseTemplates)
+const TOOLS_LIST = preserializeResult({ tools: TOOL_DEFINITIONS });
+let toolsListWithDebugBuffer: typeof TOOLS_LIST | undefined;
+
+function getToolsList(): typeof TOOLS_LIST {
+  if (!isDebugBufferActive()) {
+    return TOOLS_LIST;
+  }
+  toolsListWithDebugBuffer ??= preserializeResult({
+    tools: [...TOOL_DEFINITIONS, DEBUG_BUFFER_TOOL_DEFINITION],
+  });
+  return toolsListWithDebugBuffer;
+}
+
+const SERVER_INFO = {
+  name: 'mcp-time-server-node',
+  version: '1.0.0',
+};
+
+const SERVER_OPTIONS = {
+  capabilities: {
+    tools: {},
+  },
 };
 
 // Create the MCP server instance
 export function createServer(): Server {
   debug.server('Creating MCP server instance');
-  return new Server(
-    {
-      name: 'mcp-time-server-node',
-      version: '1.0.0',
-    },
-    {
-      capabilities: {
-        tools: {},
-      },
-    }
-  );
+  return new Server(SERVER_INFO, SERVER_OPTIONS);
 }
 
 // Check rate limit and return appropriate response
@@ -324,33 +471,15 @@ export function handleRateLimit(
  * Helper function to format tool execution errors
  * Now uses our adapter to properly map errors to MCP format
  */
-function formatToolError(
-  error: unknown,
-  toolName: string
-): { error: { code: number; message: string; data?: unknown } } {
+function formatToolError(error: unknown, toolName: string): { error: ErrorResponse } {
   debug.trace('Tool %s execution failed: %O', toolName, error);
 
-  // If it's already an McpError, return it in the expected format
-  if (error instanceof McpError) {
-    return {
-      error: {
-        code: error.code,
-        message: error.message,
-        data: error.data,
-      },
-    };
+  // Expected input errors map straight to a response; others become McpErrors
+  const response = toErrorResponse(error, toolName);
+  if (response.code === ErrorCode.InternalError) {
+    dumpDebugBufferOnError(`${toolName} failed: ${response.message}`);
   }
-
-  // Map any other error to McpError using our adapter
-  const mcpError = mapToMcpError(error, toolName);
-
-  return {
-    error: {
-      code: mcpError.code,
-      message: mcpError.message,
-      data: mcpError.data,
-    },
-  };
+  return { error: response };
 }
 
 export async function executeToolFunction(
@@ -375,16 +504,38 @@ export async function executeToolFunction(
       throw new Error(`Unknown tool: ${name}`);
     }
 
-    // Execute the tool
-    const result = await toolFunction(args);
+    // Reject malformed arguments before they are hashed or reach the tool
+    const validate = TOOL_VALIDATORS.get(name);
+    if (!validate) {
+      throw new Error(`No input schema for tool: ${name}`);
+    }
+    const params = validate(args);
+
+    // Serve the already-serialized payload if we have one
+    const responseKey = getResponseKey(name, params);
+    const cachedText = getCachedResponse(responseKey);
+    if (cachedText !== undefined) {
+      debug.cache('Response cache HIT for %s', name);
+      return { content: [{ type: 'text', text: cachedText }] };
+    }
+
+    // Execute the tool, noting when the cached results it used go stale
+    const { value, expiresAt } = captureCacheExpiry(() => toolFunction(params));
+    const result = await value;
     debug.trace('Tool %s executed successfully', name);
 
+    const text = JSON.stringify(result);
+    // Async tools may hit the cache after the capture window closed
+    if (expiresAt !== undefined && !(value instanceof Promise)) {
+      setCachedResponse(responseKey, text, expiresAt);
+    }
+
     // Return the result
     return {
       content: [
         {
           type: 'text',
-          text: JSON.stringify(result),
+          text,
         },
       ],
     };
@@ -420,19 +571,19 @@ export function registerHandlers(server: Server, rateLimiter: SlidingWindowRateL
   // Register tools/list handler
   server.setRequestHandler(ListToolsRequestSchema, () => {
     debug.server('Handling tools/list request');
-    return Promise.resolve({
-      tools: TOOL_DEFINITIONS,
-    });
+    return Promise.resolve(getToolsList());
   });
 
   // Register tools/call handler
   server.setRequestHandler(CallToolRequestSchema, async (request: CallToolRequest) => {
-    return handleToolCall(request, rateLimiter);
+    return withDebugRequest(() => handleToolCall(request, rateLimiter));
   });
 }
 
 // Main function - now simple orchestration
 async function main(): Promise<void> {
+  // Debug output to a ring buffer: no-op unless DEBUG_BUFFER_SIZE is set
+  startDebugBuffer();
   debug.server('Starting MCP Time Server...');
 
   const rateLimiter = new SlidingWindowRateLimiter();
@@ -440,7 +591,11 @@ async function main(): Promise<void> {
 
   registerHandlers(server, rateLimiter);
 
-  const transport = new StdioServerTransport();
+  // Warm restarts: no-op unless CACHE_SNAPSHOT_PATH is set
+  startCacheSnapshots();
+
+  // Writes the pre-serialized tools/list without serializing it again
+  const transport = new TemplatedStdioTransport();
   await server.connect(transport);
 
   debug.server('MCP Time Server connected to stdio transport');
@@ -0,0 +1,126 @@
+import { format } from 'date-fns';
+
+import { TimezoneError, ValidationError } from '../adapters/mcp-sdk';
+import { CacheTTL } from '../cache/timeCache';
+import { fromEpochDay, toEpochDay } from '../data/holidays';
+import type { AddBusinessDaysParams, AddBusinessDaysResult } from '../types';
+import { stepBusinessDays } from '../utils/businessDayCounter';
+import { MAX_DATE_RANGE_DAYS, validateHolidayCalendar } from '../utils/businessDayHelpers';
+import { parseDateWithTimezone } from '../utils/businessUtils';
+import { buildCacheKey } from '../utils/cacheKeyBuilder';
+import { getConfig } from '../utils/config';
+import { debug } from '../utils/debug';
+import { aggregateExplicitHolidayDays } from '../utils/holidayAggregator';
+import { resolveTimezone } from '../utils/timezoneUtils';
+import {
+  validateTimezone,
+  validateArrayLength,
+  validateDateString,
+  LIMITS,
+} from '../utils/validation';
+import { withCache } from '../utils/withCache';
+
+// Custom holidays aren't limited to a range when stepping
+const ALL_DATES = { start: new Date(-8.64e15), end: new Date(8.64e15) };
+
+/**
+ * Validates that the number of business days is a whole number
+ */
+export function validateBusinessDayCount(days: number): void {
+  if (typeof days !== 'number' || !Number.isInteger(days)) {
+    debug.error('Invalid business day count: %s', days);
+    throw new ValidationError(`Invalid days: ${days}. Must be a whole number`, { days });
+  }
+}
+
+/**
+ * Find the date a number of business days after start_date
+ *
+ * Honours the same holiday sources and weekend rule as get_business_days:
+ * the business days in (start_date, result_date] counted by
+ * get_business_days equal `days`. The start date itself is not counted.
+ */
+export function addBusinessDays(params: AddBusinessDaysParams): AddBusinessDaysResult {
+  const { start_date, days, holidays = [], holiday_calendar, custom_holidays = [] } = params;
+
+  debug.business('addBusinessDays called with params: %O', {
+    start_date,
+    days,
+    timezone: params.timezone,
+    exclude_weekends: params.exclude_weekends,
+    holiday_calendar,
+    holidays_count: holidays.length,
+    custom_holidays_count: custom_holidays.length,
+  });
+
+  validateDateString(start_date, 'start_date');
+  validateBusinessDayCount(days);
+  validateArrayLength(holidays, LIMITS.MAX_ARRAY_LENGTH, 'holidays');
+  validateArrayLength(custom_holidays, LIMITS.MAX_ARRAY_LENGTH, 'custom_holidays');
+
+  const excludeWeekends = params.exclude_weekends ?? true;
+  const includeObserved = params.include_observed ?? true;
+  const timezone = resolveTimezone(params.timezone, getConfig().defaultTimezone);
+
+  const cacheKey = buildCacheKey('business_step', {
+    single: { timezone, days },
+    dates: [start_date],
+    flags: { excludeWeekends, includeObserved },
+    arrays: { holidays, customHolidays: custom_holidays },
+    optional: { calendar: holiday_calendar },
+  });
+
+  return withCache(cacheKey, CacheTTL.BUSINESS_DAYS, () =>
+    stepFromStartDate(params, timezone, excludeWeekends, includeObserved)
+  );
+}
+
+function stepFromStartDate(
+  params: AddBusinessDaysParams,
+  timezone: string,
+  excludeWeekends: boolean,
+  includeObserved: boolean
+): AddBusinessDaysResult {
+  const { start_date, days, holiday_calendar } = params;
+
+  if (timezone && !validateTimezone(timezone)) {
+    debug.error('Invalid timezone: %s', timezone);
+    throw new TimezoneError(`Invalid timezone: ${timezone}`, timezone);
+  }
+  if (holiday_calendar) {
+    validateHolidayCalendar(holiday_calendar);
+  }
+
+  const startDay = toEpochDay(parseDateWithTimezone(start_date, timezone, 'start_date'));
+  const extraHolidays = aggregateExplicitHolidayDays({
+    includeObserved,
+    dateRange: ALL_DATES,
+    custom: params.custom_holidays,
+    legacy: params.holidays,
+    timezone,
+  });
+
+  const resultDay = stepBusinessDays(
+    startDay,
+    days,
+    { calendar: holiday_calendar, includeObserved, excludeWeekends, extraHolidays },
+    MAX_DATE_RANGE_DAYS
+  );
+  if (resultDay === undefined) {
+    debug.error('Business day step too large: %d days from %s', days, start_date);
+    throw new ValidationError('Result date exceeds maximum range of 1000 years', {
+      start_date,
+      days,
+      max_days: MAX_DATE_RANGE_DAYS,
+    });
+  }
+
+  const result: AddBusinessDaysResult = {
+    start_date: format(fromEpochDay(startDay), 'yyyy-MM-dd'),
+    result_date: format(fromEpochDay(resultDay), 'yyyy-MM-dd'),
+    business_days: days,
+    calendar_days: resultDay - startDay,
+  };
+  debug.business('addBusinessDays returning: %O', result);
+  return result;
+}
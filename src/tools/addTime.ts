@@ -1,16 +1,18 @@
 import { addYears, addMonths, addDays, addHours, addMinutes, addSeconds } from 'date-fns';
-import { formatInTimeZone } from 'date-fns-tz';
 
 import { ValidationError, TimezoneError, DateParsingError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type { AddTimeParams, AddTimeResult } from '../types';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
+import { compileFormat, formatCompiled } from '../utils/formatCompiler';
 import { parseTimeInput } from '../utils/parseTimeInput';
 import { resolveTimezone } from '../utils/timezoneUtils';
 import { validateTimezone, validateDateInput } from '../utils/validation';
 import { withCache } from '../utils/withCache';
 
+const ISO_FORMAT = compileFormat("yyyy-MM-dd'T'HH:mm:ss.SSSXXX");
+
 const unitFunctions = {
   years: addYears,
   months: addMonths,
@@ -152,8 +154,8 @@ export function formatAddTimeResult(
   if (time.includes('Z') && params.timezone) {
     debug.timing('Formatting Z suffix with requested timezone: %s', displayTimezone);
     return {
-      original: formatInTimeZone(inputDate, displayTimezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX"),
-      result: formatInTimeZone(resultDate, displayTimezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX"),
+      original: formatCompiled(inputDate, displayTimezone, ISO_FORMAT),
+      result: formatCompiled(resultDate, displayTimezone, ISO_FORMAT),
       unix_original: Math.floor(inputDate.getTime() / 1000),
       unix_result: Math.floor(resultDate.getTime() / 1000),
     };
@@ -173,8 +175,8 @@ export function formatAddTimeResult(
   // Default formatting with specified timezone
   debug.timing('Formatting in timezone: %s', displayTimezone);
   return {
-    original: formatInTimeZone(inputDate, displayTimezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX"),
-    result: formatInTimeZone(resultDate, displayTimezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX"),
+    original: formatCompiled(inputDate, displayTimezone, ISO_FORMAT),
+    result: formatCompiled(resultDate, displayTimezone, ISO_FORMAT),
     unix_original: Math.floor(inputDate.getTime() / 1000),
     unix_result: Math.floor(resultDate.getTime() / 1000),
   };
@@ -203,8 +205,8 @@ export function formatUnixTimestampResult(
   let result: string;
 
   if (timezone) {
-    original = formatInTimeZone(inputDate, timezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX");
-    result = formatInTimeZone(resultDate, timezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX");
+    original = formatCompiled(inputDate, timezone, ISO_FORMAT);
+    result = formatCompiled(resultDate, timezone, ISO_FORMAT);
   } else {
     original = inputDate.toISOString();
     result = resultDate.toISOString();
@@ -1,11 +1,11 @@
-import { formatInTimeZone } from 'date-fns-tz';
-
 import { ValidationError, TimezoneError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type {
   CalculateBusinessHoursParams,
   CalculateBusinessHoursResult,
   BusinessHours,
+  BusinessHoursPage,
+  BusinessHoursSummary,
   WeeklyBusinessHours,
   DayBusinessHours,
 } from '../types';
@@ -13,11 +13,17 @@ import {
   validateBusinessHoursStructure,
   isWorkDay,
   calculateDayBusinessMinutes,
+  calculateOverlapMinutes,
   buildDayResult,
+  formatDayNumber,
+  getDayName,
+  getDayNumberWeekday,
 } from '../utils/businessHoursHelpers';
 import { parseDateWithTimezone, parseHolidayDates } from '../utils/businessUtils';
+import { canonicalInstant, canonicalList, canonicalTimezone } from '../utils/canonicalKey';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
+import { compileFormat, formatCompiled } from '../utils/formatCompiler';
 import { parseTimeInput } from '../utils/parseTimeInput';
 import { resolveTimezone } from '../utils/timezoneUtils';
 import {
@@ -27,6 +33,12 @@ import {
   LIMITS,
 } from '../utils/validation';
 import { withCache } from '../utils/withCache';
+import {
+  getLocalDayNumber,
+  getZoneOffset,
+  MS_PER_DAY,
+  zoneOffsetChanges,
+} from '../utils/zoneOffsets';
 
 // Default business hours: 9 AM - 5 PM
 const DEFAULT_BUSINESS_HOURS: BusinessHours = {
@@ -34,6 +46,11 @@ const DEFAULT_BUSINESS_HOURS: BusinessHours = {
   end: { hour: 17, minute: 0 },
 };
 
+// Breakdown modes and page sizes for the per-day breakdown
+const BREAKDOWN_MODES = ['none', 'full', 'paged'];
+const DEFAULT_PAGE_SIZE = 31;
+const MAX_PAGE_SIZE = 366;
+
 function isWeeklyBusinessHours(
   hours: BusinessHours | WeeklyBusinessHours
 ): hours is WeeklyBusinessHours {
@@ -100,6 +117,42 @@ function validateBusinessDateRange(
   }
 }
 
+/**
+ * Validate the breakdown mode and paging options
+ * @internal
+ */
+function validateBreakdownOptions(params: {
+  breakdown?: string;
+  page_size?: number;
+  cursor?: string;
+}): void {
+  const { breakdown = 'full', page_size, cursor } = params;
+
+  if (!BREAKDOWN_MODES.includes(breakdown)) {
+    debug.error('Invalid breakdown mode: %s', breakdown);
+    throw new ValidationError(
+      `Invalid breakdown: ${breakdown}. Must be one of: ${BREAKDOWN_MODES.join(', ')}`,
+      { breakdown }
+    );
+  }
+
+  if (
+    page_size !== undefined &&
+    (!Number.isInteger(page_size) || page_size < 1 || page_size > MAX_PAGE_SIZE)
+  ) {
+    debug.error('Invalid page size: %s', page_size);
+    throw new ValidationError(
+      `Invalid page_size: ${page_size}. Must be a whole number from 1 to ${MAX_PAGE_SIZE}`,
+      { page_size, max_page_size: MAX_PAGE_SIZE }
+    );
+  }
+
+  if (cursor !== undefined && !/^\d{1,7}$/.test(cursor)) {
+    debug.error('Invalid cursor: %s', cursor);
+    throw new ValidationError('Invalid cursor', { cursor });
+  }
+}
+
 /**
  * Get business hours for a specific day of week
  * @internal
@@ -138,53 +191,229 @@ function buildBusinessHoursCacheKey(params: {
 }
 
 /**
- * Process all days in date range and calculate business hours
+ * Build the canonical cache key - the result depends on the parsed instants,
+ * the calendar timezone and the holiday set, not on how they are written
  * @internal
  */
-function processDateRange(params: {
-  dateStrings: string[];
+function buildBusinessHoursCanonicalKey(
+  params: {
+    start_time: string;
+    end_time: string;
+    timezone: string;
+    business_hours?: BusinessHours | WeeklyBusinessHours;
+    holidays: string[];
+    include_weekends: boolean;
+  },
+  variant: string
+): string | undefined {
+  const { start_time, end_time, timezone, business_hours, holidays, include_weekends } = params;
+  const tz = canonicalTimezone(timezone);
+  if (tz === undefined) {
+    return undefined;
+  }
+  const start = canonicalInstant(start_time, timezone);
+  const end = canonicalInstant(end_time, timezone);
+  if (start === undefined || end === undefined) {
+    return undefined;
+  }
+  return `canonical:business_hours${variant}:${JSON.stringify([
+    start,
+    end,
+    tz,
+    business_hours ?? null,
+    Boolean(include_weekends),
+  ])}:${canonicalList(holidays)}`;
+}
+
+interface DateRangeParams {
   startDate: Date;
   endDate: Date;
   timezone: string;
   holidayDates: Date[];
   include_weekends: boolean;
   business_hours?: BusinessHours | WeeklyBusinessHours;
-}): { breakdown: DayBusinessHours[]; totalMinutes: number } {
-  const {
-    dateStrings,
+}
+
+/**
+ * A parsed range, ready to process day by day
+ * @internal
+ */
+interface PreparedDateRange extends DateRangeParams {
+  /** Calendar days of the range in the business timezone (day numbers) */
+  days: number[];
+  holidayDays: Set<number>;
+}
+
+/**
+ * Calendar days (day numbers) of the range in the business timezone: the
+ * dates of start, start + 24h, ... up to end, plus the date of end.
+ * @internal
+ */
+function listRangeDays(startMs: number, endMs: number, timezone: string): number[] {
+  const days = new Set<number>();
+  for (let instant = startMs; instant <= endMs; instant += MS_PER_DAY) {
+    days.add(getLocalDayNumber(timezone, instant));
+  }
+  // Always include the end date
+  days.add(getLocalDayNumber(timezone, endMs));
+
+  return Array.from(days).sort((a, b) => a - b);
+}
+
+/**
+ * Process a day whose UTC offset holds from the day before to the day
+ * after: the business window is the day's wall-clock times shifted by
+ * that offset, so nothing needs parsing or formatting
+ * @internal
+ */
+function processSteadyDay(
+  day: number,
+  offset: number,
+  range: PreparedDateRange,
+  withBreakdown: boolean
+): { dayResult?: DayBusinessHours; minutes: number } {
+  const dayOfWeek = getDayNumberWeekday(day);
+  const isWeekend = dayOfWeek === 0 || dayOfWeek === 6;
+  const isHoliday = range.holidayDays.has(day);
+  const businessHours = getBusinessHoursForDay(dayOfWeek, range.business_hours);
+
+  let minutes = 0;
+  if (businessHours && !isHoliday && (!isWeekend || range.include_weekends)) {
+    // Local midnight of the day as a UTC instant
+    const midnight = day * MS_PER_DAY - offset;
+    const { start, end } = businessHours;
+    minutes = calculateOverlapMinutes(
+      midnight + (start.hour * 60 + start.minute) * 60 * 1000,
+      midnight + (end.hour * 60 + end.minute) * 60 * 1000,
+      range.startDate.getTime(),
+      range.endDate.getTime()
+    );
+  }
+  if (!withBreakdown) {
+    return { minutes };
+  }
+
+  const dayResult = buildDayResult(
+    formatDayNumber(day),
+    getDayName(dayOfWeek),
+    minutes,
+    isWeekend,
+    isHoliday
+  );
+  return { dayResult, minutes };
+}
+
+/**
+ * Process a day near a UTC offset change by parsing its times in the
+ * business timezone, which settles skipped and repeated wall-clock times
+ * @internal
+ */
+function processTransitionDay(
+  dayDateStr: string,
+  params: DateRangeParams
+): { dayResult: DayBusinessHours; minutes: number } {
+  const { timezone } = params;
+  debug.business('Offset changes near %s in %s, parsing day times', dayDateStr, timezone);
+
+  // Get day information
+  const day = parseTimeInput(dayDateStr + 'T12:00:00', timezone).date;
+  const dayOfWeek = parseInt(formatCompiled(day, timezone, compileFormat('c')), 10) - 1;
+
+  return processSingleBusinessDay({
+    dayDateStr,
+    startDate: params.startDate,
+    endDate: params.endDate,
+    timezone,
+    businessHours: getBusinessHoursForDay(dayOfWeek, params.business_hours),
+    holidayDates: params.holidayDates,
+    include_weekends: params.include_weekends,
+    dayOfWeek,
+    isWeekend: dayOfWeek === 0 || dayOfWeek === 6,
+  });
+}
+
+/**
+ * Parse and validate the range, then list its days and holidays
+ * @internal
+ */
+function prepareDateRange(params: {
+  start_time: string;
+  end_time: string;
+  timezone: string;
+  holidays: string[];
+  include_weekends: boolean;
+  business_hours?: BusinessHours | WeeklyBusinessHours;
+}): PreparedDateRange {
+  const { start_time, end_time, timezone, holidays } = params;
+
+  // Parse dates
+  const startDate = parseDateWithTimezone(start_time, timezone, 'start_time');
+  const endDate = parseDateWithTimezone(end_time, timezone, 'end_time');
+
+  // Validate date range
+  validateBusinessDateRange(startDate, endDate, start_time, end_time);
+
+  // Log the calculation context
+  if (debug.business.enabled) {
+    debug.business(
+      'Business hours calculation: %s to %s in %s',
+      formatCompiled(startDate, timezone, compileFormat('yyyy-MM-dd HH:mm')),
+      formatCompiled(endDate, timezone, compileFormat('yyyy-MM-dd HH:mm')),
+      timezone
+    );
+  }
+
+  // Parse holiday dates
+  const holidayDates = parseHolidayDates(holidays, timezone);
+  if (holidayDates.length > 0) {
+    debug.business('Holidays to exclude: %O', holidayDates);
+  }
+
+  return {
     startDate,
     endDate,
     timezone,
     holidayDates,
-    include_weekends,
-    business_hours,
-  } = params;
+    include_weekends: params.include_weekends,
+    business_hours: params.business_hours,
+    days: listRangeDays(startDate.getTime(), endDate.getTime(), timezone),
+    holidayDays: new Set(holidayDates.map((h) => getLocalDayNumber(timezone, h.getTime()))),
+  };
+}
+
+/**
+ * Process days of a range and calculate business hours
+ *
+ * Works from the zone's transition table. Days with a steady UTC
+ * offset are computed arithmetically and holidays are matched by
+ * day number; only days next to an offset change parse their times.
+ * Without a breakdown no per-day objects are built.
+ * @internal
+ */
+function processDateRange(
+  range: PreparedDateRange,
+  days: number[],
+  withBreakdown: boolean
+): { breakdown: DayBusinessHours[]; totalMinutes: number } {
+  const { timezone } = range;
   const breakdown: DayBusinessHours[] = [];
   let totalBusinessMinutes = 0;
 
-  for (const dayDateStr of dateStrings) {
-    // Get day information
-    const day = parseTimeInput(dayDateStr + 'T12:00:00', timezone).date;
-    const dayOfWeek = parseInt(formatInTimeZone(day, timezone, 'c'), 10) - 1;
-    const isWeekendDay = dayOfWeek === 0 || dayOfWeek === 6;
-
-    // Get business hours for this day
-    const dayBusinessHours = getBusinessHoursForDay(dayOfWeek, business_hours);
-
-    // Process the single day
-    const { dayResult, minutes } = processSingleBusinessDay({
-      dayDateStr,
-      startDate,
-      endDate,
+  for (const day of days) {
+    // A wall-clock time on this day maps to an instant within a day of it
+    const isSteady = !zoneOffsetChanges(
       timezone,
-      businessHours: dayBusinessHours,
-      holidayDates,
-      include_weekends,
-      dayOfWeek,
-      isWeekend: isWeekendDay,
-    });
+      (day - 1) * MS_PER_DAY,
+      (day + 2) * MS_PER_DAY
+    );
 
-    breakdown.push(dayResult);
+    const { dayResult, minutes } = isSteady
+      ? processSteadyDay(day, getZoneOffset(timezone, day * MS_PER_DAY), range, withBreakdown)
+      : processTransitionDay(formatDayNumber(day), range);
+
+    if (withBreakdown && dayResult) {
+      breakdown.push(dayResult);
+    }
     totalBusinessMinutes += minutes;
   }
 
@@ -192,22 +421,51 @@ function processDateRange(params: {
 }
 
 /**
- * Generate array of date strings between start and end dates
+ * Total business time of a range without its per-day breakdown
  * @internal
  */
-export function generateDateRange(startDate: Date, endDate: Date, timezone: string): string[] {
-  const datesInBizTz = new Set<string>();
-  let currentDate = new Date(startDate);
+function summarizeDateRange(range: PreparedDateRange): BusinessHoursSummary {
+  const { totalMinutes } = processDateRange(range, range.days, false);
+  debug.business(
+    'Calculated %d business hours across %d days',
+    Math.round(totalMinutes / 60),
+    range.days.length
+  );
+  return {
+    total_business_minutes: totalMinutes,
+    total_business_hours: totalMinutes / 60,
+    total_days: range.days.length,
+  };
+}
 
-  while (currentDate <= endDate) {
-    datesInBizTz.add(formatInTimeZone(currentDate, timezone, 'yyyy-MM-dd'));
-    currentDate = new Date(currentDate.getTime() + 24 * 60 * 60 * 1000); // Add 24 hours
+/**
+ * One page of the per-day breakdown, starting at the cursor's day
+ * @internal
+ */
+function buildBreakdownPage(
+  range: PreparedDateRange,
+  cursor: string | undefined,
+  pageSize: number
+): BusinessHoursPage {
+  const first = cursor === undefined ? 0 : parseInt(cursor, 10);
+  if (first >= range.days.length) {
+    debug.error('Cursor past the end of the range: %s (%d days)', cursor, range.days.length);
+    throw new ValidationError('Invalid cursor', { cursor, total_days: range.days.length });
   }
 
-  // Always include the end date
-  datesInBizTz.add(formatInTimeZone(endDate, timezone, 'yyyy-MM-dd'));
+  const last = Math.min(first + pageSize, range.days.length);
+  const { breakdown } = processDateRange(range, range.days.slice(first, last), true);
+  debug.business('Breakdown page: days %d-%d of %d', first, last - 1, range.days.length);
 
-  return Array.from(datesInBizTz).sort();
+  return last < range.days.length ? { breakdown, next_cursor: String(last) } : { breakdown };
+}
+
+/**
+ * Generate array of date strings between start and end dates
+ * @internal
+ */
+export function generateDateRange(startDate: Date, endDate: Date, timezone: string): string[] {
+  return listRangeDays(startDate.getTime(), endDate.getTime(), timezone).map(formatDayNumber);
 }
 
 /**
@@ -258,11 +516,13 @@ export function processSingleBusinessDay(params: {
 
   // Log work day decision
   if (!isWorkingDay) {
-    const isHolidayDay = holidayDates.some((h) => h.toISOString().slice(0, 10) === dayDateStr);
-    debug.decision('Day excluded', {
-      date: dayDateStr,
-      dayName,
-      reason: isHolidayDay ? 'holiday' : isWeekend && !include_weekends ? 'weekend' : 'no-hours',
+    debug.decision('Day excluded', () => {
+      const isHolidayDay = holidayDates.some((h) => h.toISOString().slice(0, 10) === dayDateStr);
+      return {
+        date: dayDateStr,
+        dayName,
+        reason: isHolidayDay ? 'holiday' : isWeekend && !include_weekends ? 'weekend' : 'no-hours',
+      };
     });
   }
 
@@ -287,7 +547,7 @@ export function processSingleBusinessDay(params: {
 
     // Log partial day calculations
     if (minutes > 0 && (dayBusinessStart < startDate || dayBusinessEnd > endDate)) {
-      debug.decision('Partial day calculated', {
+      debug.decision('Partial day calculated', () => ({
         date: dayDateStr,
         fullDayMinutes:
           (businessHours.end.hour - businessHours.start.hour) * 60 +
@@ -295,14 +555,14 @@ export function processSingleBusinessDay(params: {
         actualMinutes: minutes,
         startClamped: dayBusinessStart < startDate,
         endClamped: dayBusinessEnd > endDate,
-      });
+      }));
     }
   }
 
   // Check if holiday (needed for result structure)
-  // Use formatInTimeZone to be consistent with date string generation
+  // Format in the zone to be consistent with date string generation
   const isHoliday = holidayDates.some(
-    (h) => formatInTimeZone(h, timezone, 'yyyy-MM-dd') === dayDateStr
+    (h) => formatCompiled(h, timezone, compileFormat('yyyy-MM-dd')) === dayDateStr
   );
 
   // Build day result using helper
@@ -326,30 +586,44 @@ export function buildBusinessHoursResult(
   };
 
   // Log summary
-  debug.business(
-    'Calculated %d business hours across %d days (%d working days)',
-    Math.round(totalMinutes / 60),
-    breakdown.length,
-    breakdown.filter((d) => d.business_minutes > 0).length
-  );
+  if (debug.business.enabled) {
+    debug.business(
+      'Calculated %d business hours across %d days (%d working days)',
+      Math.round(totalMinutes / 60),
+      breakdown.length,
+      breakdown.filter((d) => d.business_minutes > 0).length
+    );
+  }
 
   return result;
 }
 
+/**
+ * Log the call's parameters, built only when business logging is on
+ * @internal
+ */
+function logCalculationRequest(params: CalculateBusinessHoursParams): void {
+  if (!debug.business.enabled) {
+    return;
+  }
+  debug.business('calculateBusinessHours called with params: %O', {
+    start_time: params.start_time,
+    end_time: params.end_time,
+    timezone: params.timezone,
+    business_hours: params.business_hours ?? 'default',
+    holidays_count: params.holidays?.length ?? 0,
+    include_weekends: params.include_weekends ?? false,
+    breakdown: params.breakdown ?? 'full',
+  });
+}
+
 export function calculateBusinessHours(
   params: CalculateBusinessHoursParams
 ): CalculateBusinessHoursResult {
   const { start_time, end_time, holidays = [], include_weekends = false } = params;
 
   // Log entry with parameters
-  debug.business('calculateBusinessHours called with params: %O', {
-    start_time,
-    end_time,
-    timezone: params.timezone,
-    business_hours: params.business_hours ?? 'default',
-    holidays_count: holidays.length,
-    include_weekends,
-  });
+  logCalculationRequest(params);
 
   const config = getConfig();
   const timezone = resolveTimezone(params.timezone, config.defaultTimezone);
@@ -363,62 +637,52 @@ export function calculateBusinessHours(
     business_hours: params.business_hours,
   });
 
+  validateBreakdownOptions(params);
+
   // Build cache key
-  const cacheKey = buildBusinessHoursCacheKey({
+  const keyParams = {
     start_time,
     end_time,
     timezone,
     business_hours: params.business_hours,
     holidays,
     include_weekends,
-  });
-
-  // Use withCache wrapper for the calculation
-  return withCache(cacheKey, CacheTTL.CALCULATIONS, () => {
-    // Parse dates
-    const startDate = parseDateWithTimezone(start_time, timezone, 'start_time');
-    const endDate = parseDateWithTimezone(end_time, timezone, 'end_time');
+  };
+  const cacheKey = buildBusinessHoursCacheKey(keyParams);
 
-    // Validate date range
-    validateBusinessDateRange(startDate, endDate, start_time, end_time);
+  // The full result, the aggregate and each page are cached separately
+  const cached = <T>(variant: string, compute: () => T): T =>
+    withCache(`${cacheKey}${variant}`, CacheTTL.CALCULATIONS, compute, {
+      canonicalKey: () => buildBusinessHoursCanonicalKey(keyParams, variant),
+    });
 
-    // Log the calculation context
-    debug.business(
-      'Business hours calculation: %s to %s in %s',
-      formatInTimeZone(startDate, timezone, 'yyyy-MM-dd HH:mm'),
-      formatInTimeZone(endDate, timezone, 'yyyy-MM-dd HH:mm'),
-      timezone
-    );
+  const mode = params.breakdown ?? 'full';
+  if (mode === 'full') {
+    return cached('', () => {
+      const range = prepareDateRange(keyParams);
+      const { breakdown, totalMinutes } = processDateRange(range, range.days, true);
 
-    // Parse holiday dates
-    const holidayDates = parseHolidayDates(holidays, timezone);
-    if (holidayDates.length > 0) {
-      debug.business('Holidays to exclude: %O', holidayDates);
-    }
+      // Build and return the final result
+      const result = buildBusinessHoursResult(breakdown, totalMinutes);
 
-    // Generate date range to process
-    const dateStrings = generateDateRange(startDate, endDate, timezone);
+      // Log successful completion
+      debug.business(
+        'calculateBusinessHours completed successfully: %d total hours',
+        result.total_business_hours
+      );
 
-    // Process all days in the date range
-    const { breakdown, totalMinutes } = processDateRange({
-      dateStrings,
-      startDate,
-      endDate,
-      timezone,
-      holidayDates,
-      include_weekends,
-      business_hours: params.business_hours,
+      return result;
     });
+  }
 
-    // Build and return the final result
-    const result = buildBusinessHoursResult(breakdown, totalMinutes);
-
-    // Log successful completion
-    debug.business(
-      'calculateBusinessHours completed successfully: %d total hours',
-      result.total_business_hours
-    );
+  const summary = cached('_summary', () => summarizeDateRange(prepareDateRange(keyParams)));
+  if (mode === 'none') {
+    return { ...summary, breakdown: [] };
+  }
 
-    return result;
-  });
+  const pageSize = params.page_size ?? DEFAULT_PAGE_SIZE;
+  const page = cached(`_page_${params.cursor ?? '0'}_${pageSize}`, () =>
+    buildBreakdownPage(prepareDateRange(keyParams), params.cursor, pageSize)
+  );
+  return { ...summary, ...page };
 }
@@ -3,6 +3,7 @@ import { differenceInMilliseconds } from 'date-fns';
 import { ValidationError, TimezoneError, DateParsingError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type { CalculateDurationParams, CalculateDurationResult } from '../types';
+import { canonicalInstant, canonicalTimezone } from '../utils/canonicalKey';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
 import { parseTimeInput } from '../utils/parseTimeInput';
@@ -61,10 +62,32 @@ export function calculateDuration(params: CalculateDurationParams): CalculateDur
 
       debug.timing('Returning result: %O', result);
       return result;
-    }
+    },
+    { canonicalKey: () => getCanonicalCacheKey(start_time, end_time, unit, timezone) }
   );
 }
 
+/**
+ * Canonical cache key - the result depends only on the two instants and the unit
+ */
+function getCanonicalCacheKey(
+  start_time: string,
+  end_time: string,
+  unit: string,
+  timezone: string
+): string | undefined {
+  // Invalid timezones must still reach validation
+  if (canonicalTimezone(timezone) === undefined) {
+    return undefined;
+  }
+  const start = canonicalInstant(start_time, timezone);
+  const end = canonicalInstant(end_time, timezone);
+  if (start === undefined || end === undefined) {
+    return undefined;
+  }
+  return `canonical:duration:${start}:${end}:${unit}`;
+}
+
 /**
  * Time components for duration formatting
  */
@@ -1,9 +1,8 @@
-import { formatInTimeZone, getTimezoneOffset } from 'date-fns-tz';
-
 import { ValidationError, TimezoneError, DateParsingError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type { ConvertTimezoneParams, ConvertTimezoneResult } from '../types';
 import { debug } from '../utils/debug';
+import { compileFormat, formatCompiled } from '../utils/formatCompiler';
 import { parseTimeInput } from '../utils/parseTimeInput';
 import {
   validateTimezone,
@@ -12,6 +11,7 @@ import {
   LIMITS,
 } from '../utils/validation';
 import { withCache } from '../utils/withCache';
+import { getWallClockOffset } from '../utils/zoneOffsets';
 
 /**
  * Validates both from and to timezones
@@ -122,13 +122,13 @@ export function formatOriginalTime(date: Date, originalTime: string, timezone: s
 
   // For UTC/Z format
   if (originalTime.includes('Z') || timezone === 'UTC') {
-    const result = formatInTimeZone(date, 'UTC', "yyyy-MM-dd'T'HH:mm:ss.SSS'Z'");
+    const result = formatCompiled(date, 'UTC', compileFormat("yyyy-MM-dd'T'HH:mm:ss.SSS'Z'"));
     debug.timezone('Formatted as UTC: %s', result);
     return result;
   }
 
   // Format in the specified timezone
-  const result = formatInTimeZone(date, timezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX");
+  const result = formatCompiled(date, timezone, compileFormat("yyyy-MM-dd'T'HH:mm:ss.SSSXXX"));
   debug.timezone('Formatted in timezone %s: %s', timezone, result);
   return result;
 }
@@ -170,7 +170,7 @@ export function extractOffsetString(originalTime: string, date: Date, timezone:
   }
 
   // Format offset for the timezone
-  const offset = formatInTimeZone(date, timezone, 'XXX');
+  const offset = formatCompiled(date, timezone, compileFormat('XXX'));
   debug.timezone('Formatted offset for %s: %s', timezone, offset);
   return offset;
 }
@@ -206,7 +206,7 @@ function formatConvertedTime(
 ): string {
   const format = customFormat ?? defaultFormat;
   debug.timezone('Formatting converted time in %s with format: %s', timezone, format);
-  return formatInTimeZone(date, timezone, format);
+  return formatCompiled(date, timezone, compileFormat(format));
 }
 
 /**
@@ -257,8 +257,8 @@ export function convertTimezone(params: ConvertTimezoneParams): ConvertTimezoneR
 
       try {
         // Get offsets
-        const fromOffset = getTimezoneOffset(actualFromTimezone, utcDate);
-        const toOffset = getTimezoneOffset(to_timezone, utcDate);
+        const fromOffset = getWallClockOffset(actualFromTimezone, utcDate.getTime());
+        const toOffset = getWallClockOffset(to_timezone, utcDate.getTime());
         const difference = (toOffset - fromOffset) / 1000 / 60; // in minutes
 
         // Format the times
@@ -1,15 +1,19 @@
 import { differenceInCalendarDays } from 'date-fns';
-import { toZonedTime } from 'date-fns-tz';
 
 import { ValidationError, TimezoneError, DateParsingError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type { DaysUntilParams, DaysUntilResult } from '../types';
+import { canonicalInstant, canonicalTimezone } from '../utils/canonicalKey';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
 import { parseTimeInput } from '../utils/parseTimeInput';
-import { resolveTimezone as resolveTimezoneUtil } from '../utils/timezoneUtils';
+import {
+  getNextLocalMidnight,
+  resolveTimezone as resolveTimezoneUtil,
+} from '../utils/timezoneUtils';
 import { validateTimezone, validateStringLength, LIMITS } from '../utils/validation';
 import { withCache } from '../utils/withCache';
+import { toZonedDate } from '../utils/zoneOffsets';
 
 /**
  * Parse target date from various formats
@@ -24,7 +28,7 @@ export function parseTargetDate(target_date: string | number, timezone?: string)
  * Convert date to specified timezone
  */
 export function convertToTimezone(date: Date, timezone: string): Date {
-  return timezone === 'UTC' ? date : toZonedTime(date, timezone);
+  return timezone === 'UTC' ? date : toZonedDate(date, timezone);
 }
 
 /**
@@ -45,6 +49,26 @@ export function getCacheTTL(daysUntil: number): number {
   return Math.abs(daysUntil) === 0 ? CacheTTL.CURRENT_TIME : CacheTTL.CALCULATIONS;
 }
 
+/**
+ * Canonical cache key - the result depends on the target instant, the
+ * calendar timezone and whether it is formatted
+ */
+export function getCanonicalCacheKey(
+  target_date: string | number,
+  timezone: string,
+  format_result: boolean
+): string | undefined {
+  const tz = canonicalTimezone(timezone);
+  if (tz === undefined) {
+    return undefined;
+  }
+  const target = canonicalInstant(String(target_date), timezone);
+  if (target === undefined) {
+    return undefined;
+  }
+  return `canonical:days_until:${target}:${tz}:${Boolean(format_result)}`;
+}
+
 /**
  * Calculate days until a target date
  * @param params - The parameters for the calculation
@@ -69,7 +93,9 @@ export function daysUntil(params: DaysUntilParams): DaysUntilResult {
   const timezone = resolveTimezoneUtil(userTimezone, defaultTimezone);
   debug.timezone('Resolved timezone: %s', timezone);
 
-  // Use withCache wrapper with CacheTTL.CALCULATIONS (since TTL depends on result)
+  // The day count only changes when the local date does, so entries expire
+  // at the next local midnight (CacheTTL.CALCULATIONS is the fallback)
+  let validUntil: number | undefined;
   return withCache(
     `days_until:${target_date}:${timezone}:${format_result}`,
     CacheTTL.CALCULATIONS,
@@ -101,6 +127,7 @@ export function daysUntil(params: DaysUntilParams): DaysUntilResult {
       // Get current date in the specified timezone
       const now = new Date();
       debug.timing('Current time: %s', now.toISOString());
+      validUntil = getNextLocalMidnight(now, timezone).getTime();
 
       // Convert both dates to the specified timezone for calendar day comparison
       const nowInTimezone = convertToTimezone(now, timezone);
@@ -124,6 +151,10 @@ export function daysUntil(params: DaysUntilParams): DaysUntilResult {
       }
 
       return result;
+    },
+    {
+      canonicalKey: () => getCanonicalCacheKey(target_date, timezone, format_result),
+      validUntil: () => validUntil,
     }
   );
 }
@@ -1,13 +1,14 @@
 import { startOfDay, differenceInDays } from 'date-fns';
-import { formatInTimeZone, toZonedTime } from 'date-fns-tz';
 
 import { ValidationError, TimezoneError, DateParsingError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type { FormatTimeParams, FormatTimeResult } from '../types';
+import { canonicalInstant, canonicalTimezone } from '../utils/canonicalKey';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
+import { compileFormat, formatCompiled } from '../utils/formatCompiler';
 import { parseTimeInput } from '../utils/parseTimeInput';
-import { resolveTimezone } from '../utils/timezoneUtils';
+import { getNextLocalMidnight, resolveTimezone } from '../utils/timezoneUtils';
 import {
   validateTimezone,
   validateDateString,
@@ -15,137 +16,9 @@ import {
   LIMITS,
 } from '../utils/validation';
 import { withCache } from '../utils/withCache';
+import { toZonedDate } from '../utils/zoneOffsets';
 
-/**
- * Format tokens organized by category for better maintainability
- * Frozen to prevent accidental modification
- */
-export const FORMAT_TOKENS = Object.freeze({
-  era: Object.freeze(['G', 'GG', 'GGG', 'GGGG', 'GGGGG']),
-  year: Object.freeze(['y', 'yo', 'yy', 'yyy', 'yyyy', 'yyyyy']),
-  localWeekYear: Object.freeze(['Y', 'Yo', 'YY', 'YYY', 'YYYY', 'YYYYY']),
-  isoWeekYear: Object.freeze(['R', 'RR', 'RRR', 'RRRR', 'RRRRR']),
-  extendedYear: Object.freeze(['u', 'uu', 'uuu', 'uuuu', 'uuuuu']),
-  quarter: Object.freeze([
-    'Q',
-    'Qo',
-    'QQ',
-    'QQQ',
-    'QQQQ',
-    'QQQQQ',
-    'q',
-    'qo',
-    'qq',
-    'qqq',
-    'qqqq',
-    'qqqqq',
-  ]),
-  month: Object.freeze([
-    'M',
-    'Mo',
-    'MM',
-    'MMM',
-    'MMMM',
-    'MMMMM',
-    'L',
-    'Lo',
-    'LL',
-    'LLL',
-    'LLLL',
-    'LLLLL',
-  ]),
-  week: Object.freeze(['w', 'wo', 'ww', 'I', 'Io', 'II']),
-  day: Object.freeze([
-    'd',
-    'do',
-    'dd',
-    'D',
-    'Do',
-    'DD',
-    'DDD',
-    'E',
-    'EE',
-    'EEE',
-    'EEEE',
-    'EEEEE',
-    'EEEEEE',
-    'e',
-    'eo',
-    'ee',
-    'eee',
-    'eeee',
-    'eeeee',
-    'eeeeee',
-    'c',
-    'co',
-    'cc',
-    'ccc',
-    'cccc',
-    'ccccc',
-    'cccccc',
-    'i',
-    'io',
-    'ii',
-    'iii',
-    'iiii',
-    'iiiii',
-    'iiiiii',
-  ]),
-  period: Object.freeze([
-    'a',
-    'aa',
-    'aaa',
-    'aaaa',
-    'aaaaa',
-    'b',
-    'bb',
-    'bbb',
-    'bbbb',
-    'bbbbb',
-    'B',
-    'BB',
-    'BBB',
-    'BBBB',
-    'BBBBB',
-  ]),
-  hour: Object.freeze(['h', 'ho', 'hh', 'H', 'Ho', 'HH', 'K', 'Ko', 'KK', 'k', 'ko', 'kk']),
-  minute: Object.freeze(['m', 'mo', 'mm']),
-  second: Object.freeze(['s', 'so', 'ss']),
-  fraction: Object.freeze(['S', 'SS', 'SSS']),
-  timezone: Object.freeze([
-    'X',
-    'XX',
-    'XXX',
-    'XXXX',
-    'XXXXX',
-    'x',
-    'xx',
-    'xxx',
-    'xxxx',
-    'xxxxx',
-    'O',
-    'OO',
-    'OOO',
-    'OOOO',
-    'z',
-    'zz',
-    'zzz',
-    'zzzz',
-    'Z',
-    'ZZ',
-    'ZZZ',
-    'ZZZZ',
-    'ZZZZZ',
-  ]),
-  timestamp: Object.freeze(['t', 'T']),
-});
-
-/**
- * Get all valid tokens as a flat array (internal helper)
- */
-function getAllTokens(): string[] {
-  return Object.values(FORMAT_TOKENS).flat();
-}
+export { FORMAT_TOKENS } from '../utils/formatCompiler';
 
 /**
  * Validates format string for security and correctness
@@ -154,20 +27,8 @@ function getAllTokens(): string[] {
 function isValidFormatString(format: string): boolean {
   debug.validation('isValidFormatString called with: %s', format);
 
-  // Check for dangerous characters that should never appear
-  const dangerousChars = /[;&|`$<>{}\\]/;
-  if (dangerousChars.test(format)) {
-    debug.validation('Format contains dangerous characters');
-    return false;
-  }
-
-  // Build pattern from tokens
-  const validTokens = getAllTokens();
-  // eslint-disable-next-line security/detect-non-literal-regexp -- Building from known safe tokens
-  const tokenPattern = new RegExp(`^(?:${validTokens.join('|')}|'[^']*'|[\\s\\-:.,/()\\[\\]])+$`);
-
-  // Check if format string matches allowed pattern
-  const isValid = tokenPattern.test(format);
+  // Checked against the allow-list once per distinct format
+  const isValid = compileFormat(format).valid;
   debug.validation('Format validation result: %s', isValid);
   return isValid;
 }
@@ -276,12 +137,12 @@ export function formatRelativeTime(date: Date, timezone: string): string {
   const now = new Date();
 
   // Format time in the target timezone
-  const timeStr = formatInTimeZone(date, timezone, 'h:mm a');
-  const dayOfWeek = formatInTimeZone(date, timezone, 'EEEE');
+  const timeStr = formatCompiled(date, timezone, compileFormat('h:mm a'));
+  const dayOfWeek = formatCompiled(date, timezone, compileFormat('EEEE'));
 
   // Calculate day difference considering timezone
-  const dateInTz = toZonedTime(date, timezone);
-  const nowInTz = toZonedTime(now, timezone);
+  const dateInTz = toZonedDate(date, timezone);
+  const nowInTz = toZonedDate(now, timezone);
   const daysDiff = differenceInDays(startOfDay(dateInTz), startOfDay(nowInTz));
 
   // Build relative string manually
@@ -303,7 +164,7 @@ export function formatRelativeTime(date: Date, timezone: string): string {
     formatted = `${dayOfWeek} at ${timeStr}`;
   } else {
     // Beyond a week, show date
-    const dateStr = formatInTimeZone(date, timezone, 'MM/dd/yyyy');
+    const dateStr = formatCompiled(date, timezone, compileFormat('MM/dd/yyyy'));
     formatted = `${dateStr} at ${timeStr}`;
   }
 
@@ -329,13 +190,34 @@ export function formatCustomTime(date: Date, customFormat: string, timezone: str
   }
 
   debug.timing('Formatting with: %s', customFormat);
-  // Always use formatInTimeZone for consistency
-  const formatted = formatInTimeZone(date, timezone, customFormat);
+  const formatted = formatCompiled(date, timezone, compileFormat(customFormat));
 
   debug.timing('Custom formatted result: %s', formatted);
   return formatted;
 }
 
+/**
+ * Canonical cache key - output depends on the instant, the display timezone
+ * and the effective format ("calendar" is an alias of "relative", which
+ * ignores custom_format)
+ */
+export function getCanonicalCacheKey(
+  params: FormatTimeParams,
+  formatType: string,
+  timezone: string
+): string | undefined {
+  const tz = canonicalTimezone(timezone);
+  if (tz === undefined) {
+    return undefined;
+  }
+  const instant = canonicalInstant(params.time, timezone);
+  if (instant === undefined) {
+    return undefined;
+  }
+  const format = formatType === 'custom' ? `custom:${params.custom_format ?? ''}` : 'relative';
+  return `canonical:format_time:${instant}:${tz}:${format}`;
+}
+
 /**
  * Main formatTime function with reduced complexity
  * Orchestrates the formatting process using extracted helpers
@@ -350,7 +232,8 @@ export function formatTime(params: FormatTimeParams): FormatTimeResult {
   const config = getConfig();
   const timezone = resolveTimezone(params.timezone, config.defaultTimezone);
 
-  // Use withCache wrapper
+  // Relative output is only correct until the local date changes
+  let validUntil: number | undefined;
   return withCache(
     `format_time_${params.time}_${formatType}_${params.custom_format ?? ''}_${timezone}`,
     CacheTTL.TIMEZONE_CONVERT,
@@ -364,6 +247,7 @@ export function formatTime(params: FormatTimeParams): FormatTimeResult {
       switch (formatType) {
         case 'relative':
         case 'calendar':
+          validUntil = getNextLocalMidnight(new Date(), timezone).getTime();
           formatted = formatRelativeTime(date, timezone);
           break;
 
@@ -385,6 +269,10 @@ export function formatTime(params: FormatTimeParams): FormatTimeResult {
 
       debug.timing('formatTime returning: %O', result);
       return result;
+    },
+    {
+      canonicalKey: () => getCanonicalCacheKey(params, formatType, timezone),
+      validUntil: () => validUntil,
     }
   );
 }
@@ -1,19 +1,21 @@
-import { eachDayOfInterval, format } from 'date-fns';
+import { format } from 'date-fns';
 
 import { TimezoneError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
+import { toEpochDay } from '../data/holidays';
 import type { GetBusinessDaysParams, GetBusinessDaysResult } from '../types';
+import { countBusinessDays } from '../utils/businessDayCounter';
 import {
   validateHolidayCalendar,
   validateDateRange,
-  categorizeDays,
   adjustForWeekends,
 } from '../utils/businessDayHelpers';
 import { parseDateWithTimezone } from '../utils/businessUtils';
 import { buildCacheKey } from '../utils/cacheKeyBuilder';
+import { canonicalInstant, canonicalList, canonicalTimezone } from '../utils/canonicalKey';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
-import { aggregateHolidays } from '../utils/holidayAggregator';
+import { aggregateExplicitHolidayDays } from '../utils/holidayAggregator';
 import { resolveTimezone } from '../utils/timezoneUtils';
 import {
   validateTimezone,
@@ -65,82 +67,119 @@ export function getBusinessDays(params: GetBusinessDaysParams): GetBusinessDaysR
     optional: { calendar: holiday_calendar },
   });
 
+  const canonicalKey = (): string | undefined =>
+    getCanonicalCacheKey(params, timezone, excludeWeekends, includeObserved);
+
   // Use withCache wrapper
-  return withCache(cacheKey, CacheTTL.BUSINESS_DAYS, () => {
-    // Validate timezone if provided
-    if (timezone && !validateTimezone(timezone)) {
-      debug.error('Invalid timezone: %s', timezone);
-      throw new TimezoneError(`Invalid timezone: ${timezone}`, timezone);
-    }
-
-    // Validate holiday_calendar if provided
-    if (holiday_calendar) {
-      validateHolidayCalendar(holiday_calendar);
-    }
-
-    // Parse dates
-    const startDate = parseDateWithTimezone(start_date, timezone, 'start_date');
-    const endDate = parseDateWithTimezone(end_date, timezone, 'end_date');
-
-    // DoS protection: Validate date range
-    validateDateRange(startDate, endDate, start_date, end_date);
-
-    // Log calculation context
-    debug.business(
-      'Business days calculation: %s to %s',
-      format(startDate, 'yyyy-MM-dd'),
-      format(endDate, 'yyyy-MM-dd')
-    );
-
-    // Use the new holidayAggregator utility
-    debug.holidays('Aggregating holidays for calendar: %s', holiday_calendar ?? 'none');
-    const allHolidayDates = aggregateHolidays({
-      calendar: holiday_calendar,
-      includeObserved,
-      dateRange: {
-        start: startDate,
-        end: endDate,
-      },
-      custom: custom_holidays,
-      legacy: holidays,
-      timezone,
-    });
-    debug.holidays('Total holidays found: %d', allHolidayDates.size);
-    if (allHolidayDates.size > 0) {
-      debug.holidays('Holiday dates: %O', Array.from(allHolidayDates));
-    }
-
-    // Get all days in the interval
-    const days = eachDayOfInterval({
-      start: startDate,
-      end: endDate,
-    });
-    debug.timing('Processing %d days from %s to %s', days.length, start_date, end_date);
-
-    // Categorize days into business, weekend, and holiday
-    const categories = categorizeDays(days, allHolidayDates);
-
-    // Adjust for weekend inclusion preference
-    const adjustedCategories = adjustForWeekends(categories, excludeWeekends);
-
-    const { businessDays, weekendDays, holidayCount } = adjustedCategories;
-
-    // Log summary
-    debug.business(
-      'Calculated business days: %d of %d total days (%d weekends, %d holidays)',
-      businessDays,
-      days.length,
-      weekendDays,
-      holidayCount
-    );
-
-    const result: GetBusinessDaysResult = {
-      total_days: days.length,
-      business_days: businessDays,
-      weekend_days: weekendDays,
-      holiday_count: holidayCount,
-    };
-
-    return result;
-  });
+  return withCache(
+    cacheKey,
+    CacheTTL.BUSINESS_DAYS,
+    () => {
+      // Validate timezone if provided
+      if (timezone && !validateTimezone(timezone)) {
+        debug.error('Invalid timezone: %s', timezone);
+        throw new TimezoneError(`Invalid timezone: ${timezone}`, timezone);
+      }
+
+      // Validate holiday_calendar if provided
+      if (holiday_calendar) {
+        validateHolidayCalendar(holiday_calendar);
+      }
+
+      // Parse dates
+      const startDate = parseDateWithTimezone(start_date, timezone, 'start_date');
+      const endDate = parseDateWithTimezone(end_date, timezone, 'end_date');
+
+      // DoS protection: Validate date range
+      validateDateRange(startDate, endDate, start_date, end_date);
+
+      // Log calculation context
+      debug.business(
+        'Business days calculation: %s to %s',
+        format(startDate, 'yyyy-MM-dd'),
+        format(endDate, 'yyyy-MM-dd')
+      );
+
+      // Calendar holidays come from prefix sums; only explicit dates are collected
+      debug.holidays('Holiday calendar: %s', holiday_calendar ?? 'none');
+      const extraHolidays = aggregateExplicitHolidayDays({
+        includeObserved,
+        dateRange: {
+          start: startDate,
+          end: endDate,
+        },
+        custom: custom_holidays,
+        legacy: holidays,
+        timezone,
+      });
+      debug.holidays('Explicit holidays found: %d', extraHolidays.size);
+
+      const startDay = toEpochDay(startDate);
+      const endDay = toEpochDay(endDate);
+      const totalDays = Math.abs(endDay - startDay) + 1;
+      debug.timing('Counting %d days from %s to %s', totalDays, start_date, end_date);
+
+      // Categorize days into business, weekend, and holiday
+      const categories = countBusinessDays({
+        startDay,
+        endDay,
+        calendar: holiday_calendar,
+        includeObserved,
+        extraHolidays,
+      });
+
+      // Adjust for weekend inclusion preference
+      const adjustedCategories = adjustForWeekends(categories, excludeWeekends);
+
+      const { businessDays, weekendDays, holidayCount } = adjustedCategories;
+
+      // Log summary
+      debug.business(
+        'Calculated business days: %d of %d total days (%d weekends, %d holidays)',
+        businessDays,
+        totalDays,
+        weekendDays,
+        holidayCount
+      );
+
+      const result: GetBusinessDaysResult = {
+        total_days: totalDays,
+        business_days: businessDays,
+        weekend_days: weekendDays,
+        holiday_count: holidayCount,
+      };
+
+      return result;
+    },
+    { canonicalKey }
+  );
+}
+
+/**
+ * Canonical cache key - the counts depend on the parsed range, the calendar
+ * timezone and the holiday sets, not on how dates are written or ordered
+ */
+function getCanonicalCacheKey(
+  params: GetBusinessDaysParams,
+  timezone: string,
+  excludeWeekends: boolean,
+  includeObserved: boolean
+): string | undefined {
+  const tz = canonicalTimezone(timezone);
+  if (tz === undefined) {
+    return undefined;
+  }
+  const start = canonicalInstant(params.start_date, timezone);
+  const end = canonicalInstant(params.end_date, timezone);
+  if (start === undefined || end === undefined) {
+    return undefined;
+  }
+  return `canonical:business:${JSON.stringify([
+    start,
+    end,
+    tz,
+    excludeWeekends,
+    includeObserved,
+    params.holiday_calendar ?? null,
+  ])}:${canonicalList(params.holidays ?? [])}:${canonicalList(params.custom_holidays ?? [])}`;
 }
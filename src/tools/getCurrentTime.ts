@@ -1,10 +1,9 @@
-import { formatInTimeZone } from 'date-fns-tz';
-
 import { ValidationError, TimezoneError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type { GetCurrentTimeParams, GetCurrentTimeResult } from '../types';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
+import { compileFormat, formatCompiled } from '../utils/formatCompiler';
 import { resolveTimezone } from '../utils/timezoneUtils';
 import { validateTimezone, validateStringLength, LIMITS } from '../utils/validation';
 import { withCache } from '../utils/withCache';
@@ -28,13 +27,13 @@ export function formatTimeWithOptions(
 ): string {
   if (params.include_offset !== false && !params.format) {
     // Default format includes offset
-    return formatInTimeZone(now, timezone, defaultFormat);
+    return formatCompiled(now, timezone, compileFormat(defaultFormat));
   } else if (params.include_offset === false && params.format) {
     // Custom format without offset - use the format as-is
-    return formatInTimeZone(now, timezone, params.format);
+    return formatCompiled(now, timezone, compileFormat(params.format));
   } else {
     // Use format string as provided (default or custom)
-    return formatInTimeZone(now, timezone, defaultFormat);
+    return formatCompiled(now, timezone, compileFormat(defaultFormat));
   }
 }
 
@@ -47,14 +46,14 @@ export function buildTimeResult(
   timezone: string
 ): GetCurrentTimeResult {
   // Get offset separately for the result object
-  const offset = timezone === 'UTC' ? 'Z' : formatInTimeZone(now, timezone, 'XXX');
+  const offset = timezone === 'UTC' ? 'Z' : formatCompiled(now, timezone, compileFormat('XXX'));
 
   return {
     time: formattedTime,
     timezone: timezone,
     offset: offset,
     unix: Math.floor(now.getTime() / 1000),
-    iso: formatInTimeZone(now, timezone, "yyyy-MM-dd'T'HH:mm:ss.SSSXXX"),
+    iso: formatCompiled(now, timezone, compileFormat("yyyy-MM-dd'T'HH:mm:ss.SSSXXX")),
   };
 }
 
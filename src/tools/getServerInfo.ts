@@ -1,12 +1,12 @@
 /**
  * Get server version and build information
  * Implementation based on TDD tests and verified behavior
+ *
+ * Git details come from the build (see utils/buildInfo); nothing is
+ * detected at request time.
  */
 
-import { execSync } from 'child_process';
-import * as fs from 'fs';
-import * as path from 'path';
-
+import { BUILD_INFO } from '../utils/buildInfo';
 import { debug } from '../utils/debug';
 
 interface ServerInfo {
@@ -20,82 +20,8 @@ interface ServerInfo {
   timezone: string;
 }
 
-interface VersionJson {
-  version?: string;
-  revision?: string;
-  branch?: string;
-  dirty?: boolean;
-  buildDate?: string;
-  buildNumber?: string;
-}
-
-/**
- * Get git revision (short hash)
- */
-function getGitRevision(): string {
-  try {
-    return execSync('git rev-parse --short HEAD', { encoding: 'utf8' }).trim();
-  } catch {
-    return 'unknown';
-  }
-}
-
-/**
- * Get git branch name
- */
-function getGitBranch(): string {
-  try {
-    return execSync('git rev-parse --abbrev-ref HEAD', { encoding: 'utf8' }).trim();
-  } catch {
-    return 'unknown';
-  }
-}
-
-/**
- * Check if working directory is dirty
- */
-function getGitDirtyStatus(): boolean | undefined {
-  try {
-    const status = execSync('git status --porcelain', { encoding: 'utf8' });
-    return status.length > 0;
-  } catch {
-    return undefined;
-  }
-}
-
-/**
- * Get package version from package.json
- */
-function getPackageVersion(): string {
-  try {
-    const packagePath = path.join(__dirname, '../../package.json');
-    // eslint-disable-next-line security/detect-non-literal-fs-filename
-    const packageContent = fs.readFileSync(packagePath, 'utf8');
-    const packageData = JSON.parse(packageContent) as { version?: string };
-    return packageData.version ?? '1.0.0';
-  } catch {
-    return '1.0.0';
-  }
-}
-
-/**
- * Read version.json if it exists
- */
-function readVersionJson(): VersionJson | null {
-  try {
-    const versionPath = path.join(__dirname, '../version.json');
-    // eslint-disable-next-line security/detect-non-literal-fs-filename
-    const content = fs.readFileSync(versionPath, 'utf8');
-    const parsed = JSON.parse(content) as unknown;
-    // Type guard to ensure it's a VersionJson
-    if (parsed && typeof parsed === 'object') {
-      return parsed as VersionJson;
-    }
-    return null;
-  } catch {
-    return null;
-  }
-}
+// Nothing in the payload changes while the process runs
+let cachedInfo: ServerInfo | null = null;
 
 /**
  * Get server information including version and revision
@@ -103,16 +29,15 @@ function readVersionJson(): VersionJson | null {
  */
 export function getServerInfo(_params?: unknown): ServerInfo {
   debug.server('getServerInfo called');
+  cachedInfo ??= buildServerInfo();
+  return cachedInfo;
+}
 
-  // Try to read build-time version info first
-  const versionJson = readVersionJson();
-
-  // Always use package.json for version (source of truth)
-  const version = getPackageVersion();
-
-  // Use build-time info if available, otherwise detect at runtime
-  const revision = versionJson?.revision ?? getGitRevision();
-  const branch = versionJson?.branch ?? getGitBranch();
+/**
+ * Assemble the payload from the build information
+ */
+function buildServerInfo(): ServerInfo {
+  const { version, revision, branch, dirty, buildDate, buildNumber } = BUILD_INFO;
 
   // Build the response
   const info: ServerInfo = {
@@ -124,16 +49,14 @@ export function getServerInfo(_params?: unknown): ServerInfo {
   };
 
   // Add optional fields if available
-  if (versionJson?.buildDate) {
-    info.build_date = versionJson.buildDate;
+  if (buildDate) {
+    info.build_date = buildDate;
   }
 
-  if (versionJson?.buildNumber) {
-    info.build_number = versionJson.buildNumber;
+  if (buildNumber) {
+    info.build_number = buildNumber;
   }
 
-  // Include dirty status if available
-  const dirty = versionJson?.dirty ?? getGitDirtyStatus();
   if (dirty !== undefined) {
     info.dirty = dirty;
   }
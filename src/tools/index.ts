@@ -5,6 +5,8 @@ export { addTime } from './addTime';
 export { subtractTime } from './subtractTime';
 export { calculateDuration } from './calculateDuration';
 export { getBusinessDays } from './getBusinessDays';
+export { addBusinessDays } from './addBusinessDays';
+export { subtractBusinessDays } from './subtractBusinessDays';
 export { getServerInfo } from './getServerInfo';
 export { nextOccurrence } from './nextOccurrence';
 export { formatTime } from './formatTime';
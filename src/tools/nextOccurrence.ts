@@ -1,16 +1,17 @@
 import { differenceInDays, startOfDay } from 'date-fns';
-import { toZonedTime } from 'date-fns-tz';
 
 import { TimezoneError, DateParsingError, TimeCalculationError } from '../adapters/mcp-sdk';
 import { CacheTTL } from '../cache/timeCache';
 import type { NextOccurrenceParams, NextOccurrenceResult } from '../types';
 import type { RecurrenceParams } from '../types/recurrence';
+import { canonicalInstant, canonicalTimezone } from '../utils/canonicalKey';
 import { getConfig } from '../utils/config';
 import { debug } from '../utils/debug';
 import { parseTimeInput } from '../utils/parseTimeInput';
-import { resolveTimezone } from '../utils/timezoneUtils';
+import { getNextLocalMidnight, resolveTimezone } from '../utils/timezoneUtils';
 import { validateTimezone, validateDateString } from '../utils/validation';
 import { withCache } from '../utils/withCache';
+import { toZonedDate } from '../utils/zoneOffsets';
 
 import { RecurrenceFactory } from './recurrence/RecurrenceFactory';
 
@@ -69,8 +70,8 @@ function calculateDaysUntil(nextDate: Date, timezone: string): number {
     timezone
   );
   const now = new Date();
-  const nowZoned = timezone === 'UTC' ? now : toZonedTime(now, timezone);
-  const nextZoned = timezone === 'UTC' ? nextDate : toZonedTime(nextDate, timezone);
+  const nowZoned = timezone === 'UTC' ? now : toZonedDate(now, timezone);
+  const nextZoned = timezone === 'UTC' ? nextDate : toZonedDate(nextDate, timezone);
   const daysUntil = differenceInDays(startOfDay(nextZoned), startOfDay(nowZoned));
   debug.recurrence('Days until next occurrence: %d', daysUntil);
   return Math.max(0, daysUntil);
@@ -93,6 +94,54 @@ function getCacheKey(
   return `nextOccurrence:${JSON.stringify(cacheParams)}`;
 }
 
+/**
+ * Generate the canonical cache key for nextOccurrence
+ * Only used when start_from is given - without it the result depends on now
+ */
+function getCanonicalCacheKey(params: NextOccurrenceParams, timezone: string): string | undefined {
+  const tz = canonicalTimezone(timezone);
+  if (tz === undefined || !params.start_from) {
+    return undefined;
+  }
+  const start = canonicalInstant(params.start_from, timezone);
+  if (start === undefined) {
+    return undefined;
+  }
+  const { pattern, day_of_week, day_of_month, time } = params;
+  return `canonical:nextOccurrence:${JSON.stringify([
+    pattern,
+    start,
+    day_of_week ?? null,
+    day_of_month ?? null,
+    time ?? null,
+    tz,
+  ])}`;
+}
+
+/**
+ * When a result stops being correct (epoch ms)
+ *
+ * days_until rolls over at local midnight. Without start_from the
+ * occurrence itself also moves once it has passed - except for patterns
+ * that slide with the current time (no time of day, yearly), which keep
+ * the fixed TTL.
+ */
+function getValidUntil(
+  params: NextOccurrenceParams,
+  result: NextOccurrenceResult,
+  now: Date,
+  timezone: string
+): number | undefined {
+  const midnight = getNextLocalMidnight(now, timezone).getTime();
+  if (params.start_from) {
+    return midnight;
+  }
+  if (params.pattern === 'yearly' || (params.pattern !== 'monthly' && !params.time)) {
+    return undefined;
+  }
+  return Math.min(midnight, Date.parse(result.next));
+}
+
 /**
  * Calculate the next occurrence and format the result
  */
@@ -177,13 +226,25 @@ export function nextOccurrence(params: NextOccurrenceParams): NextOccurrenceResu
   const cacheKey = getCacheKey(params, fallbackTimezone, timezone);
 
   // Use withCache wrapper instead of manual cache management
-  return withCache(cacheKey, CacheTTL.CALCULATIONS, () => {
-    try {
-      const result = calculateNextOccurrence(params, timezone);
-      debug.recurrence('nextOccurrence returning: %O', result);
-      return result;
-    } catch (error) {
-      handleCalculationError(error);
+  let validUntil: number | undefined;
+  return withCache(
+    cacheKey,
+    CacheTTL.CALCULATIONS,
+    () => {
+      try {
+        // Taken before calculating so a midnight crossed meanwhile expires the entry
+        const now = new Date();
+        const result = calculateNextOccurrence(params, timezone);
+        validUntil = getValidUntil(params, result, now, timezone);
+        debug.recurrence('nextOccurrence returning: %O', result);
+        return result;
+      } catch (error) {
+        handleCalculationError(error);
+      }
+    },
+    {
+      canonicalKey: () => getCanonicalCacheKey(params, timezone),
+      validUntil: () => validUntil,
     }
-  });
+  );
 }
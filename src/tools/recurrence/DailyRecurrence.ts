@@ -1,7 +1,7 @@
 import { addDays, isAfter, setHours, setMinutes, setSeconds, setMilliseconds } from 'date-fns';
-import { fromZonedTime, toZonedTime } from 'date-fns-tz';
 
 import type { RecurrencePattern, DailyParams } from '../../types/recurrence';
+import { fromZonedDate, toZonedDate } from '../../utils/zoneOffsets';
 
 export class DailyRecurrence implements RecurrencePattern {
   calculate(from: Date, params: DailyParams): Date {
@@ -40,7 +40,7 @@ export class DailyRecurrence implements RecurrencePattern {
 
   private calculateInTimezone(from: Date, hours: number, minutes: number, timezone: string): Date {
     // Convert to target timezone
-    const zonedFrom = toZonedTime(from, timezone);
+    const zonedFrom = toZonedDate(from, timezone);
 
     // Set the time in the timezone
     let result = new Date(zonedFrom);
@@ -55,6 +55,6 @@ export class DailyRecurrence implements RecurrencePattern {
     }
 
     // Convert back to UTC
-    return fromZonedTime(result, timezone);
+    return fromZonedDate(result, timezone);
   }
 }
@@ -1,6 +1,5 @@
-import { toZonedTime, fromZonedTime } from 'date-fns-tz';
-
 import type { RecurrencePattern, MonthlyParams } from '../../types/recurrence';
+import { fromZonedDate, toZonedDate } from '../../utils/zoneOffsets';
 
 export class MonthlyRecurrence implements RecurrencePattern {
   calculate(from: Date, params: MonthlyParams): Date {
@@ -53,7 +52,7 @@ export class MonthlyRecurrence implements RecurrencePattern {
     const targetTime = params.time;
 
     // Convert to timezone for calculations
-    const fromInTz = toZonedTime(from, timezone);
+    const fromInTz = toZonedDate(from, timezone);
     const year = fromInTz.getFullYear();
     const month = fromInTz.getMonth();
 
@@ -113,13 +112,13 @@ export class MonthlyRecurrence implements RecurrencePattern {
     }
 
     // Create date in timezone context
-    return fromZonedTime(new Date(year, month, actualDay), timezone);
+    return fromZonedDate(new Date(year, month, actualDay), timezone);
   }
 
   private setTimeInTimezone(date: Date, timeStr: string, timezone: string): Date {
     const [hours, minutes] = timeStr.split(':').map(Number);
-    const dateInTz = toZonedTime(date, timezone);
+    const dateInTz = toZonedDate(date, timezone);
     dateInTz.setHours(hours, minutes, 0, 0);
-    return fromZonedTime(dateInTz, timezone);
+    return fromZonedDate(dateInTz, timezone);
   }
 }
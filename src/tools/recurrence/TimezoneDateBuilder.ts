@@ -1,5 +1,6 @@
 import { addDays, isAfter, setHours, setMilliseconds, setMinutes, setSeconds } from 'date-fns';
-import { fromZonedTime, toZonedTime } from 'date-fns-tz';
+
+import { fromZonedDate, toZonedDate } from '../../utils/zoneOffsets';
 
 export function setTimeInTimezone(
   date: Date,
@@ -17,7 +18,7 @@ export function setTimeInTimezone(
   }
 
   // Convert to target timezone
-  const zonedDate = toZonedTime(date, timezone);
+  const zonedDate = toZonedDate(date, timezone);
 
   // Set the time in that timezone
   let result = new Date(zonedDate);
@@ -27,7 +28,7 @@ export function setTimeInTimezone(
   result = setMilliseconds(result, 0);
 
   // Convert back to UTC
-  return fromZonedTime(result, timezone);
+  return fromZonedDate(result, timezone);
 }
 
 export function addDaysInTimezone(date: Date, days: number, timezone: string): Date {
@@ -37,9 +38,9 @@ export function addDaysInTimezone(date: Date, days: number, timezone: string): D
 
   // Convert to timezone, add days, convert back
   // This preserves the local time across DST boundaries
-  const zonedDate = toZonedTime(date, timezone);
+  const zonedDate = toZonedDate(date, timezone);
   const resultInZone = addDays(zonedDate, days);
-  return fromZonedTime(resultInZone, timezone);
+  return fromZonedDate(resultInZone, timezone);
 }
 
 export function isTimeInFuture(time: Date, referenceTime: Date): boolean {
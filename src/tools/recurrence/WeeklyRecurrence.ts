@@ -1,7 +1,7 @@
 import { addDays, addWeeks, getDay } from 'date-fns';
-import { toZonedTime } from 'date-fns-tz';
 
 import type { RecurrencePattern, WeeklyParams } from '../../types/recurrence';
+import { toZonedDate } from '../../utils/zoneOffsets';
 
 import { isTimeInFuture, setTimeInTimezone } from './TimezoneDateBuilder';
 
@@ -42,7 +42,7 @@ export class WeeklyRecurrence implements RecurrencePattern {
       return getDay(from);
     }
 
-    const zonedFrom = toZonedTime(from, timezone);
+    const zonedFrom = toZonedDate(from, timezone);
     return getDay(zonedFrom);
   }
 
@@ -52,7 +52,7 @@ export class WeeklyRecurrence implements RecurrencePattern {
     if (timezone === '' || timezone === 'UTC') {
       currentDay = getDay(from);
     } else {
-      const zonedFrom = toZonedTime(from, timezone);
+      const zonedFrom = toZonedDate(from, timezone);
       currentDay = getDay(zonedFrom);
     }
 
@@ -1,7 +1,7 @@
 import { addYears } from 'date-fns';
-import { toZonedTime, fromZonedTime } from 'date-fns-tz';
 
 import type { RecurrencePattern, YearlyParams } from '../../types/recurrence';
+import { fromZonedDate, toZonedDate } from '../../utils/zoneOffsets';
 
 export class YearlyRecurrence implements RecurrencePattern {
   calculate(from: Date, params: YearlyParams): Date {
@@ -31,7 +31,7 @@ export class YearlyRecurrence implements RecurrencePattern {
     }
 
     // Timezone-aware calculation
-    const fromInTz = toZonedTime(from, timezone);
+    const fromInTz = toZonedDate(from, timezone);
     const nextDate = addYears(fromInTz, 1);
 
     // If time is specified, update it
@@ -40,7 +40,7 @@ export class YearlyRecurrence implements RecurrencePattern {
       nextDate.setHours(hours, minutes, 0, 0);
     }
 
-    return fromZonedTime(nextDate, timezone);
+    return fromZonedDate(nextDate, timezone);
   }
 
   private calculateSpecificDate(from: Date, params: YearlyParams, timezone: string): Date {
@@ -89,7 +89,7 @@ export class YearlyRecurrence implements RecurrencePattern {
     targetTime: string | undefined,
     timezone: string,
   ): Date {
-    const fromInTz = toZonedTime(from, timezone);
+    const fromInTz = toZonedDate(from, timezone);
     const fromYear = fromInTz.getFullYear();
 
     let targetDate = this.createTimezoneDate(fromYear, targetMonth, targetDay, timezone);
@@ -97,9 +97,9 @@ export class YearlyRecurrence implements RecurrencePattern {
     // Set time if specified
     if (targetTime) {
       const [hours, minutes] = targetTime.split(':').map(Number);
-      const dateInTz = toZonedTime(targetDate, timezone);
+      const dateInTz = toZonedDate(targetDate, timezone);
       dateInTz.setHours(hours, minutes, 0, 0);
-      targetDate = fromZonedTime(dateInTz, timezone);
+      targetDate = fromZonedDate(dateInTz, timezone);
     }
 
     // If the target date has passed, advance to next year
@@ -107,9 +107,9 @@ export class YearlyRecurrence implements RecurrencePattern {
       targetDate = this.createTimezoneDate(fromYear + 1, targetMonth, targetDay, timezone);
       if (targetTime) {
         const [hours, minutes] = targetTime.split(':').map(Number);
-        const dateInTz = toZonedTime(targetDate, timezone);
+        const dateInTz = toZonedDate(targetDate, timezone);
         dateInTz.setHours(hours, minutes, 0, 0);
-        targetDate = fromZonedTime(dateInTz, timezone);
+        targetDate = fromZonedDate(dateInTz, timezone);
       }
     }
 
@@ -147,6 +147,6 @@ export class YearlyRecurrence implements RecurrencePattern {
     }
 
     // Create date in timezone context
-    return fromZonedTime(new Date(year, month, actualDay), timezone);
+    return fromZonedDate(new Date(year, month, actualDay), timezone);
   }
 }
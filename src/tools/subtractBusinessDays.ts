@@ -0,0 +1,21 @@
+import type { SubtractBusinessDaysParams, SubtractBusinessDaysResult } from '../types';
+import { debug } from '../utils/debug';
+
+import { addBusinessDays, validateBusinessDayCount } from './addBusinessDays';
+
+/**
+ * Step back a number of business days
+ *
+ * Not cached here: addBusinessDays caches the negated call under its own key.
+ */
+export function subtractBusinessDays(
+  params: SubtractBusinessDaysParams
+): SubtractBusinessDaysResult {
+  debug.business('subtractBusinessDays called with params: %O', params);
+  validateBusinessDayCount(params.days);
+
+  debug.business('Delegating to addBusinessDays with negated days: %d', -params.days);
+
+  // Stepping backwards is stepping forwards a negative number of days
+  return addBusinessDays({ ...params, days: -params.days });
+}
@@ -110,6 +110,29 @@ export interface GetBusinessDaysResult {
   holiday_count: number;
 }
 
+export interface AddBusinessDaysParams {
+  start_date: string;
+  days: number;
+  exclude_weekends?: boolean;
+  holidays?: string[];
+  timezone?: string;
+  holiday_calendar?: string;
+  include_observed?: boolean;
+  custom_holidays?: string[];
+}
+
+export type SubtractBusinessDaysParams = AddBusinessDaysParams;
+
+export interface BusinessDayStepResult {
+  start_date: string;
+  result_date: string;
+  business_days: number;
+  calendar_days: number;
+}
+
+export type AddBusinessDaysResult = BusinessDayStepResult;
+export type SubtractBusinessDaysResult = BusinessDayStepResult;
+
 export interface NextOccurrenceParams {
   pattern: RecurrencePattern;
   start_from?: string;
@@ -154,8 +177,16 @@ export interface CalculateBusinessHoursParams {
   timezone?: string;
   holidays?: string[];
   include_weekends?: boolean;
+  /** Per-day breakdown: 'full' (default), 'none' or 'paged' */
+  breakdown?: BusinessHoursBreakdown;
+  /** Days per page when breakdown is 'paged' (default: 31) */
+  page_size?: number;
+  /** next_cursor of the previous page when breakdown is 'paged' */
+  cursor?: string;
 }
 
+export type BusinessHoursBreakdown = 'none' | 'full' | 'paged';
+
 export interface DayBusinessHours {
   date: string;
   day_of_week: string;
@@ -167,7 +198,23 @@ export interface DayBusinessHours {
 export interface CalculateBusinessHoursResult {
   total_business_minutes: number;
   total_business_hours: number;
+  /** Empty when breakdown is 'none'; one page when it is 'paged' */
+  breakdown: DayBusinessHours[];
+  /** Days in the range (breakdown 'none' or 'paged') */
+  total_days?: number;
+  /** Cursor for the next page; absent on the last page */
+  next_cursor?: string;
+}
+
+export interface BusinessHoursSummary {
+  total_business_minutes: number;
+  total_business_hours: number;
+  total_days: number;
+}
+
+export interface BusinessHoursPage {
   breakdown: DayBusinessHours[];
+  next_cursor?: string;
 }
 
 export interface DaysUntilParams {
@@ -0,0 +1,59 @@
+/**
+ * Build information, loaded once at module init
+ *
+ * scripts/update-version.js (run as prebuild) is the single source of the
+ * git revision, branch, dirty flag, build date and build number: it stamps
+ * them into version.json next to the compiled code. Nothing here runs git.
+ * In an installed package there is no repository to ask, and a synchronous
+ * subprocess on the request path blocks the event loop for tens of
+ * milliseconds. Fields a missing or malformed version.json can't supply
+ * are reported as unknown.
+ */
+
+import * as fs from 'fs';
+import * as path from 'path';
+
+export interface BuildInfo {
+  /** Always from package.json */
+  version: string;
+  revision: string;
+  branch: string;
+  dirty?: boolean;
+  buildDate?: string;
+  buildNumber?: string;
+}
+
+interface VersionJson {
+  revision?: string;
+  branch?: string;
+  dirty?: boolean;
+  buildDate?: string;
+  buildNumber?: string;
+}
+
+function readJson(filePath: string): Record<string, unknown> | null {
+  try {
+    // eslint-disable-next-line security/detect-non-literal-fs-filename -- Fixed paths below
+    const parsed = JSON.parse(fs.readFileSync(filePath, 'utf8')) as unknown;
+    return parsed && typeof parsed === 'object' ? (parsed as Record<string, unknown>) : null;
+  } catch {
+    return null;
+  }
+}
+
+function loadBuildInfo(): BuildInfo {
+  const packageJson = readJson(path.join(__dirname, '../../package.json'));
+  const versionJson = (readJson(path.join(__dirname, '../version.json')) ?? {}) as VersionJson;
+  const version = packageJson?.version;
+
+  return {
+    version: typeof version === 'string' ? version : '1.0.0',
+    revision: versionJson.revision ?? 'unknown',
+    branch: versionJson.branch ?? 'unknown',
+    dirty: versionJson.dirty,
+    buildDate: versionJson.buildDate,
+    buildNumber: versionJson.buildNumber,
+  };
+}
+
+export const BUILD_INFO: Readonly<BuildInfo> = Object.freeze(loadBuildInfo());
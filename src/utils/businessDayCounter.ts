@@ -0,0 +1,299 @@
+/**
+ * Business day counting without walking the range
+ *
+ * Weekend days follow from the range length and the weekday of its ends.
+ * Calendar holidays that fall on weekdays come from a prefix sum per
+ * (calendar, observed flag) over the compiled holiday table's span, so a
+ * range inside the span costs two array lookups however long it is. Parts
+ * of a range outside the span are counted year by year from the holiday
+ * index.
+ *
+ * Days are local calendar days as epoch days (see toEpochDay) - the same
+ * days eachDayOfInterval walks. Weekends are Saturday and Sunday, and a
+ * holiday on a weekend counts as a weekend day, as in categorizeDays.
+ */
+
+import { DEFAULT_TABLE_FIRST_YEAR, DEFAULT_TABLE_LAST_YEAR } from '../data/holidayTable';
+import {
+  buildHolidayIndex,
+  fromEpochDay,
+  getHolidayDefinitions,
+  getHolidayIndex,
+  getHolidaysForYear,
+  toEpochDay,
+} from '../data/holidays';
+import type { HolidayIndexMode } from '../data/holidays';
+
+import type { DayCategories } from './businessDayHelpers';
+import { debug } from './debug';
+
+export interface BusinessDayQuery {
+  /** First day of the range (epoch day) */
+  startDay: number;
+  /** Last day of the range, inclusive (epoch day; may precede startDay) */
+  endDay: number;
+  /** Country calendar code (e.g., 'US', 'UK') */
+  calendar?: string;
+  /** Whether calendar holidays count on their observed dates */
+  includeObserved: boolean;
+  /** Custom and legacy holidays (epoch days) */
+  extraHolidays: ReadonlySet<number>;
+}
+
+// Epoch day 0 (1970-01-01) was a Thursday; day -3 was a Monday
+const MONDAY_OFFSET = 3;
+const SPAN_FIRST_DAY = toEpochDay(new Date(DEFAULT_TABLE_FIRST_YEAR, 0, 1));
+const SPAN_END_DAY = toEpochDay(new Date(DEFAULT_TABLE_LAST_YEAR + 1, 0, 1));
+// ~170 KB each; calendar codes are only format-checked, so keep a bound
+const MAX_CALENDAR_PREFIXES = 16;
+const calendarPrefixes = new Map<string, Uint16Array>();
+
+/**
+ * Weekdays (Mon-Fri) before an epoch day, counted from an arbitrary Monday
+ * (only differences are meaningful)
+ */
+function weekdaysBefore(day: number): number {
+  const fromMonday = day + MONDAY_OFFSET;
+  const weeks = Math.floor(fromMonday / 7);
+  return weeks * 5 + Math.min(fromMonday - weeks * 7, 5);
+}
+
+export function isWeekendDay(day: number): boolean {
+  return weekdaysBefore(day + 1) === weekdaysBefore(day);
+}
+
+/**
+ * Weekend days in [first, last]
+ */
+export function countWeekendDays(first: number, last: number): number {
+  return last - first + 1 - (weekdaysBefore(last + 1) - weekdaysBefore(first));
+}
+
+/**
+ * Prefix sums of weekday holidays over the span:
+ * sums[i] = weekday holidays in [SPAN_FIRST_DAY, SPAN_FIRST_DAY + i)
+ */
+function buildCalendarPrefix(calendar: string, mode: HolidayIndexMode): Uint16Array {
+  const length = SPAN_END_DAY - SPAN_FIRST_DAY;
+  const marked = new Uint8Array(length);
+
+  // Neighbouring years contribute observed dates across the span's edges.
+  // Indexes are built directly: one pass over every year would flush the
+  // getHolidayIndex memo.
+  for (let year = DEFAULT_TABLE_FIRST_YEAR - 1; year <= DEFAULT_TABLE_LAST_YEAR + 1; year++) {
+    for (const day of buildHolidayIndex(getHolidaysForYear(calendar, year), year, mode).days) {
+      const offset = day - SPAN_FIRST_DAY;
+      if (offset >= 0 && offset < length && !isWeekendDay(day)) {
+        // eslint-disable-next-line security/detect-object-injection -- numeric index
+        marked[offset] = 1;
+      }
+    }
+  }
+
+  const sums = new Uint16Array(length + 1);
+  for (let i = 0; i < length; i++) {
+    // eslint-disable-next-line security/detect-object-injection -- numeric index
+    sums[i + 1] = sums[i] + marked[i];
+  }
+  debug.business('Built holiday prefix sums for %s (%s): %d days', calendar, mode, sums[length]);
+  return sums;
+}
+
+function getCalendarPrefix(calendar: string, mode: HolidayIndexMode): Uint16Array {
+  const key = `${calendar}:${mode}`;
+  let sums = calendarPrefixes.get(key);
+  if (!sums) {
+    sums = buildCalendarPrefix(calendar, mode);
+    if (calendarPrefixes.size >= MAX_CALENDAR_PREFIXES) {
+      calendarPrefixes.clear();
+    }
+    calendarPrefixes.set(key, sums);
+  }
+  return sums;
+}
+
+/**
+ * Weekday holidays in [first, last] from each year's holiday index
+ */
+function countHolidaysByYear(
+  calendar: string,
+  mode: HolidayIndexMode,
+  first: number,
+  last: number
+): number {
+  const days = new Set<number>();
+  const lastYear = fromEpochDay(last).getFullYear() + 1;
+  for (let year = fromEpochDay(first).getFullYear() - 1; year <= lastYear; year++) {
+    for (const day of getHolidayIndex(calendar, year, mode).days) {
+      if (day >= first && day <= last && !isWeekendDay(day)) {
+        days.add(day);
+      }
+    }
+  }
+  return days.size;
+}
+
+/**
+ * Calendar holidays falling on weekdays in [first, last]
+ */
+export function countCalendarHolidays(
+  calendar: string,
+  includeObserved: boolean,
+  first: number,
+  last: number
+): number {
+  if (getHolidayDefinitions(calendar).length === 0) {
+    return 0;
+  }
+  const mode: HolidayIndexMode = includeObserved ? 'observed' : 'actual';
+  let count = 0;
+
+  const spanFirst = Math.max(first, SPAN_FIRST_DAY);
+  const spanLast = Math.min(last, SPAN_END_DAY - 1);
+  if (spanFirst <= spanLast) {
+    const sums = getCalendarPrefix(calendar, mode);
+    count += sums[spanLast + 1 - SPAN_FIRST_DAY] - sums[spanFirst - SPAN_FIRST_DAY];
+  }
+  if (first < SPAN_FIRST_DAY) {
+    count += countHolidaysByYear(calendar, mode, first, Math.min(last, SPAN_FIRST_DAY - 1));
+  }
+  if (last >= SPAN_END_DAY) {
+    count += countHolidaysByYear(calendar, mode, Math.max(first, SPAN_END_DAY), last);
+  }
+  return count;
+}
+
+/**
+ * Count business, weekend and holiday days in a range (both ends included)
+ *
+ * @returns Same categories categorizeDays produces for the range's days
+ */
+export function countBusinessDays(query: BusinessDayQuery): DayCategories {
+  const { calendar, includeObserved, extraHolidays } = query;
+  const first = Math.min(query.startDay, query.endDay);
+  const last = Math.max(query.startDay, query.endDay);
+
+  const weekendDays = countWeekendDays(first, last);
+  let holidayCount = calendar ? countCalendarHolidays(calendar, includeObserved, first, last) : 0;
+
+  // Explicit holidays count unless they're weekends or already calendar holidays
+  for (const day of extraHolidays) {
+    if (
+      day >= first &&
+      day <= last &&
+      !isWeekendDay(day) &&
+      !(calendar && countCalendarHolidays(calendar, includeObserved, day, day) > 0)
+    ) {
+      holidayCount++;
+    }
+  }
+
+  return {
+    businessDays: last - first + 1 - weekendDays - holidayCount,
+    weekendDays,
+    holidayCount,
+  };
+}
+
+export interface BusinessDayRules {
+  /** Country calendar code (e.g., 'US', 'UK') */
+  calendar?: string;
+  /** Whether calendar holidays count on their observed dates */
+  includeObserved: boolean;
+  /** Whether weekends are non-business days */
+  excludeWeekends: boolean;
+  /** Custom and legacy holidays (epoch days) */
+  extraHolidays: ReadonlySet<number>;
+}
+
+/**
+ * Rank over business days: rank(first, last) is the number of business
+ * days in [first, last], in O(1) plus a binary search over the explicit
+ * holidays. Business days follow getBusinessDays: with weekends included,
+ * a holiday on a weekend still counts as a business day.
+ */
+function createBusinessDayRank(rules: BusinessDayRules): (first: number, last: number) => number {
+  const { calendar, includeObserved, excludeWeekends } = rules;
+  const isCalendarHoliday = (day: number): boolean =>
+    calendar !== undefined && countCalendarHolidays(calendar, includeObserved, day, day) > 0;
+
+  // Explicit holidays that aren't weekends or calendar holidays already
+  const extras = Array.from(rules.extraHolidays)
+    .filter((day) => !isWeekendDay(day) && !isCalendarHoliday(day))
+    .sort((a, b) => a - b);
+  const extrasBefore = (day: number): number => {
+    let lo = 0;
+    let hi = extras.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      // eslint-disable-next-line security/detect-object-injection -- numeric index
+      if (extras[mid] < day) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return lo;
+  };
+
+  return (first, last) => {
+    const holidays =
+      (calendar ? countCalendarHolidays(calendar, includeObserved, first, last) : 0) +
+      extrasBefore(last + 1) -
+      extrasBefore(first);
+    const weekends = excludeWeekends ? countWeekendDays(first, last) : 0;
+    return last - first + 1 - weekends - holidays;
+  };
+}
+
+/**
+ * Step a number of business days from a day (select over the rank)
+ *
+ * The start day itself is never counted: stepping 1 from a Friday lands on
+ * the next business day, usually Monday. Stepping 0 returns the start day.
+ * The distance is found by doubling, then binary search, so a step costs
+ * O(log n) rank queries rather than a walk over n days.
+ *
+ * @param fromDay - Start day (epoch day)
+ * @param amount - Business days to move; negative moves backwards
+ * @param rules - What counts as a business day
+ * @param maxSpan - Largest distance in days to search
+ * @returns Resulting epoch day, or undefined if it lies beyond maxSpan
+ */
+export function stepBusinessDays(
+  fromDay: number,
+  amount: number,
+  rules: BusinessDayRules,
+  maxSpan: number
+): number | undefined {
+  const target = Math.abs(amount);
+  if (target === 0) {
+    return fromDay;
+  }
+  if (target > maxSpan) {
+    return undefined;
+  }
+  const rank = createBusinessDayRank(rules);
+  // Business days within `span` days after (or before) fromDay
+  const reached = (span: number): number =>
+    amount > 0 ? rank(fromDay + 1, fromDay + span) : rank(fromDay - span, fromDay - 1);
+
+  let hi = target;
+  while (reached(hi) < target) {
+    if (hi >= maxSpan) {
+      return undefined;
+    }
+    hi = Math.min(hi * 2, maxSpan);
+  }
+  let lo = 1;
+  while (lo < hi) {
+    const mid = Math.floor((lo + hi) / 2);
+    if (reached(mid) < target) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  debug.business('Stepped %d business days over %d calendar days', amount, lo);
+  return amount > 0 ? fromDay + lo : fromDay - lo;
+}
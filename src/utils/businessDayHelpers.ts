@@ -31,13 +31,20 @@ export function validateHolidayCalendar(calendar: string): void {
   }
 }
 
+/** Longest range business day tools accept: 1000 years, leap days included */
+export const MAX_DATE_RANGE_DAYS = 365250;
+
 /**
- * Validates that a date range doesn't exceed 100 years (DoS protection)
+ * Validates that a date range doesn't exceed 1000 years (DoS protection)
+ *
+ * Counting is O(1) inside the compiled holiday span and O(years) outside
+ * it (see businessDayCounter), so the limit bounds the work for years
+ * that still need rule evaluation.
  * @param startDate - Start date
  * @param endDate - End date
  * @param start_date - Original start date string for error reporting
  * @param end_date - Original end date string for error reporting
- * @throws ValidationError if the date range exceeds 100 years
+ * @throws ValidationError if the date range exceeds 1000 years
  */
 export function validateDateRange(
   startDate: Date,
@@ -47,14 +54,13 @@ export function validateDateRange(
 ): void {
   const daysDifference = Math.abs(endDate.getTime() - startDate.getTime()) / (1000 * 60 * 60 * 24);
 
-  if (daysDifference > 36525) {
-    // Allow exactly 100 years (including leap years)
-    debug.error('Date range too large: %d days (max 36500)', daysDifference);
-    throw new ValidationError('Date range exceeds maximum limit of 100 years', {
+  if (daysDifference > MAX_DATE_RANGE_DAYS) {
+    debug.error('Date range too large: %d days (max 365000)', daysDifference);
+    throw new ValidationError('Date range exceeds maximum limit of 1000 years', {
       start_date,
       end_date,
       days: Math.floor(daysDifference),
-      max_days: 36500,
+      max_days: 365000,
     });
   }
 }
@@ -105,11 +111,11 @@ export function adjustForWeekends(
   excludeWeekends: boolean
 ): DayCategories {
   if (!excludeWeekends) {
-    debug.decision('Including weekends', {
+    debug.decision('Including weekends', () => ({
       weekendDays: categories.weekendDays,
       businessDaysBefore: categories.businessDays,
       businessDaysAfter: categories.businessDays + categories.weekendDays,
-    });
+    }));
 
     return {
       ...categories,
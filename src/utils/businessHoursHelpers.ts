@@ -5,12 +5,13 @@
  */
 
 import { format, differenceInMinutes, eachDayOfInterval } from 'date-fns';
-import { formatInTimeZone } from 'date-fns-tz';
 
 import { ValidationError } from '../adapters/mcp-sdk/errors';
 import type { BusinessHours, WeeklyBusinessHours, DayBusinessHours } from '../types';
 
 import { debug } from './debug';
+import { compileFormat, formatCompiled } from './formatCompiler';
+import { MS_PER_DAY } from './zoneOffsets';
 
 // Day names for output
 const DAY_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'];
@@ -124,22 +125,22 @@ export function getDatesInBusinessTimezone(
 
   // Convert each to business timezone date string
   for (const date of allDates) {
-    dates.add(formatInTimeZone(date, timezone, 'yyyy-MM-dd'));
+    dates.add(formatCompiled(date, timezone, compileFormat('yyyy-MM-dd')));
   }
 
   // Also ensure we have the end date in case of timezone edge cases
-  dates.add(formatInTimeZone(endDate, timezone, 'yyyy-MM-dd'));
+  dates.add(formatCompiled(endDate, timezone, compileFormat('yyyy-MM-dd')));
 
   const result = Array.from(dates).sort();
 
   // Log if timezone caused date count to differ from simple day count
   if (result.length !== allDates.length) {
-    debug.decision('Timezone affected date range', {
+    debug.decision('Timezone affected date range', () => ({
       timezone,
       simpleDayCount: allDates.length,
       businessDayCount: result.length,
       dates: result,
-    });
+    }));
   }
 
   return result;
@@ -159,7 +160,7 @@ export function getDayInfo(
 
   // Get day of week in business timezone
   // 'c' format gives us 1=Sunday, 2=Monday, etc., so subtract 1
-  const dayOfWeek = parseInt(formatInTimeZone(date, timezone, 'c'), 10) - 1;
+  const dayOfWeek = parseInt(formatCompiled(date, timezone, compileFormat('c')), 10) - 1;
   const dayName = DAY_NAMES[dayOfWeek];
 
   return { dayOfWeek, dayName };
@@ -184,9 +185,9 @@ export function isWorkDay(
   timezone?: string
 ): boolean {
   // Check if it's a holiday
-  // Use formatInTimeZone if timezone provided, otherwise use format for backward compatibility
+  // Format in the timezone if provided, otherwise use format for backward compatibility
   const isHoliday = timezone
-    ? holidays.some((h) => formatInTimeZone(h, timezone, 'yyyy-MM-dd') === dateStr)
+    ? holidays.some((h) => formatCompiled(h, timezone, compileFormat('yyyy-MM-dd')) === dateStr)
     : holidays.some((h) => format(h, 'yyyy-MM-dd') === dateStr);
 
   if (isHoliday) {
@@ -233,11 +234,13 @@ export function calculateDayBusinessMinutes(
   // Adjust for range start
   if (rangeStart > effectiveEnd) {
     // Range starts after business hours end
-    debug.business('Range starts after business hours:', {
-      date: dateStr,
-      rangeStart: format(rangeStart, 'HH:mm'),
-      businessEnd: format(effectiveEnd, 'HH:mm'),
-    });
+    if (debug.business.enabled) {
+      debug.business('Range starts after business hours:', {
+        date: dateStr,
+        rangeStart: format(rangeStart, 'HH:mm'),
+        businessEnd: format(effectiveEnd, 'HH:mm'),
+      });
+    }
     return 0;
   }
   if (rangeStart > effectiveStart) {
@@ -247,11 +250,13 @@ export function calculateDayBusinessMinutes(
   // Adjust for range end
   if (rangeEnd < effectiveStart) {
     // Range ends before business hours start
-    debug.business('Range ends before business hours:', {
-      date: dateStr,
-      rangeEnd: format(rangeEnd, 'HH:mm'),
-      businessStart: format(effectiveStart, 'HH:mm'),
-    });
+    if (debug.business.enabled) {
+      debug.business('Range ends before business hours:', {
+        date: dateStr,
+        rangeEnd: format(rangeEnd, 'HH:mm'),
+        businessStart: format(effectiveStart, 'HH:mm'),
+      });
+    }
     return 0;
   }
   if (rangeEnd < effectiveEnd) {
@@ -261,7 +266,7 @@ export function calculateDayBusinessMinutes(
   // Calculate minutes
   const minutes = Math.max(0, differenceInMinutes(effectiveEnd, effectiveStart));
 
-  if (minutes > 0) {
+  if (minutes > 0 && debug.business.enabled) {
     debug.business('Calculated business minutes:', {
       date: dateStr,
       minutes,
@@ -292,3 +297,47 @@ export function buildDayResult(
     is_holiday: isHoliday,
   };
 }
+
+/**
+ * Day of week (0=Sunday) of a day number (days since 1970-01-01, a Thursday)
+ */
+export function getDayNumberWeekday(dayNumber: number): number {
+  return (((dayNumber + 4) % 7) + 7) % 7;
+}
+
+/**
+ * Format a day number as YYYY-MM-DD
+ */
+export function formatDayNumber(dayNumber: number): string {
+  return new Date(dayNumber * MS_PER_DAY).toISOString().slice(0, 10);
+}
+
+/**
+ * Business minutes in the overlap of a business window and a time range,
+ * all as epoch milliseconds. Same result as calculateDayBusinessMinutes
+ * for an open day.
+ */
+export function calculateOverlapMinutes(
+  businessStart: number,
+  businessEnd: number,
+  rangeStart: number,
+  rangeEnd: number
+): number {
+  if (rangeStart > businessEnd) {
+    return 0;
+  }
+  const effectiveStart = Math.max(businessStart, rangeStart);
+  if (rangeEnd < effectiveStart) {
+    return 0;
+  }
+  const effectiveEnd = Math.min(businessEnd, rangeEnd);
+  return Math.max(0, Math.trunc((effectiveEnd - effectiveStart) / (60 * 1000)));
+}
+
+/**
+ * Name of a day of week (0=Sunday)
+ */
+export function getDayName(dayOfWeek: number): string {
+  // eslint-disable-next-line security/detect-object-injection -- day of week index (0-6)
+  return DAY_NAMES[dayOfWeek];
+}
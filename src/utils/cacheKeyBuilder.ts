@@ -36,7 +36,7 @@ function escapeValue(value: string): string {
     .replace(/%3A/g, '%3A'); // Keep colons encoded
 
   // Only log if something was actually escaped
-  if (escaped !== value) {
+  if (escaped !== value && debug.utils.enabled) {
     debug.utils('Cache key value escaped:', {
       original: value,
       escaped,
@@ -71,6 +71,21 @@ function valueToString(value: unknown): string {
   return escapeValue(String(value as string | undefined | null | symbol | bigint));
 }
 
+/**
+ * Log a built cache key (truncated if very long)
+ */
+function logCacheKey(finalKey: string): void {
+  if (!debug.utils.enabled) return;
+  if (finalKey.length > 100) {
+    debug.utils('Cache key built (truncated):', {
+      length: finalKey.length,
+      preview: finalKey.substring(0, 100) + '...',
+    });
+  } else {
+    debug.utils('Cache key built:', finalKey);
+  }
+}
+
 /**
  * Builds a consistent, collision-free cache key from structured options
  *
@@ -102,16 +117,18 @@ export function buildCacheKey(prefix: string, options?: CacheKeyOptions): string
   }
 
   // Log complex key building
-  debug.utils('Building cache key:', {
-    prefix,
-    hasOptions: {
-      single: !!options.single,
-      dates: !!options.dates,
-      flags: !!options.flags,
-      arrays: !!options.arrays,
-      optional: !!options.optional,
-    },
-  });
+  if (debug.utils.enabled) {
+    debug.utils('Building cache key:', {
+      prefix,
+      hasOptions: {
+        single: !!options.single,
+        dates: !!options.dates,
+        flags: !!options.flags,
+        arrays: !!options.arrays,
+        optional: !!options.optional,
+      },
+    });
+  }
 
   const parts: string[] = [];
 
@@ -143,11 +160,11 @@ export function buildCacheKey(prefix: string, options?: CacheKeyOptions): string
     for (const [key, values] of Object.entries(options.arrays)) {
       // Warn about large arrays that might create very long keys
       if (values.length > 10) {
-        debug.decision('Large array in cache key', {
+        debug.decision('Large array in cache key', () => ({
           key,
           count: values.length,
           sample: values.slice(0, 3),
-        });
+        }));
       }
       allPairs.push([key, values.join(',')]);
     }
@@ -178,16 +195,7 @@ export function buildCacheKey(prefix: string, options?: CacheKeyOptions): string
     finalKey = parts.join(':');
   }
 
-  // Log final key (truncate if very long)
-  if (finalKey.length > 100) {
-    debug.utils('Cache key built (truncated):', {
-      length: finalKey.length,
-      preview: finalKey.substring(0, 100) + '...',
-    });
-  } else {
-    debug.utils('Cache key built:', finalKey);
-  }
-
+  logCacheKey(finalKey);
   return finalKey;
 }
 
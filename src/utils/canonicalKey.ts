@@ -0,0 +1,60 @@
+/**
+ * Canonical Cache Key Helpers
+ *
+ * Raw cache keys are built from input strings, so `2025-01-20T15:00:00Z`,
+ * `2025-01-20T10:00:00-05:00` and `1737385200` each get their own entry.
+ * These helpers reduce inputs to what actually determines a result so
+ * tools can pass a canonical key to withCache as a second-level lookup.
+ *
+ * Only tools whose output does not echo the input representation use
+ * canonical keys. add_time, subtract_time, convert_timezone and
+ * get_current_time echo the caller's offset or timezone string in their
+ * output, so they keep raw keys.
+ */
+
+import { parseTimeInput } from './parseTimeInput';
+import { getTimezoneId } from './timezoneRegistry';
+import { validateTimezone } from './validation';
+
+/**
+ * Canonical IANA id for a timezone (e.g. "US/Eastern" → "America/New_York")
+ *
+ * "UTC" is never folded with its aliases: several code paths special-case
+ * the literal string, so "Etc/UTC" and "UTC" are not interchangeable.
+ *
+ * @param timezone - Resolved timezone as used by the tool
+ * @returns Canonical id, or undefined if the timezone is not valid
+ */
+export function canonicalTimezone(timezone: string): string | undefined {
+  if (!validateTimezone(timezone)) {
+    return undefined;
+  }
+  // date-fns-tz accepts a few forms Intl doesn't (e.g. "+05:00"): no id
+  const id = getTimezoneId(timezone);
+  return id === 'UTC' && timezone !== 'UTC' ? timezone : id;
+}
+
+/**
+ * Parse a time input to epoch milliseconds the same way the tools do
+ *
+ * @param input - Time string or Unix timestamp
+ * @param timezone - Timezone for inputs without an explicit offset
+ * @returns Epoch milliseconds, or undefined if the input does not parse
+ */
+export function canonicalInstant(input: string | number, timezone: string): number | undefined {
+  try {
+    const ms = parseTimeInput(input, timezone).date.getTime();
+    return Number.isNaN(ms) ? undefined : ms;
+  } catch {
+    return undefined;
+  }
+}
+
+/**
+ * Serialize a list whose order and duplicates don't affect results
+ *
+ * @returns JSON of the sorted, de-duplicated values (unambiguous in a key)
+ */
+export function canonicalList(values: readonly string[]): string {
+  return JSON.stringify(Array.from(new Set(values)).sort());
+}
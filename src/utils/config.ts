@@ -1,4 +1,4 @@
-import { getTimezoneOffset } from 'date-fns-tz';
+import { isKnownTimezone } from './timezoneRegistry';
 
 export interface TimeServerConfig {
   defaultTimezone: string;
@@ -6,18 +6,6 @@ export interface TimeServerConfig {
 
 let cachedConfig: TimeServerConfig | null = null;
 
-/**
- * Validates if a timezone string is valid
- */
-function isValidTimezone(timezone: string): boolean {
-  try {
-    const offset = getTimezoneOffset(timezone, new Date());
-    return !isNaN(offset);
-  } catch {
-    return false;
-  }
-}
-
 /**
  * Gets the system timezone safely
  */
@@ -45,12 +33,12 @@ export function getConfig(): TimeServerConfig {
 
   // Check DEFAULT_TIMEZONE environment variable
   const envTimezone = process.env.DEFAULT_TIMEZONE;
-  if (envTimezone && envTimezone !== '' && isValidTimezone(envTimezone)) {
+  if (envTimezone && envTimezone !== '' && isKnownTimezone(envTimezone)) {
     defaultTimezone = envTimezone;
   } else {
     // Try system timezone (which respects TZ env var)
     const systemTz = getSystemTimezone();
-    if (systemTz && isValidTimezone(systemTz)) {
+    if (systemTz && isKnownTimezone(systemTz)) {
       defaultTimezone = systemTz;
     }
   }
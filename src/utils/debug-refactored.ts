@@ -17,6 +17,9 @@ export interface DecisionContext {
   [key: string]: unknown;
 }
 
+/** A value, or a function that builds it only when it will be logged */
+export type Lazy<T> = T | (() => T);
+
 // Factory function that tests can override
 let debuggerFactory: typeof createDebugger = createDebugger;
 
@@ -47,13 +50,22 @@ export function clearDebugCache(): void {
   instanceCache = null;
 }
 
-class DebugEnhanced {
-  // Lazy-loaded cache for debug instances
-  private get debuggerCache(): Map<string, ReturnType<typeof createDebugger>> {
-    instanceCache ??= new Map();
-    return instanceCache;
-  }
+/**
+ * Whether any namespace can be enabled at all
+ *
+ * Caller-named namespaces (decision, log, errorContext, time) need a stack
+ * trace to name, so when DEBUG enables nothing they skip it entirely.
+ * Factories set by tests decide per instance, so they always get a name.
+ */
+function anyNamespaceEnabled(): boolean {
+  return debuggerFactory !== createDebugger || createDebugger.names.length > 0;
+}
+
+function resolve<T>(value: Lazy<T>): T {
+  return typeof value === 'function' ? (value as () => T)() : value;
+}
 
+class DebugEnhanced {
   // Use getters for lazy initialization of all namespaces
   // This ensures instances are created AFTER test setup
 
@@ -182,11 +194,12 @@ class DebugEnhanced {
    * This is THE key change - using the factory that tests can override
    */
   private getDebugger(namespace: string): ReturnType<typeof createDebugger> {
-    let debugInstance = this.debuggerCache.get(namespace);
+    instanceCache ??= new Map();
+    let debugInstance = instanceCache.get(namespace);
     if (!debugInstance) {
       // Use the factory function (which tests can override)
       debugInstance = debuggerFactory(namespace);
-      this.debuggerCache.set(namespace, debugInstance);
+      instanceCache.set(namespace, debugInstance);
     }
     return debugInstance;
   }
@@ -195,6 +208,7 @@ class DebugEnhanced {
    * Auto-namespaced log based on calling function
    */
   log(message: string, ...args: unknown[]): void {
+    if (!anyNamespaceEnabled()) return;
     const context = this.getCallerContext();
     const namespace = `mcp:auto:${context}`;
     const debugInstance = this.getDebugger(namespace);
@@ -203,11 +217,17 @@ class DebugEnhanced {
 
   /**
    * Structured decision logging for complex branching logic
+   *
+   * Pass the context as a function in hot paths; it is only called when
+   * the decision is logged.
    */
-  decision(description: string, context: DecisionContext): void {
+  decision(description: string, lazyContext: Lazy<DecisionContext>): void {
+    if (!anyNamespaceEnabled()) return;
     const caller = this.getCallerContext();
     const namespace = `mcp:decision:${caller}`;
     const debugInstance = this.getDebugger(namespace);
+    if (!debugInstance.enabled) return;
+    const context = resolve(lazyContext);
 
     // Format for readability
     if (Object.keys(context).length <= 3) {
@@ -228,18 +248,21 @@ class DebugEnhanced {
   /**
    * Error context logging
    */
-  errorContext(error: unknown, context: DecisionContext): void {
+  errorContext(error: unknown, context: Lazy<DecisionContext>): void {
+    if (!anyNamespaceEnabled()) return;
     const caller = this.getCallerContext();
     const namespace = `mcp:error:${caller}`;
     const debugInstance = this.getDebugger(namespace);
+    if (!debugInstance.enabled) return;
     debugInstance('❌ Error in %s: %O', caller, error);
-    debugInstance('   Context: %O', context);
+    debugInstance('   Context: %O', resolve(context));
   }
 
   /**
    * Performance timing helper
    */
   time(label: string): () => void {
+    if (!anyNamespaceEnabled()) return noop;
     const start = Date.now();
     const caller = this.getCallerContext();
     const namespace = `mcp:perf:${caller}`;
@@ -252,6 +275,8 @@ class DebugEnhanced {
   }
 }
 
+function noop(): void {}
+
 // Export singleton instance
 export const debug = new DebugEnhanced();
 
@@ -14,4 +14,4 @@ export {
   resetDebuggerFactory,
   clearDebugCache,
 } from './debug-refactored';
-export type { DecisionContext } from './debug-refactored';
+export type { DecisionContext, Lazy } from './debug-refactored';
@@ -0,0 +1,226 @@
+/**
+ * In-memory ring buffer for debug output
+ *
+ * With DEBUG=mcp:* every debug line is formatted and written synchronously
+ * to stderr, which is a pipe under stdio MCP, so throughput collapses
+ * exactly when diagnostics are wanted. When DEBUG_BUFFER_SIZE is set, debug
+ * calls instead record their raw arguments into a fixed-size ring, tagged
+ * with a monotonic timestamp and the id of the tool call that made them.
+ * Nothing is formatted until the buffer is dumped to a file: on SIGUSR2,
+ * through the dump_debug_buffer tool, or when a tool fails unexpectedly.
+ *
+ * Namespaces come from DEBUG as usual (all mcp:* ones when it is unset).
+ * Arguments are kept by reference, so an object mutated after it was
+ * logged is dumped in its later state.
+ */
+
+import { AsyncLocalStorage } from 'async_hooks';
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+import { performance } from 'perf_hooks';
+import { format } from 'util';
+
+import createDebugger from 'debug';
+
+import { debug, resetDebuggerFactory, setDebuggerFactory } from './debug';
+
+/** Error dumps closer together than this would mostly repeat each other */
+export const ERROR_DUMP_INTERVAL_MS = 60_000;
+
+const MAX_BUFFER_SIZE = 1_000_000;
+
+interface RingBuffer {
+  times: Float64Array;
+  requestIds: Int32Array;
+  namespaces: string[];
+  args: unknown[][];
+  next: number;
+  count: number;
+}
+
+let ring: RingBuffer | null = null;
+let lastErrorDump = -Infinity;
+let lastRequestId = 0;
+const requestContext = new AsyncLocalStorage<number>();
+
+function createRing(size: number): RingBuffer {
+  return {
+    times: new Float64Array(size),
+    requestIds: new Int32Array(size),
+    namespaces: new Array<string>(size),
+    args: new Array<unknown[]>(size),
+    next: 0,
+    count: 0,
+  };
+}
+
+function record(buffer: RingBuffer, namespace: string, args: unknown[]): void {
+  const i = buffer.next;
+  buffer.times[i] = performance.now();
+  buffer.requestIds[i] = requestContext.getStore() ?? 0;
+  // eslint-disable-next-line security/detect-object-injection -- Index within the ring
+  buffer.namespaces[i] = namespace;
+  // eslint-disable-next-line security/detect-object-injection -- Index within the ring
+  buffer.args[i] = args;
+  buffer.next = i + 1 === buffer.times.length ? 0 : i + 1;
+  if (buffer.count < buffer.times.length) {
+    buffer.count++;
+  }
+}
+
+/**
+ * Debugger factory whose instances record into the ring instead of writing
+ */
+function createRecorder(buffer: RingBuffer): typeof createDebugger {
+  const factory = (namespace: string): createDebugger.Debugger => {
+    const recorder = Object.assign(
+      (...args: unknown[]): void => {
+        if (recorder.enabled) {
+          record(buffer, namespace, args);
+        }
+      },
+      { namespace, enabled: createDebugger.enabled(namespace) }
+    );
+    return recorder as unknown as createDebugger.Debugger;
+  };
+  return factory as unknown as typeof createDebugger;
+}
+
+function formatEvent(buffer: RingBuffer, i: number): string {
+  const time = buffer.times[i];
+  const wallClock = new Date(performance.timeOrigin + time).toISOString();
+  const request = buffer.requestIds[i] ? `req ${buffer.requestIds[i]}` : '-';
+  let message: string;
+  try {
+    // eslint-disable-next-line security/detect-object-injection -- Index within the ring
+    message = format(...buffer.args[i]);
+  } catch (error) {
+    message = `<unformattable: ${String(error)}>`;
+  }
+  // eslint-disable-next-line security/detect-object-injection -- Index within the ring
+  return `${wallClock} ${time.toFixed(3)} [${request}] ${buffer.namespaces[i]} ${message}`;
+}
+
+/**
+ * Format the buffered events, oldest first
+ */
+export function formatDebugBuffer(): string[] {
+  if (!ring) {
+    return [];
+  }
+  const { count, next, times } = ring;
+  const lines: string[] = [];
+  for (let n = 0; n < count; n++) {
+    lines.push(formatEvent(ring, (next - count + n + times.length) % times.length));
+  }
+  return lines;
+}
+
+/**
+ * Whether debug output is currently going to the ring buffer
+ */
+export function isDebugBufferActive(): boolean {
+  return ring !== null;
+}
+
+/**
+ * Run a tool call with its own request id on every event it records
+ */
+export function withDebugRequest<T>(run: () => T): T {
+  if (!ring) {
+    return run();
+  }
+  return requestContext.run(++lastRequestId, run);
+}
+
+/**
+ * Write the buffered events to a new file
+ *
+ * The file goes to DEBUG_BUFFER_DIR (default: the OS temp directory).
+ * Synchronous so it can run from a signal handler. The buffer is kept,
+ * so a later dump overlaps this one.
+ *
+ * @returns Path of the file and the number of events in it
+ */
+export function dumpDebugBuffer(
+  reason: string,
+  dir: string = process.env.DEBUG_BUFFER_DIR ?? os.tmpdir()
+): { path: string; events: number } {
+  const lines = formatDebugBuffer();
+  const filePath = path.join(dir, `mcp-debug-${process.pid}-${Date.now()}.log`);
+  const header = [
+    `# MCP Time Server debug buffer, pid ${process.pid}`,
+    `# Reason: ${reason}`,
+    `# Dumped: ${new Date().toISOString()}, ${lines.length} events`,
+    '# Columns: wall clock, ms since process start, request, namespace, message',
+  ];
+  // eslint-disable-next-line security/detect-non-literal-fs-filename -- Operator-configured dir
+  fs.writeFileSync(filePath, header.concat(lines).join('\n') + '\n');
+  return { path: filePath, events: lines.length };
+}
+
+/**
+ * Dump after an unexpected tool failure, at most once per minute
+ *
+ * @returns Path of the file, or null if nothing was written
+ */
+export function dumpDebugBufferOnError(reason: string, now: number = Date.now()): string | null {
+  if (!ring || now - lastErrorDump < ERROR_DUMP_INTERVAL_MS) {
+    return null;
+  }
+  lastErrorDump = now;
+  try {
+    return dumpDebugBuffer(reason).path;
+  } catch (error) {
+    debug.error('Debug buffer dump failed: %O', error);
+    return null;
+  }
+}
+
+function getBufferSize(): number {
+  const parsed = parseInt(process.env.DEBUG_BUFFER_SIZE ?? '', 10);
+  return !isNaN(parsed) && parsed > 0 ? Math.min(parsed, MAX_BUFFER_SIZE) : 0;
+}
+
+/**
+ * Route debug output into a ring buffer if DEBUG_BUFFER_SIZE is set
+ *
+ * The size is the number of events kept. SIGUSR2 dumps the buffer (not on
+ * Windows, which has no such signal).
+ *
+ * @returns Function that restores normal debug output (no-op when disabled)
+ */
+export function startDebugBuffer(size: number = getBufferSize()): () => void {
+  if (size <= 0) {
+    return () => undefined;
+  }
+
+  const buffer = createRing(Math.min(size, MAX_BUFFER_SIZE));
+  ring = buffer;
+  lastErrorDump = -Infinity;
+  const previousNamespaces = createDebugger.disable();
+  createDebugger.enable(process.env.DEBUG ?? 'mcp:*');
+  setDebuggerFactory(createRecorder(buffer));
+
+  const onSignal = (): void => {
+    try {
+      const { path: filePath, events } = dumpDebugBuffer('SIGUSR2');
+      console.error(`Debug buffer: ${events} events written to ${filePath}`);
+    } catch (error) {
+      console.error('Debug buffer dump failed:', error);
+    }
+  };
+  if (process.platform !== 'win32') {
+    process.on('SIGUSR2', onSignal);
+  }
+
+  return () => {
+    process.off('SIGUSR2', onSignal);
+    if (ring === buffer) {
+      ring = null;
+      createDebugger.enable(previousNamespaces);
+      resetDebuggerFactory();
+    }
+  };
+}
@@ -0,0 +1,395 @@
+/**
+ * Compiled custom format strings
+ *
+ * A format string is checked against the custom_format allow-list and
+ * split into tokens once, the same way date-fns-tz and date-fns split it,
+ * and the result is kept in a small LRU keyed by the format string.
+ * Formats made only of numeric date/time fields, weekdays, AM/PM, ISO
+ * offsets (X, x) and literal text are then formatted straight from the
+ * zoned date's fields. Anything else (month names, ordinals, week years,
+ * zone names) is handed to formatInTimeZone unchanged, so output is the
+ * same either way.
+ */
+
+import { formatInTimeZone } from 'date-fns-tz';
+
+import { getZoneOffset, toZonedDate } from './zoneOffsets';
+
+/**
+ * Format tokens organized by category for better maintainability
+ * Frozen to prevent accidental modification
+ */
+export const FORMAT_TOKENS = Object.freeze({
+  era: Object.freeze(['G', 'GG', 'GGG', 'GGGG', 'GGGGG']),
+  year: Object.freeze(['y', 'yo', 'yy', 'yyy', 'yyyy', 'yyyyy']),
+  localWeekYear: Object.freeze(['Y', 'Yo', 'YY', 'YYY', 'YYYY', 'YYYYY']),
+  isoWeekYear: Object.freeze(['R', 'RR', 'RRR', 'RRRR', 'RRRRR']),
+  extendedYear: Object.freeze(['u', 'uu', 'uuu', 'uuuu', 'uuuuu']),
+  quarter: Object.freeze([
+    'Q',
+    'Qo',
+    'QQ',
+    'QQQ',
+    'QQQQ',
+    'QQQQQ',
+    'q',
+    'qo',
+    'qq',
+    'qqq',
+    'qqqq',
+    'qqqqq',
+  ]),
+  month: Object.freeze([
+    'M',
+    'Mo',
+    'MM',
+    'MMM',
+    'MMMM',
+    'MMMMM',
+    'L',
+    'Lo',
+    'LL',
+    'LLL',
+    'LLLL',
+    'LLLLL',
+  ]),
+  week: Object.freeze(['w', 'wo', 'ww', 'I', 'Io', 'II']),
+  day: Object.freeze([
+    'd',
+    'do',
+    'dd',
+    'D',
+    'Do',
+    'DD',
+    'DDD',
+    'E',
+    'EE',
+    'EEE',
+    'EEEE',
+    'EEEEE',
+    'EEEEEE',
+    'e',
+    'eo',
+    'ee',
+    'eee',
+    'eeee',
+    'eeeee',
+    'eeeeee',
+    'c',
+    'co',
+    'cc',
+    'ccc',
+    'cccc',
+    'ccccc',
+    'cccccc',
+    'i',
+    'io',
+    'ii',
+    'iii',
+    'iiii',
+    'iiiii',
+    'iiiiii',
+  ]),
+  period: Object.freeze([
+    'a',
+    'aa',
+    'aaa',
+    'aaaa',
+    'aaaaa',
+    'b',
+    'bb',
+    'bbb',
+    'bbbb',
+    'bbbbb',
+    'B',
+    'BB',
+    'BBB',
+    'BBBB',
+    'BBBBB',
+  ]),
+  hour: Object.freeze(['h', 'ho', 'hh', 'H', 'Ho', 'HH', 'K', 'Ko', 'KK', 'k', 'ko', 'kk']),
+  minute: Object.freeze(['m', 'mo', 'mm']),
+  second: Object.freeze(['s', 'so', 'ss']),
+  fraction: Object.freeze(['S', 'SS', 'SSS']),
+  timezone: Object.freeze([
+    'X',
+    'XX',
+    'XXX',
+    'XXXX',
+    'XXXXX',
+    'x',
+    'xx',
+    'xxx',
+    'xxxx',
+    'xxxxx',
+    'O',
+    'OO',
+    'OOO',
+    'OOOO',
+    'z',
+    'zz',
+    'zzz',
+    'zzzz',
+    'Z',
+    'ZZ',
+    'ZZZ',
+    'ZZZZ',
+    'ZZZZZ',
+  ]),
+  timestamp: Object.freeze(['t', 'T']),
+});
+
+const MAX_COMPILED_FORMATS = 256;
+
+// Never allowed in custom_format
+const DANGEROUS_CHARS = /[;&|`$<>{}\\]/;
+let allowedPattern: RegExp | undefined;
+
+// date-fns-tz substitutes timezone tokens first...
+const TIMEZONE_TOKENS = /([xXOz]+)|''|'(''|[^'])+('|$)/g;
+// ...then date-fns splits what is left
+const FORMATTING_TOKENS = /[yYQqMLwIdDecihHKkms]o|(\w)\1*|''|'(''|[^'])+('|$)|./g;
+const ESCAPED_STRING = /^'([^]*?)'?$/;
+const LATIN_LETTER = /[a-zA-Z]/;
+
+/** Literal text, or a field of the zoned date (offset in ms east of UTC) */
+type FormatPart = string | ((zoned: Date, offset: number) => string);
+
+export interface CompiledFormat {
+  /** Whether the format passes the custom_format allow-list */
+  readonly valid: boolean;
+  readonly source: string;
+  /** Formatting program, or undefined when date-fns-tz has to do it */
+  readonly parts: readonly FormatPart[] | undefined;
+}
+
+// Least recently used format first
+const compiledFormats = new Map<string, CompiledFormat>();
+
+function pad(value: number, length: number): string {
+  const sign = value < 0 ? '-' : '';
+  return sign + Math.abs(value).toString().padStart(length, '0');
+}
+
+// date-fns enUS weekday names (abbreviated, wide)
+const SHORT_WEEKDAYS = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat'];
+const LONG_WEEKDAYS = [
+  'Sunday',
+  'Monday',
+  'Tuesday',
+  'Wednesday',
+  'Thursday',
+  'Friday',
+  'Saturday',
+];
+
+// Same output as date-fns' formatters for these tokens (en-US)
+const FIELD_FORMATTERS = new Map<string, (zoned: Date, token: string) => string>([
+  [
+    'y',
+    (zoned, token) => {
+      const signedYear = zoned.getFullYear();
+      const year = signedYear > 0 ? signedYear : 1 - signedYear;
+      return pad(token === 'yy' ? year % 100 : year, token.length);
+    },
+  ],
+  ['M', (zoned, token) => pad(zoned.getMonth() + 1, token.length)],
+  ['d', (zoned, token) => pad(zoned.getDate(), token.length)],
+  ['H', (zoned, token) => pad(zoned.getHours(), token.length)],
+  ['h', (zoned, token) => pad(zoned.getHours() % 12 || 12, token.length)],
+  ['m', (zoned, token) => pad(zoned.getMinutes(), token.length)],
+  // Local day of week, weeks starting on Sunday (1-7)
+  ['c', (zoned, token) => pad((zoned.getDay() + 1) % 7 || 7, token.length)],
+  [
+    'E',
+    // eslint-disable-next-line security/detect-object-injection -- numeric index
+    (zoned, token) => (token.length === 4 ? LONG_WEEKDAYS : SHORT_WEEKDAYS)[zoned.getDay()],
+  ],
+  ['s', (zoned, token) => pad(zoned.getSeconds(), token.length)],
+  [
+    'S',
+    (zoned, token) =>
+      pad(Math.trunc(zoned.getMilliseconds() * Math.pow(10, token.length - 3)), token.length),
+  ],
+  [
+    'a',
+    (zoned, token) => {
+      const period = zoned.getHours() >= 12 ? 'PM' : 'AM';
+      return token === 'aaa' ? period.toLowerCase() : period;
+    },
+  ],
+]);
+
+// Longer runs of these letters are names (MMM, ccc) or other widths
+const MAX_FIELD_LENGTH = new Map([
+  ['M', 2],
+  ['c', 2],
+  ['E', 4],
+  ['a', 3],
+]);
+
+/**
+ * Field formatter for a date-fns token, or undefined if date-fns is needed
+ */
+function getFieldFormatter(token: string): FormatPart | undefined {
+  const formatter = FIELD_FORMATTERS.get(token[0]);
+  // Ordinals ("do") need locale data
+  if (!formatter || token.endsWith('o') || token.length > (MAX_FIELD_LENGTH.get(token[0]) ?? 5)) {
+    return undefined;
+  }
+  return (zoned) => formatter(zoned, token);
+}
+
+/**
+ * Offset as date-fns-tz writes it for the X and x tokens
+ */
+function formatOffset(offset: number, token: string): string {
+  // date-fns-tz works in minutes west of UTC
+  const minutesWest = -offset / 60000;
+  if (token[0] === 'X' && minutesWest === 0) {
+    return 'Z';
+  }
+  const sign = minutesWest > 0 ? '-' : '+';
+  const absolute = Math.abs(minutesWest);
+  if (token.length === 1 && minutesWest % 60 === 0) {
+    return sign + pad(absolute / 60, 2);
+  }
+  const delimiter = token.length === 1 || token.length === 2 || token.length === 4 ? '' : ':';
+  return sign + pad(Math.floor(absolute / 60), 2) + delimiter + pad(Math.floor(absolute % 60), 2);
+}
+
+function isAllowedFormat(format: string): boolean {
+  if (DANGEROUS_CHARS.test(format)) {
+    return false;
+  }
+  if (!allowedPattern) {
+    const tokens = Object.values(FORMAT_TOKENS).flat();
+    // eslint-disable-next-line security/detect-non-literal-regexp -- Built from known safe tokens
+    allowedPattern = new RegExp(`^(?:${tokens.join('|')}|'[^']*'|[\\s\\-:.,/()\\[\\]])+$`);
+  }
+  return allowedPattern.test(format);
+}
+
+/**
+ * Program for text between timezone tokens, or undefined if any token
+ * in it needs date-fns
+ */
+function compileSegment(segment: string): FormatPart[] | undefined {
+  const parts: FormatPart[] = [];
+  for (const token of segment.match(FORMATTING_TOKENS) ?? []) {
+    if (token === "''") {
+      parts.push("'");
+    } else if (token.startsWith("'")) {
+      parts.push(ESCAPED_STRING.exec(token)?.[1].replace(/''/g, "'") ?? token);
+    } else if (LATIN_LETTER.test(token[0])) {
+      const field = getFieldFormatter(token);
+      if (!field) {
+        return undefined;
+      }
+      parts.push(field);
+    } else {
+      parts.push(token);
+    }
+  }
+  return parts;
+}
+
+/**
+ * Whether a timezone token can be formatted in place
+ *
+ * date-fns-tz replaces timezone tokens with quoted text before date-fns
+ * sees the format, which merges with quotes next to the token. Only the
+ * ISO offset tokens (runs of one letter) are formatted here.
+ */
+function isInlineOffsetToken(format: string, token: string, index: number): boolean {
+  return (
+    (token[0] === 'X' || token[0] === 'x') &&
+    token === token[0].repeat(token.length) &&
+    format[index - 1] !== "'" &&
+    format[index + token.length] !== "'"
+  );
+}
+
+/**
+ * Program for a whole format, or undefined if it needs date-fns-tz
+ */
+function compileParts(format: string): FormatPart[] | undefined {
+  const parts: FormatPart[] = [];
+  let segmentStart = 0;
+  for (const match of format.matchAll(TIMEZONE_TOKENS)) {
+    const token = match[1];
+    if (token === undefined) {
+      // date-fns-tz would look for later tokens inside quoted text
+      if (/[xXOz]/.test(match[0])) {
+        return undefined;
+      }
+      continue;
+    }
+    const index = match.index ?? 0;
+    const segment = compileSegment(format.slice(segmentStart, index));
+    if (!segment || !isInlineOffsetToken(format, token, index)) {
+      return undefined;
+    }
+    parts.push(...segment, (_zoned, offset) => formatOffset(offset, token));
+    segmentStart = index + token.length;
+  }
+  const rest = compileSegment(format.slice(segmentStart));
+  return rest && parts.concat(rest);
+}
+
+/**
+ * Merge neighbouring literal parts
+ */
+function joinLiterals(parts: FormatPart[]): FormatPart[] {
+  const joined: FormatPart[] = [];
+  for (const part of parts) {
+    const last = joined[joined.length - 1];
+    if (typeof part === 'string' && typeof last === 'string') {
+      joined[joined.length - 1] = last + part;
+    } else {
+      joined.push(part);
+    }
+  }
+  return joined;
+}
+
+/**
+ * Validate and compile a format string, reusing earlier compilations
+ *
+ * @param format - date-fns format string
+ * @returns Compiled format (check `valid` before using custom_format input)
+ */
+export function compileFormat(format: string): CompiledFormat {
+  let compiled = compiledFormats.get(format);
+  if (compiled) {
+    compiledFormats.delete(format);
+  } else {
+    const valid = isAllowedFormat(format);
+    // Formats outside the allow-list are left to date-fns entirely
+    const parts = valid ? compileParts(format) : undefined;
+    compiled = { valid, source: format, parts: parts && joinLiterals(parts) };
+    if (compiledFormats.size >= MAX_COMPILED_FORMATS) {
+      compiledFormats.delete(compiledFormats.keys().next().value as string);
+    }
+  }
+  compiledFormats.set(format, compiled);
+  return compiled;
+}
+
+/**
+ * Format an instant in a timezone with a compiled format
+ *
+ * Same output (and errors) as formatInTimeZone(date, timezone, format).
+ */
+export function formatCompiled(date: Date, timezone: string, compiled: CompiledFormat): string {
+  const offset = getZoneOffset(timezone, date.getTime());
+  if (!compiled.parts || !Number.isFinite(offset) || !Number.isFinite(date.getTime())) {
+    return formatInTimeZone(date, timezone, compiled.source);
+  }
+  const zoned = toZonedDate(date, timezone);
+  let formatted = '';
+  for (const part of compiled.parts) {
+    formatted += typeof part === 'string' ? part : part(zoned, offset);
+  }
+  return formatted;
+}
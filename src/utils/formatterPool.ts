@@ -0,0 +1,87 @@
+/**
+ * Shared Intl.DateTimeFormat instances
+ *
+ * Constructing an Intl.DateTimeFormat is far more expensive than using
+ * one, so formatters are pooled by timezone and option set. Option sets
+ * are named presets, which keeps pool keys short and makes every user of
+ * a preset share the same instance. The least recently used formatters
+ * are dropped once the pool is full.
+ */
+
+import { debug } from './debug';
+
+export const FORMATTER_OPTIONS = Object.freeze({
+  /** Numeric wall-clock fields, 00-23 hours (for reading UTC offsets) */
+  fields: Object.freeze({
+    hourCycle: 'h23',
+    year: 'numeric',
+    month: 'numeric',
+    day: 'numeric',
+    hour: 'numeric',
+    minute: 'numeric',
+    second: 'numeric',
+  } as const),
+  /** No fields (for resolving timezone names) */
+  zone: Object.freeze({}),
+});
+
+export type FormatterPreset = keyof typeof FORMATTER_OPTIONS;
+
+export interface FormatterPoolStats {
+  size: number;
+  hits: number;
+  misses: number;
+  evictions: number;
+}
+
+const MAX_POOLED_FORMATTERS = 128;
+
+// Least recently used first
+const pool = new Map<string, Intl.DateTimeFormat>();
+const stats: FormatterPoolStats = { size: 0, hits: 0, misses: 0, evictions: 0 };
+
+/**
+ * Pooled en-US formatter for a timezone and option preset
+ *
+ * @throws RangeError if Intl does not know the timezone (nothing is pooled)
+ */
+export function getDateTimeFormat(timezone: string, preset: FormatterPreset): Intl.DateTimeFormat {
+  const key = `${preset}:${timezone}`;
+  let formatter = pool.get(key);
+  if (formatter) {
+    stats.hits++;
+    pool.delete(key);
+  } else {
+    stats.misses++;
+    formatter = new Intl.DateTimeFormat('en-US', {
+      // eslint-disable-next-line security/detect-object-injection -- preset is a known key
+      ...FORMATTER_OPTIONS[preset],
+      timeZone: timezone,
+    });
+    if (pool.size >= MAX_POOLED_FORMATTERS) {
+      const oldest = pool.keys().next().value as string;
+      pool.delete(oldest);
+      stats.evictions++;
+      debug.cache('Formatter pool evicted %s', oldest);
+    }
+  }
+  pool.set(key, formatter);
+  return formatter;
+}
+
+/**
+ * Pool size and hit counters since start (or the last reset)
+ */
+export function getFormatterPoolStats(): FormatterPoolStats {
+  return { ...stats, size: pool.size };
+}
+
+/**
+ * Empty the pool and reset its counters (mainly for testing)
+ */
+export function resetFormatterPool(): void {
+  pool.clear();
+  stats.hits = 0;
+  stats.misses = 0;
+  stats.evictions = 0;
+}
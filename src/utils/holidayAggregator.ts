@@ -13,7 +13,7 @@
  */
 
 import { DateParsingError } from '../adapters/mcp-sdk/errors';
-import { getHolidaysForYear } from '../data/holidays';
+import { fromEpochDay, getHolidayIndex, getHolidaysForYear, toEpochDay } from '../data/holidays';
 
 import { parseHolidayDates } from './businessUtils';
 import { debug } from './debug';
@@ -57,7 +57,7 @@ export interface HolidayAggregatorParams {
  * ```
  */
 export function aggregateHolidays(params: HolidayAggregatorParams): Set<string> {
-  const { calendar, custom = [], legacy = [], includeObserved, timezone, dateRange } = params;
+  const { calendar, custom = [], legacy = [], includeObserved, dateRange } = params;
 
   const allHolidayDates = new Set<string>();
   const { start, end } = dateRange;
@@ -72,59 +72,82 @@ export function aggregateHolidays(params: HolidayAggregatorParams): Set<string>
     addCalendarHolidays(allHolidayDates, calendar, includeObserved, start, end);
   }
 
-  // 2. Add custom holidays
-  if (custom.length > 0) {
-    let customDates: Date[];
-    try {
-      customDates = parseHolidayDates(custom, timezone);
-    } catch (error) {
-      // Re-throw with more specific error message for custom holidays
-      const errorObj = error as { error?: { message?: string; data?: { holiday?: string } } };
-      const originalMessage = errorObj.error?.message ?? String(error);
-      const invalidHoliday = errorObj.error?.data?.holiday;
-
-      debug.error(
-        'Invalid custom holiday date: %s, error: %s',
-        invalidHoliday ?? 'unknown',
-        originalMessage
-      );
-      throw new DateParsingError(`Invalid custom holiday date: ${invalidHoliday ?? 'unknown'}`, {
-        holiday: invalidHoliday,
-        error: originalMessage,
-      });
-    }
+  // 2. Add custom and legacy holidays
+  for (const date of collectExplicitHolidays(params)) {
+    allHolidayDates.add(date.toDateString());
+  }
 
-    let addedCount = 0;
-    for (const date of customDates) {
-      // Check if holiday is within date range
-      if (date >= start && date <= end) {
-        allHolidayDates.add(date.toDateString());
-        addedCount++;
-      }
-    }
+  debug.business('Total unique holidays aggregated: %d', allHolidayDates.size);
+
+  return allHolidayDates;
+}
+
+/**
+ * Custom and legacy holidays within the date range, as epoch days
+ *
+ * getBusinessDays counts calendar holidays from per-calendar prefix sums,
+ * so it only needs the explicitly listed dates.
+ *
+ * @param params - Holiday aggregation parameters (calendar is ignored)
+ * @returns Set of epoch days (see toEpochDay)
+ * @throws Error if custom holidays can't be parsed
+ */
+export function aggregateExplicitHolidayDays(params: HolidayAggregatorParams): Set<number> {
+  return new Set(collectExplicitHolidays(params).map(toEpochDay));
+}
 
-    debug.business('Added %d custom holidays (from %d provided)', addedCount, custom.length);
+/**
+ * Parse custom and legacy holidays, keeping those inside the date range
+ */
+function collectExplicitHolidays(params: HolidayAggregatorParams): Date[] {
+  const { custom = [], legacy = [], timezone, dateRange } = params;
+  const { start, end } = dateRange;
+  const inRange = (date: Date): boolean => date >= start && date <= end;
+  const dates: Date[] = [];
+
+  if (custom.length > 0) {
+    const customDates = parseCustomHolidays(custom, timezone).filter(inRange);
+    dates.push(...customDates);
+    debug.business(
+      'Added %d custom holidays (from %d provided)',
+      customDates.length,
+      custom.length
+    );
   }
 
-  // 3. Add legacy holidays (backward compatibility)
+  // Legacy holidays (backward compatibility)
   if (legacy.length > 0) {
-    const legacyDates = parseHolidayDates(legacy, timezone);
-    let addedCount = 0;
-
-    for (const date of legacyDates) {
-      // Check if holiday is within date range
-      if (date >= start && date <= end) {
-        allHolidayDates.add(date.toDateString());
-        addedCount++;
-      }
-    }
-
-    debug.business('Added %d legacy holidays (from %d provided)', addedCount, legacy.length);
+    const legacyDates = parseHolidayDates(legacy, timezone).filter(inRange);
+    dates.push(...legacyDates);
+    debug.business(
+      'Added %d legacy holidays (from %d provided)',
+      legacyDates.length,
+      legacy.length
+    );
   }
 
-  debug.business('Total unique holidays aggregated: %d', allHolidayDates.size);
+  return dates;
+}
 
-  return allHolidayDates;
+function parseCustomHolidays(custom: string[], timezone: string): Date[] {
+  try {
+    return parseHolidayDates(custom, timezone);
+  } catch (error) {
+    // Re-throw with more specific error message for custom holidays
+    const errorObj = error as { error?: { message?: string; data?: { holiday?: string } } };
+    const originalMessage = errorObj.error?.message ?? String(error);
+    const invalidHoliday = errorObj.error?.data?.holiday;
+
+    debug.error(
+      'Invalid custom holiday date: %s, error: %s',
+      invalidHoliday ?? 'unknown',
+      originalMessage
+    );
+    throw new DateParsingError(`Invalid custom holiday date: ${invalidHoliday ?? 'unknown'}`, {
+      holiday: invalidHoliday,
+      error: originalMessage,
+    });
+  }
 }
 
 /**
@@ -142,17 +165,17 @@ function addCalendarHolidays(
   const endYear = end.getFullYear();
   const initialSize = holidaySet.size;
 
-  for (let year = startYear; year <= endYear; year++) {
-    const holidays = getHolidaysForYear(calendar, year);
+  // Observed dates replace actual ones when include_observed is true
+  const mode = includeObserved ? 'observed' : 'actual';
 
-    for (const holiday of holidays) {
-      // Use observed date if available and include_observed is true
-      const dateToUse =
-        includeObserved && holiday.observedDate ? holiday.observedDate : holiday.date;
+  for (let year = startYear; year <= endYear; year++) {
+    // Memoized per (calendar, year, mode) - the rules only run once per year
+    const { days } = getHolidayIndex(calendar, year, mode);
 
+    for (const day of days) {
       // Add holiday date string - no need to filter by range here
       // as getBusinessDays will only count holidays that fall on actual days in the interval
-      holidaySet.add(dateToUse.toDateString());
+      holidaySet.add(fromEpochDay(day).toDateString());
     }
   }
 
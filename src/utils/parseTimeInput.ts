@@ -4,6 +4,7 @@ import { toDate } from 'date-fns-tz';
 import { DateParsingError } from '../adapters/mcp-sdk/errors';
 
 import { debug } from './debug';
+import { MS_PER_DAY, wallClockToInstant } from './zoneOffsets';
 
 /**
  * Result of parsing a time input
@@ -58,11 +59,13 @@ function parseUnixTimestamp(timeStr: string): ParseResult | null {
   const multiplier = timeStr.length > 10 ? 1 : 1000;
   const date = new Date(timestamp * multiplier);
 
-  debug.parsing('Parsed Unix timestamp:', {
-    timestamp,
-    multiplier,
-    result: date.toISOString(),
-  });
+  if (debug.parsing.enabled) {
+    debug.parsing('Parsed Unix timestamp:', {
+      timestamp,
+      multiplier,
+      result: date.toISOString(),
+    });
+  }
 
   return {
     date,
@@ -86,12 +89,14 @@ function parseISOWithTimezone(timeStr: string): ParseResult | null {
   }
 
   const offset = extractOffset(timeStr);
-  debug.parsing('Parsed ISO with timezone:', {
-    input: timeStr,
-    hasZ: timeStr.includes('Z'),
-    offset,
-    result: date.toISOString(),
-  });
+  if (debug.parsing.enabled) {
+    debug.parsing('Parsed ISO with timezone:', {
+      input: timeStr,
+      hasZ: timeStr.includes('Z'),
+      offset,
+      result: date.toISOString(),
+    });
+  }
 
   return {
     date,
@@ -101,6 +106,227 @@ function parseISOWithTimezone(timeStr: string): ParseResult | null {
   };
 }
 
+// Character codes for the canonical ISO scanner
+const CHAR_0 = 48;
+const CHAR_DASH = 45;
+const CHAR_COLON = 58;
+const CHAR_DOT = 46;
+const CHAR_SPACE = 32;
+const CHAR_T = 84;
+const CHAR_Z = 90;
+const CHAR_PLUS = 43;
+const MS_PER_MINUTE = 60 * 1000;
+const MS_PER_HOUR = 60 * MS_PER_MINUTE;
+// Most fraction digits for which all of ss.fff... fits a safe integer
+const MAX_FRACTION_DIGITS = 13;
+
+/**
+ * Fields of a canonical ISO 8601 string
+ */
+interface ScannedISO {
+  /** Wall-clock milliseconds as if UTC (fractional like date-fns' parseISO) */
+  wall: number;
+  /** 'Z', 'offset' (±hh:mm), or undefined for a local time */
+  zone: 'Z' | 'offset' | undefined;
+  /** Minutes east of UTC given by the zone designator */
+  offset: number;
+  /** Whether the seconds had a fraction */
+  fraction: boolean;
+}
+
+/**
+ * Value of `count` decimal digits at `start`, or -1 if any is not a digit
+ */
+function readDigits(str: string, start: number, count: number): number {
+  let value = 0;
+  for (let i = start; i < start + count; i++) {
+    const digit = str.charCodeAt(i) - CHAR_0;
+    if (!(digit >= 0 && digit <= 9)) {
+      return -1;
+    }
+    value = value * 10 + digit;
+  }
+  return value;
+}
+
+/**
+ * Two-digit field at `start`, or -1 if not digits or above `max`
+ */
+function readField(str: string, start: number, max: number): number {
+  const value = readDigits(str, start, 2);
+  return value <= max ? value : -1;
+}
+
+/**
+ * Days from 1970-01-01 to a proleptic Gregorian date
+ */
+function daysFromCivil(year: number, month: number, day: number): number {
+  const y = month <= 2 ? year - 1 : year;
+  const era = Math.floor(y / 400);
+  const yearOfEra = y - era * 400;
+  const dayOfYear = Math.floor((153 * ((month + 9) % 12) + 2) / 5) + day - 1;
+  const dayOfEra =
+    yearOfEra * 365 + Math.floor(yearOfEra / 4) - Math.floor(yearOfEra / 100) + dayOfYear;
+  return era * 146097 + dayOfEra - 719468;
+}
+
+/**
+ * Midnight (as if UTC) of a YYYY-MM-DD prefix, or undefined
+ */
+function scanDate(str: string): number | undefined {
+  const year = readDigits(str, 0, 4);
+  const month = readField(str, 5, 12);
+  const day = readField(str, 8, 31);
+  if (str.charCodeAt(4) !== CHAR_DASH || str.charCodeAt(7) !== CHAR_DASH) {
+    return undefined;
+  }
+  if (year < 0 || month < 1 || day < 1) {
+    return undefined;
+  }
+  const days = daysFromCivil(year, month, day);
+  // Past the end of the month (daysFromCivil rolls over like Date.UTC)
+  if (day > 28 && daysFromCivil(year, month + 1, 1) <= days) {
+    return undefined;
+  }
+  return days * MS_PER_DAY;
+}
+
+/**
+ * Seconds with an optional .fraction at `start`, and the end index
+ *
+ * The fraction is divided out of an exact integer, which rounds the same
+ * way parseFloat does (NaN for a bad whole part or an empty fraction).
+ */
+function scanFraction(str: string, start: number, whole: number): [number, number] {
+  if (whole < 0 || str.charCodeAt(start) !== CHAR_DOT) {
+    return [whole < 0 ? NaN : whole, start];
+  }
+  let end = start + 1;
+  let digits = whole;
+  while (end - start <= MAX_FRACTION_DIGITS && readDigits(str, end, 1) >= 0) {
+    digits = digits * 10 + readDigits(str, end, 1);
+    end++;
+  }
+  return [end === start + 1 ? NaN : digits / Math.pow(10, end - start - 1), end];
+}
+
+/**
+ * Milliseconds of a THH:mm[:ss[.fff]] time at index 10, and the end index
+ */
+function scanTime(str: string): [number, number] | undefined {
+  const separator = str.charCodeAt(10);
+  const hours = readField(str, 11, 23);
+  const minutes = readField(str, 14, 59);
+  if (separator !== CHAR_T && separator !== CHAR_SPACE) {
+    return undefined;
+  }
+  if (str.charCodeAt(13) !== CHAR_COLON || hours < 0 || minutes < 0) {
+    return undefined;
+  }
+  let [seconds, end] = [0, 16];
+  if (str.charCodeAt(16) === CHAR_COLON) {
+    [seconds, end] = scanFraction(str, 19, readField(str, 17, 59));
+  }
+  // Same operations (and rounding) as date-fns' parseISO
+  const time = hours * MS_PER_HOUR + minutes * MS_PER_MINUTE + seconds * 1000;
+  return Number.isNaN(time) ? undefined : [time, end];
+}
+
+/**
+ * Minutes east of UTC of a ±hh:mm designator from `start` to the end
+ */
+function scanOffset(str: string, start: number): number | undefined {
+  const sign = str.charCodeAt(start);
+  const hours = readDigits(str, start + 1, 2);
+  const minutes = readField(str, start + 4, 59);
+  if (sign !== CHAR_PLUS && sign !== CHAR_DASH) {
+    return undefined;
+  }
+  if (str.charCodeAt(start + 3) !== CHAR_COLON || start + 6 !== str.length) {
+    return undefined;
+  }
+  if (hours < 0 || minutes < 0) {
+    return undefined;
+  }
+  const offset = hours * 60 + minutes;
+  return sign === CHAR_PLUS ? offset : -offset;
+}
+
+/**
+ * Zone designator from `start` to the end of the string
+ */
+function scanZone(str: string, start: number): Pick<ScannedISO, 'zone' | 'offset'> | undefined {
+  if (start === str.length) {
+    return { zone: undefined, offset: 0 };
+  }
+  if (str.charCodeAt(start) === CHAR_Z) {
+    return start + 1 === str.length ? { zone: 'Z', offset: 0 } : undefined;
+  }
+  const offset = scanOffset(str, start);
+  return offset === undefined ? undefined : { zone: 'offset', offset };
+}
+
+/**
+ * Single pass over the canonical ISO 8601 shapes: YYYY-MM-DD, or a date
+ * with THH:mm, THH:mm:ss or THH:mm:ss.fff (T or space) and an optional
+ * Z or ±hh:mm. Anything else returns undefined.
+ */
+function scanISO(str: string): ScannedISO | undefined {
+  const midnight = scanDate(str);
+  if (midnight === undefined) {
+    return undefined;
+  }
+  if (str.length === 10) {
+    return { wall: midnight, zone: undefined, offset: 0, fraction: false };
+  }
+  const time = scanTime(str);
+  const zone = time && scanZone(str, time[1]);
+  if (!time || !zone) {
+    return undefined;
+  }
+  return { wall: midnight + time[0], ...zone, fraction: time[1] > 19 };
+}
+
+/**
+ * Parse canonical ISO 8601 strings without regexes or date-fns
+ *
+ * Gives the same result as the general strategies below; returns
+ * undefined for other shapes, system-local times and fractional local
+ * times, which are left to them.
+ */
+function parseCanonicalISO(timeStr: string, timezone?: string): ParseResult | undefined {
+  const scanned = scanISO(timeStr);
+  if (!scanned) {
+    return undefined;
+  }
+  if (scanned.zone === undefined) {
+    // Apply project convention: "" = UTC, undefined = local
+    const effectiveTimezone = timezone === '' ? 'UTC' : timezone;
+    if (!effectiveTimezone || scanned.fraction) {
+      return undefined;
+    }
+    const instant = wallClockToInstant(effectiveTimezone, scanned.wall);
+    if (!Number.isFinite(instant)) {
+      return undefined;
+    }
+    debug.parsing('Fast-parsed local time %s in %s', timeStr, effectiveTimezone);
+    return {
+      date: new Date(instant),
+      detectedTimezone: effectiveTimezone,
+      hasExplicitTimezone: false,
+    };
+  }
+
+  debug.parsing('Fast-parsed ISO with timezone %s', timeStr);
+  return {
+    // new Date truncates fractional milliseconds, as in parseISO
+    date: new Date(scanned.wall - scanned.offset * MS_PER_MINUTE),
+    detectedTimezone: scanned.zone === 'Z' ? 'UTC' : 'offset',
+    hasExplicitTimezone: true,
+    ...(scanned.zone === 'offset' && { offset: scanned.offset }),
+  };
+}
+
 /**
  * Parse as local time in specified timezone
  */
@@ -136,11 +362,13 @@ function parseLocalTime(timeStr: string, timezone?: string): ParseResult {
     throw new DateParsingError(`Invalid date format: ${timeStr}`, { input: timeStr, timezone });
   }
 
-  debug.parsing('Parsed local time:', {
-    input: timeStr,
-    timezone: effectiveTimezone ?? 'local',
-    result: date.toISOString(),
-  });
+  if (debug.parsing.enabled) {
+    debug.parsing('Parsed local time:', {
+      input: timeStr,
+      timezone: effectiveTimezone ?? 'local',
+      result: date.toISOString(),
+    });
+  }
 
   return {
     date,
@@ -168,7 +396,9 @@ export function parseTimeInput(
   input: string | number | undefined | null,
   timezone?: string
 ): ParseResult {
-  debug.parsing('parseTimeInput called with:', { input, timezone });
+  if (debug.parsing.enabled) {
+    debug.parsing('parseTimeInput called with:', { input, timezone });
+  }
 
   // Handle undefined/null/empty
   if (input == null || input === '') {
@@ -179,6 +409,10 @@ export function parseTimeInput(
   // Normalize to string
   const timeStr = String(input);
 
+  // Canonical ISO strings (nearly all input) take a single pass
+  const fastResult = parseCanonicalISO(timeStr, timezone);
+  if (fastResult) return fastResult;
+
   // Try parsing strategies in order
   const unixResult = parseUnixTimestamp(timeStr);
   if (unixResult) return unixResult;
@@ -0,0 +1,184 @@
+/**
+ * Tool argument validation compiled from the tools' JSON Schemas
+ *
+ * Each inputSchema in TOOL_DEFINITIONS is turned into a list of
+ * per-property check functions once, at startup. executeToolFunction runs
+ * them before anything else looks at the arguments, so malformed or
+ * oversized input is rejected before it is hashed into a cache key or
+ * reaches a tool. Messages match the tools' own checks.
+ *
+ * Supported keywords: type (including unions), required, enum, items,
+ * maxLength and maxItems. Enum values match case-insensitively and are
+ * normalised to the schema's spelling, so tools get canonical values.
+ * Strings without a maxLength are limited to LIMITS.MAX_STRING_LENGTH and
+ * arrays without a maxItems to LIMITS.MAX_ARRAY_LENGTH. The tools keep
+ * their own checks, since they are also called directly.
+ */
+
+import { ValidationError } from '../adapters/mcp-sdk/errors';
+
+import { debug } from './debug';
+import { LIMITS, validateArrayLength, validateStringLength } from './validation';
+
+type SchemaType = 'string' | 'number' | 'integer' | 'boolean' | 'array' | 'object';
+
+export interface PropertySchema {
+  type?: SchemaType | readonly SchemaType[];
+  enum?: readonly string[];
+  items?: PropertySchema;
+  maxLength?: number;
+  maxItems?: number;
+  description?: string;
+}
+
+export interface ObjectSchema {
+  type: 'object';
+  properties: Readonly<Record<string, PropertySchema>>;
+  required?: readonly string[];
+}
+
+/** Returns the arguments (an empty object for none) or throws ValidationError */
+export type ArgsValidator = (args: unknown) => Record<string, unknown>;
+
+/** Throws ValidationError or returns the (possibly normalised) value */
+type ValueCheck = (value: unknown, field: string) => unknown;
+
+const TYPE_TESTS: Record<SchemaType, (value: unknown) => boolean> = {
+  string: (value) => typeof value === 'string',
+  number: (value) => typeof value === 'number',
+  integer: (value) => Number.isInteger(value),
+  boolean: (value) => typeof value === 'boolean',
+  array: (value) => Array.isArray(value),
+  object: (value) => typeof value === 'object' && value !== null && !Array.isArray(value),
+};
+
+const TYPE_NAMES: Record<SchemaType, string> = {
+  string: 'a string',
+  number: 'a number',
+  integer: 'an integer',
+  boolean: 'a boolean',
+  array: 'an array',
+  object: 'an object',
+};
+
+function compileType(types: readonly SchemaType[]): ValueCheck {
+  // eslint-disable-next-line security/detect-object-injection -- Schema type names
+  const tests = types.map((type) => TYPE_TESTS[type]);
+  // eslint-disable-next-line security/detect-object-injection -- Schema type names
+  const expected = types.map((type) => TYPE_NAMES[type]).join(' or ');
+  return (value, field) => {
+    if (!tests.some((test) => test(value))) {
+      debug.validation('%s must be %s, got %s', field, expected, typeof value);
+      throw new ValidationError(`${field} must be ${expected}`, {
+        field,
+        type: typeof value,
+      });
+    }
+    return value;
+  };
+}
+
+function compileEnum(values: readonly string[]): ValueCheck {
+  const canonical = new Map(values.map((value) => [value.toLowerCase(), value]));
+  const list = values.join(', ');
+  return (value, field) => {
+    const match = typeof value === 'string' ? canonical.get(value.toLowerCase()) : undefined;
+    if (match === undefined) {
+      debug.validation('Invalid %s: %s', field, value);
+      throw new ValidationError(`Invalid ${field}: ${String(value)}. Must be one of: ${list}`, {
+        [field]: value,
+      });
+    }
+    return match;
+  };
+}
+
+function compileLengths(schema: PropertySchema): ValueCheck {
+  const maxLength = schema.maxLength ?? LIMITS.MAX_STRING_LENGTH;
+  const maxItems = schema.maxItems ?? LIMITS.MAX_ARRAY_LENGTH;
+  return (value, field) => {
+    if (typeof value === 'string') {
+      validateStringLength(value, maxLength, field);
+    } else if (Array.isArray(value)) {
+      validateArrayLength(value, maxItems, field);
+    }
+    return value;
+  };
+}
+
+function compileItems(items: PropertySchema): ValueCheck {
+  const check = compileProperty(items);
+  return (value, field) => {
+    if (!Array.isArray(value)) {
+      return value;
+    }
+    const normalised = value.map((item, index) => check(item, `${field}[${index}]`));
+    return normalised.every((item, index) => item === value[index]) ? value : normalised;
+  };
+}
+
+/**
+ * Compile one property schema into a single check
+ */
+function compileProperty(schema: PropertySchema): ValueCheck {
+  const checks: ValueCheck[] = [];
+  if (schema.type !== undefined) {
+    checks.push(compileType(typeof schema.type === 'string' ? [schema.type] : schema.type));
+  }
+  if (schema.enum) {
+    checks.push(compileEnum(schema.enum));
+  }
+  checks.push(compileLengths(schema));
+  if (schema.items) {
+    checks.push(compileItems(schema.items));
+  }
+  return (value, field) => checks.reduce((current, check) => check(current, field), value);
+}
+
+function checkRequired(record: Record<string, unknown>, required: readonly string[]): void {
+  for (const field of required) {
+    // eslint-disable-next-line security/detect-object-injection -- Field from the schema
+    if (record[field] === undefined || record[field] === null) {
+      debug.validation('%s is required', field);
+      throw new ValidationError(`${field} is required`, { field });
+    }
+  }
+}
+
+/**
+ * Compile an object schema into an argument validator
+ *
+ * Missing (undefined or null) required properties are rejected; optional
+ * ones are left to the tool's defaults. Properties the schema doesn't
+ * describe are passed through. The caller's object is never modified:
+ * normalised values go into a copy.
+ */
+export function compileSchema(schema: ObjectSchema): ArgsValidator {
+  const required = schema.required ?? [];
+  const properties = Object.entries(schema.properties).map(
+    ([field, property]) => [field, compileProperty(property)] as const
+  );
+
+  return (args) => {
+    const params = args ?? {};
+    if (!TYPE_TESTS.object(params)) {
+      throw new ValidationError('Arguments must be an object', { type: typeof args });
+    }
+    let record = params as Record<string, unknown>;
+    checkRequired(record, required);
+    for (const [field, check] of properties) {
+      // eslint-disable-next-line security/detect-object-injection -- Field from the schema
+      const value = record[field];
+      if (value === undefined || value === null) {
+        continue;
+      }
+      const normalised = check(value, field);
+      if (normalised !== value) {
+        record = record === params ? { ...record } : record;
+        // eslint-disable-next-line security/detect-object-injection -- Field from the schema
+        record[field] = normalised;
+      }
+    }
+    return record;
+  };
+}
@@ -0,0 +1,112 @@
+/**
+ * Timezone Registry
+ *
+ * Answers "is this a timezone?" and "what is its canonical id?" from hash
+ * lookups instead of constructing an Intl.DateTimeFormat per request. The
+ * registry is built once, on first use, from Intl.supportedValuesOf plus a
+ * table of common aliases that list leaves out.
+ *
+ * Other names Intl accepts (rarer aliases, different letter case) are
+ * resolved through Intl once and remembered. Rejected names are remembered
+ * too, so a flood of made-up zones pays the Intl failure path once per
+ * name. Both memos are bounded, dropping the oldest entries first.
+ */
+
+import { debug } from './debug';
+import { getDateTimeFormat } from './formatterPool';
+import { getFixedOffset } from './zoneOffsets';
+
+// Aliases missing from Intl.supportedValuesOf that callers commonly send
+const TIMEZONE_ALIASES = [
+  'UTC',
+  'Etc/UTC',
+  'Etc/GMT',
+  'GMT',
+  'US/Eastern',
+  'US/Central',
+  'US/Mountain',
+  'US/Pacific',
+  'US/Alaska',
+  'US/Hawaii',
+  'Asia/Calcutta',
+  'Asia/Saigon',
+  'Europe/Kiev',
+];
+
+const MAX_RESOLVED_NAMES = 1000;
+const MAX_REJECTED_NAMES = 1000;
+
+let registry: Map<string, string> | undefined;
+// Names outside the registry, oldest first
+const resolvedNames = new Map<string, string>();
+const rejectedNames = new Set<string>();
+
+function resolveWithIntl(timezone: string): string | null {
+  try {
+    return getDateTimeFormat(timezone, 'zone').resolvedOptions().timeZone;
+  } catch {
+    return null;
+  }
+}
+
+function getRegistry(): Map<string, string> {
+  if (!registry) {
+    registry = new Map();
+    for (const id of Intl.supportedValuesOf('timeZone')) {
+      registry.set(id, id);
+    }
+    for (const alias of TIMEZONE_ALIASES) {
+      const id = resolveWithIntl(alias);
+      if (id !== null) {
+        registry.set(alias, id);
+      }
+    }
+    debug.timezone('Timezone registry built with %d names', registry.size);
+  }
+  return registry;
+}
+
+/**
+ * Canonical Intl id for a timezone name (e.g. "US/Eastern" → "America/New_York")
+ *
+ * @param timezone - Timezone name as given by the caller
+ * @returns Canonical id, or undefined if Intl does not know the name
+ */
+export function getTimezoneId(timezone: string): string | undefined {
+  const known = getRegistry().get(timezone) ?? resolvedNames.get(timezone);
+  if (known !== undefined) {
+    return known;
+  }
+  if (rejectedNames.has(timezone)) {
+    return undefined;
+  }
+
+  const id = resolveWithIntl(timezone);
+  if (id === null) {
+    debug.timezone('Rejected timezone: %s', timezone);
+    if (rejectedNames.size >= MAX_REJECTED_NAMES) {
+      rejectedNames.delete(rejectedNames.values().next().value as string);
+    }
+    rejectedNames.add(timezone);
+    return undefined;
+  }
+  if (resolvedNames.size >= MAX_RESOLVED_NAMES) {
+    resolvedNames.delete(resolvedNames.keys().next().value as string);
+  }
+  resolvedNames.set(timezone, id);
+  return id;
+}
+
+/**
+ * Whether a timezone string is usable for date-fns-tz style conversions:
+ * a name Intl knows, or a fixed offset such as "Z", "+05", "-08:00"
+ *
+ * @param timezone - Non-empty timezone string
+ */
+export function isKnownTimezone(timezone: string): boolean {
+  const fixed = getFixedOffset(timezone);
+  if (fixed !== undefined) {
+    return !Number.isNaN(fixed);
+  }
+  return getTimezoneId(timezone) !== undefined;
+}
@@ -1,3 +1,7 @@
+import { addDays, startOfDay } from 'date-fns';
+
+import { fromZonedDate, toZonedDate } from './zoneOffsets';
+
 /**
  * Resolves timezone parameter according to project convention:
  * - undefined → system's local timezone (defaultTimezone)
@@ -11,3 +15,15 @@ export function resolveTimezone(timezone: string | undefined, defaultTimezone: s
   if (timezone === '') return 'UTC';
   return timezone ?? defaultTimezone;
 }
+
+/**
+ * First instant after `now` at which the calendar date in `timezone` changes.
+ *
+ * Used as a validity bound for results that depend on "today". Zones that
+ * skip midnight on a DST change use date-fns-tz's mapping of the missing
+ * local time.
+ */
+export function getNextLocalMidnight(now: Date, timezone: string): Date {
+  const tomorrow = startOfDay(addDays(toZonedDate(now, timezone), 1));
+  return fromZonedDate(tomorrow, timezone);
+}
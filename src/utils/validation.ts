@@ -1,5 +1,4 @@
 import { parseISO, isValid } from 'date-fns';
-import { getTimezoneOffset } from 'date-fns-tz';
 
 import { ValidationError } from '../adapters/mcp-sdk/errors';
 import type { TimeUnit, RecurrencePattern, TimeServerError } from '../types';
@@ -7,6 +6,7 @@ import type { TimeUnit, RecurrencePattern, TimeServerError } from '../types';
 import { TimeServerErrorCodes } from '../types';
 
 import { debug } from './debug';
+import { isKnownTimezone } from './timezoneRegistry';
 
 // Security limits for input validation
 export const LIMITS = {
@@ -18,7 +18,7 @@ export const LIMITS = {
 };
 
 /**
- * Validates a timezone string using date-fns-tz
+ * Validates a timezone string against the timezone registry
  * @param timezone - The timezone to validate
  * @param allowEmpty - Whether to allow empty string (defaults to UTC)
  * @returns true if valid timezone, false otherwise
@@ -31,9 +31,7 @@ export function validateTimezone(timezone: string | undefined | null, allowEmpty
   // Check length first for security
   validateStringLength(timezone, LIMITS.MAX_TIMEZONE_LENGTH, 'timezone');
 
-  // Use getTimezoneOffset - it returns NaN for invalid timezones
-  const offset = getTimezoneOffset(timezone, new Date());
-  return !isNaN(offset);
+  return isKnownTimezone(timezone);
 }
 
 /**
@@ -1,8 +1,199 @@
-import { hashCacheKey } from '../cache/cacheKeyHash';
+import { resolveCacheKey, unwrapCacheEntry, wrapCacheEntry } from '../cache/cacheKeyStrategy';
+import type { ResolvedCacheKey } from '../cache/cacheKeyStrategy';
 import { cache } from '../cache/timeCache';
 
 import { debug } from './debug';
 
+/**
+ * Tracks when the values produced during one tool call go stale.
+ * Only usable if every withCache call in that window computed (and stored)
+ * a fresh value - on a hit we don't know how long the entry has left.
+ */
+interface ExpiryCapture {
+  expiresAt: number;
+  reusable: boolean;
+}
+
+let activeCapture: ExpiryCapture | null = null;
+
+function markNotReusable(): void {
+  if (activeCapture) {
+    activeCapture.reusable = false;
+  }
+}
+
+function noteCacheStore(ttl: number): void {
+  if (!activeCapture) {
+    return;
+  }
+  if (ttl <= 0) {
+    // NodeCache treats 0 as "never expires" - don't let that leak upwards
+    activeCapture.reusable = false;
+    return;
+  }
+  activeCapture.expiresAt = Math.min(activeCapture.expiresAt, Date.now() + ttl * 1000);
+}
+
+/**
+ * Run a synchronous function and report when the cached values it produced
+ * expire. Used by the response cache so serialized payloads never outlive
+ * the result entries they were built from.
+ *
+ * @param fn - Function that (directly or indirectly) calls withCache
+ * @returns The function's value and the earliest expiry timestamp (ms), or
+ *          undefined if the value must not be reused
+ */
+export function captureCacheExpiry<T>(fn: () => T): { value: T; expiresAt: number | undefined } {
+  const previous = activeCapture;
+  const capture: ExpiryCapture = { expiresAt: Infinity, reusable: true };
+  activeCapture = capture;
+  try {
+    const value = fn();
+    const usable = capture.reusable && Number.isFinite(capture.expiresAt);
+    return { value, expiresAt: usable ? capture.expiresAt : undefined };
+  } finally {
+    activeCapture = previous;
+    if (previous) {
+      previous.reusable = previous.reusable && capture.reusable;
+      previous.expiresAt = Math.min(previous.expiresAt, capture.expiresAt);
+    }
+  }
+}
+
+export interface WithCacheOptions {
+  /**
+   * Builds a semantic key from parsed inputs (instants, canonical timezone
+   * ids, resolved defaults). Only consulted when the raw key misses, so the
+   * parsing it does stays off the hot path. Return undefined to skip.
+   *
+   * Must only fold together inputs that produce identical results and
+   * would pass the same validation.
+   */
+  canonicalKey?: () => string | undefined;
+
+  /**
+   * Opt-in probabilistic early refresh for withCacheAsync. A hit in the
+   * last part of the entry's lifetime may start a background recompute
+   * while the current value is served, so short-TTL entries are refreshed
+   * by one caller instead of expiring under all of them at once. Larger
+   * values refresh earlier; 1 is a sensible default.
+   */
+  earlyRefreshBeta?: number;
+
+  /**
+   * Validity-interval caching: called right after compute, returns the
+   * epoch milliseconds at which the computed value stops being correct
+   * (e.g. the next local midnight for day counts). The entry then expires
+   * at exactly that instant instead of after the fixed TTL. Return
+   * undefined to use the fixed TTL.
+   */
+  validUntil?: () => number | undefined;
+}
+
+/** Share of the TTL used as the expected recompute time for early refresh */
+const EARLY_REFRESH_WINDOW = 0.1;
+
+/**
+ * Computations in progress, keyed by raw cache key (not the storage key,
+ * so a fast-hash collision can't hand one caller another key's value)
+ */
+const inFlight = new Map<string, Promise<unknown>>();
+
+function readCache<T>(resolved: ResolvedCacheKey, rawKey: string): T | undefined {
+  // Wrap in try-catch to handle cache read errors gracefully
+  try {
+    return unwrapCacheEntry<T>(resolved, rawKey, cache.get(resolved.storageKey));
+  } catch (error) {
+    // If cache read fails, continue to compute
+    debug.error('Cache read error: %O', error);
+    return undefined;
+  }
+}
+
+function writeCache(
+  resolved: ResolvedCacheKey,
+  rawKey: string,
+  value: unknown,
+  ttl: number
+): boolean {
+  // Cache write failure is non-fatal, the caller still has the value
+  try {
+    cache.set(resolved.storageKey, wrapCacheEntry(resolved, rawKey, value), ttl);
+    return true;
+  } catch (error) {
+    debug.error('Cache write error: %O', error);
+    return false;
+  }
+}
+
+interface CanonicalKey {
+  rawKey: string;
+  resolved: ResolvedCacheKey;
+}
+
+function buildCanonicalKey(options: WithCacheOptions | undefined): CanonicalKey | undefined {
+  if (!options?.canonicalKey) {
+    return undefined;
+  }
+  try {
+    const rawKey = options.canonicalKey();
+    return rawKey === undefined ? undefined : { rawKey, resolved: resolveCacheKey(rawKey) };
+  } catch (error) {
+    // Inputs the canonicalizer can't handle just use the raw key
+    debug.cache('Canonical key skipped: %O', error);
+    return undefined;
+  }
+}
+
+/**
+ * Remaining lifetime (seconds) of an entry, falling back to the full TTL
+ */
+function remainingTtl(storageKey: string, ttl: number): number {
+  let expiresAt: number | undefined;
+  try {
+    expiresAt = cache.getTtl(storageKey);
+  } catch {
+    return ttl;
+  }
+  if (!expiresAt) {
+    return ttl;
+  }
+  return Math.max((expiresAt - Date.now()) / 1000, 0.001);
+}
+
+/**
+ * TTL for a freshly computed value: the fixed TTL, or the time left until
+ * the value's validUntil instant (undefined if that has already passed)
+ */
+function storeTtl(ttl: number, options: WithCacheOptions | undefined): number | undefined {
+  const validUntil = options?.validUntil?.();
+  if (validUntil === undefined) {
+    return ttl;
+  }
+  const remaining = (validUntil - Date.now()) / 1000;
+  // NodeCache treats 0 as "never expires", so a value already due is not stored
+  return remaining > 0 ? remaining : undefined;
+}
+
+function storeComputed(
+  resolved: ResolvedCacheKey,
+  cacheKey: string,
+  canonical: CanonicalKey | undefined,
+  result: unknown,
+  ttl: number | undefined
+): void {
+  // Store in cache for future use (ignore cache write errors)
+  if (ttl !== undefined && writeCache(resolved, cacheKey, result, ttl)) {
+    noteCacheStore(ttl);
+    debug.cache('Cache SET for %s (TTL: %ds)', resolved.storageKey.substring(0, 12), ttl);
+  } else {
+    markNotReusable();
+  }
+  if (canonical && ttl !== undefined) {
+    writeCache(canonical.resolved, canonical.rawKey, result, ttl);
+  }
+}
+
 /**
  * Generic cache wrapper that encapsulates the common caching pattern
  * used across all tools. Reduces ~12 lines of boilerplate to 3 lines.
@@ -10,6 +201,7 @@ import { debug } from './debug';
  * @param cacheKey - Raw cache key (will be hashed)
  * @param ttl - Time to live in seconds
  * @param compute - Function that computes the value if not cached
+ * @param options - Optional canonical key builder and validity interval
  * @returns The cached or computed value
  *
  * @example
@@ -24,9 +216,15 @@ import { debug } from './debug';
  * );
  * ```
  */
-export function withCache<T>(cacheKey: string, ttl: number, compute: () => T): T {
-  // Hash the cache key for consistent storage
-  const hashedKey = hashCacheKey(cacheKey);
+export function withCache<T>(
+  cacheKey: string,
+  ttl: number,
+  compute: () => T,
+  options?: WithCacheOptions
+): T {
+  // Hash the cache key for consistent storage (strategy set by CACHE_KEY_STRATEGY)
+  const resolved = resolveCacheKey(cacheKey);
+  const hashedKey = resolved.storageKey;
 
   // Log cache key mapping for debugging (only first 20 chars of key for security)
   if (debug.cache.enabled && cacheKey.length > 20) {
@@ -35,61 +233,119 @@ export function withCache<T>(cacheKey: string, ttl: number, compute: () => T): T
 
   // Try to get from cache
   // Using !== undefined to handle falsy values (0, false, null, '') correctly
-  // Wrap in try-catch to handle cache read errors gracefully
-  let cached: T | undefined;
-  try {
-    cached = cache.get<T>(hashedKey);
-  } catch (error) {
-    // If cache read fails, continue to compute
-    debug.error('Cache read error: %O', error);
-    cached = undefined;
-  }
-
+  const cached = readCache<T>(resolved, cacheKey);
   if (cached !== undefined) {
     debug.cache('Cache HIT for %s (TTL: %ds)', hashedKey.substring(0, 12), ttl);
+    markNotReusable();
     return cached;
   }
 
+  // Same inputs written differently may already be cached under the canonical key
+  const canonical = buildCanonicalKey(options);
+  if (canonical) {
+    const value = readCache<T>(canonical.resolved, canonical.rawKey);
+    if (value !== undefined) {
+      debug.cache('Cache HIT for %s via canonical key', hashedKey.substring(0, 12));
+      // Alias the raw key so the next identical request skips canonicalization
+      writeCache(resolved, cacheKey, value, remainingTtl(canonical.resolved.storageKey, ttl));
+      markNotReusable();
+      return value;
+    }
+  }
+
   debug.cache('Cache MISS for %s - computing...', hashedKey.substring(0, 12));
 
   // Not in cache, compute the value
   const result = compute();
 
-  // Store in cache for future use (ignore cache write errors)
-  try {
-    cache.set(hashedKey, result, ttl);
-    debug.cache('Cache SET for %s (TTL: %ds)', hashedKey.substring(0, 12), ttl);
-  } catch (error) {
-    // Cache write failure is non-fatal, return computed result
-    debug.error('Cache write error: %O', error);
-  }
+  storeComputed(resolved, cacheKey, canonical, result, storeTtl(ttl, options));
 
   return result;
 }
 
 /**
- * Async version of withCache for future use if needed
- * Currently not used as all tools are synchronous
+ * Probabilistic early expiration (XFetch): the closer an entry is to
+ * expiry, the more likely a hit is to trigger a refresh
  */
-export async function withCacheAsync<T>(
+function shouldRefreshEarly(storageKey: string, ttl: number, beta: number | undefined): boolean {
+  if (!beta || beta <= 0 || ttl <= 0) {
+    return false;
+  }
+  const expiresAt = cache.getTtl(storageKey);
+  if (!expiresAt) {
+    return false;
+  }
+  const window = ttl * 1000 * EARLY_REFRESH_WINDOW * beta * -Math.log(Math.random());
+  return expiresAt - Date.now() <= window;
+}
+
+/**
+ * Run compute once per key at a time; concurrent callers share the promise
+ */
+function computeOnce<T>(
+  resolved: ResolvedCacheKey,
   cacheKey: string,
   ttl: number,
-  compute: () => Promise<T>
+  compute: () => Promise<T>,
+  options: WithCacheOptions | undefined
 ): Promise<T> {
-  const hashedKey = hashCacheKey(cacheKey);
-
-  const cached = cache.get<T>(hashedKey);
-  if (cached !== undefined) {
-    return cached;
+  const pending = inFlight.get(cacheKey);
+  if (pending) {
+    debug.cache('Cache JOIN for %s', resolved.storageKey.substring(0, 12));
+    return pending as Promise<T>;
   }
 
-  const result = await compute();
+  const promise = (async (): Promise<T> => {
+    try {
+      const result = await compute();
+      const storeFor = storeTtl(ttl, options);
+      if (storeFor !== undefined) {
+        writeCache(resolved, cacheKey, result, storeFor);
+      }
+      return result;
+    } finally {
+      inFlight.delete(cacheKey);
+    }
+  })();
+  inFlight.set(cacheKey, promise);
+  return promise;
+}
 
-  try {
-    cache.set(hashedKey, result, ttl);
-  } catch {
-    // Cache write failure is non-fatal, return computed result
+/**
+ * Async version of withCache
+ *
+ * Concurrent calls for the same key share one computation, so a burst of
+ * identical requests at expiry computes once instead of once per caller.
+ * Errors are shared with every waiter and never cached.
+ *
+ * @param cacheKey - Raw cache key (will be hashed)
+ * @param ttl - Time to live in seconds
+ * @param compute - Function that computes the value if not cached
+ * @param options - Optional early refresh and validity interval (canonicalKey is not used)
+ * @returns The cached or computed value
+ */
+export async function withCacheAsync<T>(
+  cacheKey: string,
+  ttl: number,
+  compute: () => Promise<T>,
+  options?: WithCacheOptions
+): Promise<T> {
+  const resolved = resolveCacheKey(cacheKey);
+
+  const cached = readCache<T>(resolved, cacheKey);
+  if (cached === undefined) {
+    return computeOnce(resolved, cacheKey, ttl, compute, options);
   }
 
-  return result;
+  if (
+    !inFlight.has(cacheKey) &&
+    shouldRefreshEarly(resolved.storageKey, ttl, options?.earlyRefreshBeta)
+  ) {
+    debug.cache('Cache early refresh for %s', resolved.storageKey.substring(0, 12));
+    computeOnce(resolved, cacheKey, ttl, compute, options).catch((error: unknown) => {
+      // The stale value was already served; the next miss will retry
+      debug.error('Early refresh failed: %O', error);
+    });
+  }
+  return cached;
 }
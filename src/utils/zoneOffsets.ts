@@ -0,0 +1,310 @@
+/**
+ * UTC offsets of timezones from per-zone transition tables
+ *
+ * Each zone's offsets are read from Intl once, a year-long span at a time:
+ * the span is sampled every few days and every change is bisected to
+ * the second. Lookups are then a binary search over the span's transitions.
+ * Tables are built lazily and the least recently used zones are dropped.
+ *
+ * Offsets are in milliseconds (positive east of UTC). Results match
+ * date-fns-tz for the same inputs, including its handling of wall-clock
+ * times that are skipped (gap) or repeated (overlap) by a transition:
+ * toZonedDate/fromZonedDate stand in for toZonedTime/fromZonedTime and
+ * getWallClockOffset for getTimezoneOffset. Fixed offsets ('Z', '+05:30')
+ * and '' (UTC) are accepted like date-fns-tz accepts them; unknown zones
+ * give NaN.
+ *
+ * Day numbers are calendar dates counted from 1970-01-01 (day 0), so a
+ * date's midnight "as if UTC" is day * MS_PER_DAY.
+ */
+
+import { getDateTimeFormat } from './formatterPool';
+
+export const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
+// Transition tables cover fixed spans of (about) a year each
+const SPAN_MS = 366 * MS_PER_DAY;
+// Since 1900 no zone has changed offset twice within a week
+const SCAN_STEP_MS = 3 * MS_PER_DAY;
+const MAX_CACHED_ZONES = 64;
+const MAX_SPANS_PER_ZONE = 512;
+
+interface ZoneSpan {
+  /** Instants (ms) at which an offset takes effect; the first is the span start */
+  starts: number[];
+  /** Offset (ms) in effect from each start until the next */
+  offsets: number[];
+}
+
+interface ZoneTable {
+  formatter: Intl.DateTimeFormat;
+  /** Spans by index (span start / SPAN_MS) */
+  spans: Map<number, ZoneSpan>;
+}
+
+// Least recently used zone first
+const zoneTables = new Map<string, ZoneTable>();
+let lastZone: string | undefined;
+let lastTable: ZoneTable | undefined;
+
+// Same shapes date-fns-tz parses as fixed offsets
+const FIXED_OFFSET_PATTERN = /^(?:Z|([+-])(\d{2})(?::?(\d{2}))?)$/;
+
+/**
+ * Offset of a fixed-offset zone string, NaN if it is out of range, or
+ * undefined if the string names an IANA zone
+ */
+export function getFixedOffset(timezone: string): number | undefined {
+  if (timezone === '') {
+    return 0;
+  }
+  const match = FIXED_OFFSET_PATTERN.exec(timezone);
+  if (!match) {
+    return undefined;
+  }
+  if (match[1] === undefined) {
+    return 0;
+  }
+  const hours = parseInt(match[2], 10);
+  const minutes = match[3] === undefined ? 0 : parseInt(match[3], 10);
+  if (hours > 23 || minutes > 59) {
+    return NaN;
+  }
+  const offset = (hours * 60 + minutes) * 60 * 1000;
+  return match[1] === '+' ? offset : -offset;
+}
+
+/**
+ * Offset at an instant, straight from Intl (whole seconds)
+ */
+function readZoneOffset(formatter: Intl.DateTimeFormat, instant: number): number {
+  const fields = { year: 0, month: 1, day: 1, hour: 0, minute: 0, second: 0 };
+  for (const part of formatter.formatToParts(instant)) {
+    if (part.type in fields) {
+      // eslint-disable-next-line security/detect-object-injection -- checked against fields
+      fields[part.type as keyof typeof fields] = parseInt(part.value, 10);
+    }
+  }
+  const wall = new Date(0);
+  wall.setUTCFullYear(fields.year, fields.month - 1, fields.day);
+  wall.setUTCHours(fields.hour % 24, fields.minute, fields.second, 0);
+
+  // Intl drops milliseconds, so compare against the whole second
+  return wall.getTime() - (instant - (((instant % 1000) + 1000) % 1000));
+}
+
+/**
+ * First whole second in (from, to] whose offset differs from the one at from
+ */
+function bisectTransition(formatter: Intl.DateTimeFormat, from: number, to: number): number {
+  const before = readZoneOffset(formatter, from);
+  let lo = Math.floor(from / 1000);
+  let hi = Math.floor(to / 1000);
+  while (hi - lo > 1) {
+    const mid = Math.floor((lo + hi) / 2);
+    if (readZoneOffset(formatter, mid * 1000) === before) {
+      lo = mid;
+    } else {
+      hi = mid;
+    }
+  }
+  return hi * 1000;
+}
+
+function buildZoneSpan(formatter: Intl.DateTimeFormat, index: number): ZoneSpan {
+  const start = index * SPAN_MS;
+  const span: ZoneSpan = { starts: [start], offsets: [readZoneOffset(formatter, start)] };
+  let previous = span.offsets[0];
+
+  for (let sample = start + SCAN_STEP_MS; sample < start + SPAN_MS + SCAN_STEP_MS; ) {
+    const at = Math.min(sample, start + SPAN_MS - 1000);
+    const offset = readZoneOffset(formatter, at);
+    if (offset !== previous) {
+      span.starts.push(bisectTransition(formatter, at - SCAN_STEP_MS, at));
+      span.offsets.push(offset);
+      previous = offset;
+    }
+    sample += SCAN_STEP_MS;
+  }
+  return span;
+}
+
+/**
+ * Transition table of a zone, or undefined for a zone Intl doesn't know
+ */
+function getZoneTable(timezone: string): ZoneTable | undefined {
+  if (timezone === lastZone && lastTable) {
+    return lastTable;
+  }
+  let table = zoneTables.get(timezone);
+  if (table) {
+    zoneTables.delete(timezone);
+  } else {
+    let formatter: Intl.DateTimeFormat;
+    try {
+      formatter = getDateTimeFormat(timezone, 'fields');
+    } catch {
+      return undefined;
+    }
+    table = { formatter, spans: new Map() };
+    if (zoneTables.size >= MAX_CACHED_ZONES) {
+      zoneTables.delete(zoneTables.keys().next().value as string);
+    }
+  }
+  zoneTables.set(timezone, table);
+  lastZone = timezone;
+  lastTable = table;
+  return table;
+}
+
+function getZoneSpan(table: ZoneTable, index: number): ZoneSpan {
+  let span = table.spans.get(index);
+  if (!span) {
+    span = buildZoneSpan(table.formatter, index);
+    if (table.spans.size >= MAX_SPANS_PER_ZONE) {
+      table.spans.clear();
+    }
+    table.spans.set(index, span);
+  }
+  return span;
+}
+
+/**
+ * Index of the last start at or before an instant
+ */
+function findStart(starts: number[], instant: number): number {
+  let lo = 0;
+  let hi = starts.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    // eslint-disable-next-line security/detect-object-injection -- numeric index
+    if (starts[mid] <= instant) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return lo;
+}
+
+/**
+ * UTC offset of a timezone at an instant
+ *
+ * @param timezone - IANA timezone name, fixed offset, or '' for UTC
+ * @param instant - Milliseconds since the epoch
+ * @returns Offset in milliseconds (local wall time minus UTC), NaN for an unknown zone
+ */
+export function getZoneOffset(timezone: string, instant: number): number {
+  const fixed = getFixedOffset(timezone);
+  if (fixed !== undefined) {
+    return fixed;
+  }
+  const table = getZoneTable(timezone);
+  if (!table || !Number.isFinite(instant)) {
+    return NaN;
+  }
+  // Transitions fall on whole seconds
+  const second = instant - (((instant % 1000) + 1000) % 1000);
+  const span = getZoneSpan(table, Math.floor(second / SPAN_MS));
+  return span.offsets[findStart(span.starts, second)];
+}
+
+/**
+ * Whether a timezone's offset changes in (from, to]
+ */
+export function zoneOffsetChanges(timezone: string, from: number, to: number): boolean {
+  if (getFixedOffset(timezone) !== undefined) {
+    return false;
+  }
+  const table = getZoneTable(timezone);
+  if (!table) {
+    return false;
+  }
+  for (let index = Math.floor(from / SPAN_MS); index <= Math.floor(to / SPAN_MS); index++) {
+    const { starts } = getZoneSpan(table, index);
+    for (let i = 1; i < starts.length; i++) {
+      // eslint-disable-next-line security/detect-object-injection -- numeric index
+      if (starts[i] > from && starts[i] <= to) {
+        return true;
+      }
+    }
+  }
+  return false;
+}
+
+/**
+ * Process-local date fields of a time value, read back as UTC
+ */
+function localFieldsAsUtc(time: number): number {
+  const local = new Date(time);
+  const utc = new Date(0);
+  utc.setUTCFullYear(local.getFullYear(), local.getMonth(), local.getDate());
+  utc.setUTCHours(
+    local.getHours(),
+    local.getMinutes(),
+    local.getSeconds(),
+    local.getMilliseconds()
+  );
+  return utc.getTime();
+}
+
+/**
+ * Offset that applies to a wall-clock time in a timezone
+ *
+ * The wall-clock time is given as milliseconds whose UTC fields are the
+ * local fields. In a gap the later offset is used; in an overlap the
+ * result follows date-fns-tz's first guess. Same as date-fns-tz's
+ * getTimezoneOffset(timezone, new Date(wall)).
+ */
+export function getWallClockOffset(timezone: string, wall: number): number {
+  const fixed = getFixedOffset(timezone);
+  if (fixed !== undefined) {
+    return fixed;
+  }
+  const guess = getZoneOffset(timezone, localFieldsAsUtc(wall));
+  const second = getZoneOffset(timezone, wall - guess);
+  if (guess === second) {
+    return guess;
+  }
+  const third = getZoneOffset(timezone, wall - second);
+  return second === third ? second : Math.max(second, third);
+}
+
+/**
+ * Instant of a wall-clock time (UTC fields = local fields) in a timezone
+ */
+export function wallClockToInstant(timezone: string, wall: number): number {
+  return wall - getWallClockOffset(timezone, wall);
+}
+
+/**
+ * Date whose process-local fields show the instant's time in a timezone
+ * (same as date-fns-tz toZonedTime)
+ */
+export function toZonedDate(date: Date, timezone: string): Date {
+  const shifted = new Date(date.getTime() + getZoneOffset(timezone, date.getTime()));
+  const result = new Date(0);
+  result.setFullYear(shifted.getUTCFullYear(), shifted.getUTCMonth(), shifted.getUTCDate());
+  result.setHours(
+    shifted.getUTCHours(),
+    shifted.getUTCMinutes(),
+    shifted.getUTCSeconds(),
+    shifted.getUTCMilliseconds()
+  );
+  return result;
+}
+
+/**
+ * Instant at which a timezone's clock shows a date's process-local fields
+ * (same as date-fns-tz fromZonedTime)
+ */
+export function fromZonedDate(date: Date, timezone: string): Date {
+  return new Date(wallClockToInstant(timezone, localFieldsAsUtc(date.getTime())));
+}
+
+/**
+ * Calendar date (day number) of an instant in a timezone
+ */
+export function getLocalDayNumber(timezone: string, instant: number): number {
+  return Math.floor((instant + getZoneOffset(timezone, instant)) / MS_PER_DAY);
+}
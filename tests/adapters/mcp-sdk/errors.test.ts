@@ -32,6 +32,20 @@ describe('MCP SDK Adapter - Error Classes', () => {
       expect(error.stack).toBeDefined();
       expect(error.stack).toContain('BaseError');
     });
+
+    it('should skip the stack trace for expected (4xx) errors', () => {
+      const error = new BaseError('Test error', 'TEST_ERROR', 400);
+      expect(error.stack).toBe('BaseError: Test error');
+      expect(new ValidationError('Invalid input').stack).toBe('ValidationError: Invalid input');
+    });
+
+    it('should leave Error.stackTraceLimit unchanged', () => {
+      const limit = Error.stackTraceLimit;
+      const error = new ValidationError('Invalid input');
+      expect(error.status).toBe(400);
+      expect(Error.stackTraceLimit).toBe(limit);
+      expect(new Error('other').stack).toContain('\n    at ');
+    });
   });
 
   describe('ValidationError', () => {
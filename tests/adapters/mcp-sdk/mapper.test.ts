@@ -5,8 +5,9 @@
  */
 
 import { McpError, ErrorCode } from '@modelcontextprotocol/sdk/types.js';
-import { mapToMcpError } from '../../../src/adapters/mcp-sdk/mapper';
+import { mapToMcpError, toErrorResponse } from '../../../src/adapters/mcp-sdk/mapper';
 import {
+  BaseError,
   TimeCalculationError,
   TimezoneError,
   BusinessHoursError,
@@ -126,4 +127,28 @@ describe('MCP SDK Adapter - Error Mapping', () => {
       expect(mcpError.data).toEqual(details);
     });
   });
+
+  describe('toErrorResponse', () => {
+    const errors: Array<[string, unknown]> = [
+      ['ValidationError', new ValidationError('Missing field', { field: 'timezone' })],
+      ['TimezoneError', new TimezoneError('Invalid timezone: XYZ', 'XYZ')],
+      ['DateParsingError', new DateParsingError('Invalid date', { input: 'x' })],
+      ['BusinessHoursError', new BusinessHoursError('Start after end')],
+      ['4xx BaseError', new BaseError('Bad input', 'CUSTOM', 422)],
+      ['HolidayDataError', new HolidayDataError('Holiday data unavailable')],
+      ['TimeCalculationError', new TimeCalculationError('Overflow')],
+      ['Error', new Error('Generic failure')],
+      ['McpError', new McpError(ErrorCode.InvalidRequest, 'Already mapped', { a: 1 })],
+    ];
+
+    it.each(errors)('should give the same payload as mapToMcpError for %s', (_name, error) => {
+      const mcpError = mapToMcpError(error, 'testTool');
+
+      expect(toErrorResponse(error, 'testTool')).toEqual({
+        code: mcpError.code,
+        message: mcpError.message,
+        data: mcpError.data,
+      });
+    });
+  });
 });
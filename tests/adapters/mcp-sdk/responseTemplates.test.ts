@@ -0,0 +1,46 @@
+/**
+ * Tests for pre-serialized static responses
+ */
+
+import { PassThrough } from 'stream';
+
+import {
+  preserializeResult,
+  serializeTemplated,
+  TemplatedStdioTransport,
+} from '../../../src/adapters/mcp-sdk/responseTemplates';
+
+describe('MCP SDK Adapter - Response templates', () => {
+  const result = preserializeResult({ tools: [{ name: 'a', inputSchema: { type: 'object' } }] });
+
+  it('should splice the id into a pre-serialized result', () => {
+    const text = serializeTemplated({ jsonrpc: '2.0', id: 7, result });
+
+    expect(text?.endsWith('\n')).toBe(true);
+    expect(JSON.parse(text as string)).toEqual({ jsonrpc: '2.0', id: 7, result });
+    const withStringId = serializeTemplated({ jsonrpc: '2.0', id: 'req-1', result });
+    expect(JSON.parse(withStringId as string).id).toBe('req-1');
+  });
+
+  it('should leave other messages to the SDK', () => {
+    expect(serializeTemplated({ jsonrpc: '2.0', id: 1, result: { tools: [] } })).toBeUndefined();
+    const notification = { jsonrpc: '2.0' as const, method: 'notifications/initialized' };
+    expect(serializeTemplated(notification)).toBeUndefined();
+  });
+
+  it('should write templated and regular messages in order', async () => {
+    const output = new PassThrough();
+    const transport = new TemplatedStdioTransport(new PassThrough(), output);
+    let written = '';
+    output.on('data', (chunk: Buffer) => (written += chunk.toString()));
+
+    await transport.send({ jsonrpc: '2.0', id: 1, result });
+    await transport.send({ jsonrpc: '2.0', id: 2, result: { other: true } });
+
+    const lines = written.trim().split('\n').map((line) => JSON.parse(line));
+    expect(lines).toEqual([
+      { jsonrpc: '2.0', id: 1, result },
+      { jsonrpc: '2.0', id: 2, result: { other: true } },
+    ]);
+  });
+});
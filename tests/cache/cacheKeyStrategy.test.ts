@@ -0,0 +1,104 @@
+import {
+  SHORT_KEY_MAX_LENGTH,
+  fastHashCacheKey,
+  getCacheKeyStrategy,
+  resetCacheKeyStrategy,
+  resolveCacheKey,
+  unwrapCacheEntry,
+  wrapCacheEntry,
+} from '../../src/cache/cacheKeyStrategy';
+import { hashCacheKey } from '../../src/cache/cacheKeyHash';
+
+describe('cacheKeyStrategy', () => {
+  const originalEnv = process.env.CACHE_KEY_STRATEGY;
+
+  afterEach(() => {
+    if (originalEnv === undefined) {
+      delete process.env.CACHE_KEY_STRATEGY;
+    } else {
+      process.env.CACHE_KEY_STRATEGY = originalEnv;
+    }
+    resetCacheKeyStrategy();
+  });
+
+  describe('getCacheKeyStrategy', () => {
+    it('should default to sha256', () => {
+      delete process.env.CACHE_KEY_STRATEGY;
+      expect(getCacheKeyStrategy()).toBe('sha256');
+    });
+
+    it('should read CACHE_KEY_STRATEGY', () => {
+      process.env.CACHE_KEY_STRATEGY = 'FAST';
+      expect(getCacheKeyStrategy()).toBe('fast');
+    });
+
+    it('should ignore unknown strategies', () => {
+      process.env.CACHE_KEY_STRATEGY = 'md5';
+      expect(getCacheKeyStrategy()).toBe('sha256');
+    });
+  });
+
+  describe('fastHashCacheKey', () => {
+    it('should return 64 bits as four code units and be deterministic', () => {
+      const hash = fastHashCacheKey('add_2025-01-15_2_hours_UTC');
+      expect(hash).toHaveLength(4);
+      expect(fastHashCacheKey('add_2025-01-15_2_hours_UTC')).toBe(hash);
+    });
+
+    it('should not collide across similar keys', () => {
+      const hashes = new Set<string>();
+      for (let i = 0; i < 10000; i++) {
+        hashes.add(fastHashCacheKey(`current_America/New_York_${i}_true`));
+      }
+      expect(hashes.size).toBe(10000);
+    });
+  });
+
+  describe('resolveCacheKey', () => {
+    it('should keep SHA-256 keys for the default strategy', () => {
+      expect(resolveCacheKey('key', 'sha256')).toEqual({
+        storageKey: hashCacheKey('key'),
+        verify: false,
+      });
+    });
+
+    it('should use short raw keys as-is', () => {
+      expect(resolveCacheKey('short', 'raw')).toEqual({ storageKey: 'r:short', verify: false });
+    });
+
+    it('should fast-hash short keys and verify them', () => {
+      expect(resolveCacheKey('short', 'fast')).toEqual({
+        storageKey: `h:${fastHashCacheKey('short')}`,
+        verify: true,
+      });
+    });
+
+    it('should fall back to SHA-256 for long keys', () => {
+      const long = 'x'.repeat(SHORT_KEY_MAX_LENGTH + 1);
+      expect(resolveCacheKey(long, 'raw')).toEqual({
+        storageKey: hashCacheKey(long),
+        verify: false,
+      });
+      expect(resolveCacheKey(long, 'fast')).toEqual({
+        storageKey: hashCacheKey(long),
+        verify: false,
+      });
+    });
+  });
+
+  describe('collision verification', () => {
+    it('should treat an entry stored for a different raw key as a miss', () => {
+      const resolved = resolveCacheKey('key_a', 'fast');
+      const stored = wrapCacheEntry(resolved, 'key_a', { value: 1 });
+
+      expect(unwrapCacheEntry(resolved, 'key_a', stored)).toEqual({ value: 1 });
+      // Same storage slot, different raw key - as if the hashes collided
+      expect(unwrapCacheEntry(resolved, 'key_b', stored)).toBeUndefined();
+    });
+
+    it('should return falsy values stored under verified keys', () => {
+      const resolved = resolveCacheKey('zero', 'fast');
+      expect(unwrapCacheEntry(resolved, 'zero', wrapCacheEntry(resolved, 'zero', 0))).toBe(0);
+    });
+  });
+});
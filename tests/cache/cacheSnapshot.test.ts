@@ -0,0 +1,160 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+import {
+  getSnapshotTag,
+  loadSnapshot,
+  MIN_SNAPSHOT_TTL_MS,
+  restoreSnapshot,
+  saveSnapshotSync,
+  serializeSnapshot,
+  startCacheSnapshots,
+} from '../../src/cache/cacheSnapshot';
+import { MemoryAwareCache } from '../../src/cache/memoryAwareCache';
+
+describe('cacheSnapshot', () => {
+  let source: MemoryAwareCache;
+  let target: MemoryAwareCache;
+
+  beforeEach(() => {
+    source = new MemoryAwareCache({ checkperiod: 0 });
+    target = new MemoryAwareCache({ checkperiod: 0 });
+  });
+
+  afterEach(() => {
+    source.close();
+    target.close();
+  });
+
+  it('should restore entries with their absolute expiry', () => {
+    const result = { start: '2025-01-01', business_days: 21 };
+    source.set('business', result, 86400);
+    const expiresAt = source.getTtl('business');
+
+    const { text, count } = serializeSnapshot(source, 'tag');
+
+    expect(count).toBe(1);
+    expect(restoreSnapshot(target, text, 'tag')).toBe(1);
+    expect(target.get('business')).toEqual(result);
+    expect(Math.abs((target.getTtl('business') ?? 0) - (expiresAt ?? 0))).toBeLessThan(50);
+  });
+
+  it('should skip entries that are about to expire or never expire', () => {
+    source.set('current', { time: 'now' }, 1);
+    source.set('forever', 'value', 0);
+    source.set('calculation', 'value', 3600);
+
+    const { text, count } = serializeSnapshot(source, 'tag');
+
+    expect(count).toBe(1);
+    expect(text).toContain('"calculation"');
+  });
+
+  it('should not restore entries that expired while the server was down', () => {
+    source.set('calculation', 'value', 3600);
+    const { text } = serializeSnapshot(source, 'tag');
+
+    const later = Date.now() + 3601_000;
+    expect(restoreSnapshot(target, text, 'tag', later)).toBe(0);
+    expect(target.has('calculation')).toBe(false);
+  });
+
+  it('should ignore snapshots written by a different build', () => {
+    source.set('calculation', 'value', 3600);
+    const { text } = serializeSnapshot(source, 'old-build');
+
+    expect(restoreSnapshot(target, text, 'new-build')).toBe(0);
+  });
+
+  it('should keep entries already in the cache', () => {
+    source.set('key', 'stale', 3600);
+    target.set('key', 'fresh', 3600);
+
+    restoreSnapshot(target, serializeSnapshot(source, 'tag').text, 'tag');
+
+    expect(target.get('key')).toBe('fresh');
+  });
+
+  it('should skip malformed lines', () => {
+    const expiry = Date.now() + MIN_SNAPSHOT_TTL_MS * 10;
+    const text = [
+      JSON.stringify({ tag: 'tag' }),
+      '{"k":"truncated"',
+      JSON.stringify({ k: 'good', e: expiry, v: 1 }),
+      JSON.stringify({ k: 'no-value', e: expiry }),
+    ].join('\n');
+
+    expect(restoreSnapshot(target, text, 'tag')).toBe(1);
+    expect(target.get('good')).toBe(1);
+  });
+
+  describe('files', () => {
+    let dir: string;
+
+    beforeEach(() => {
+      dir = fs.mkdtempSync(path.join(os.tmpdir(), 'cache-snapshot-'));
+    });
+
+    afterEach(() => {
+      fs.rmSync(dir, { recursive: true, force: true });
+    });
+
+    it('should round-trip through a snapshot file', async () => {
+      const file = path.join(dir, 'cache.ndjson');
+      source.set('calculation', { hours: 8 }, 3600);
+
+      expect(saveSnapshotSync(source, file)).toBe(1);
+      expect(fs.existsSync(`${file}.tmp`)).toBe(false);
+      expect(fs.readFileSync(file, 'utf8')).toContain(getSnapshotTag());
+
+      await expect(loadSnapshot(target, file)).resolves.toBe(1);
+      expect(target.get('calculation')).toEqual({ hours: 8 });
+    });
+
+    it('should treat a missing file as an empty snapshot', async () => {
+      await expect(loadSnapshot(target, path.join(dir, 'missing.ndjson'))).resolves.toBe(0);
+    });
+  });
+
+  describe('startCacheSnapshots', () => {
+    it('should do nothing without a snapshot path', () => {
+      const listeners = process.listenerCount('exit');
+
+      const stop = startCacheSnapshots(target, undefined);
+
+      expect(process.listenerCount('exit')).toBe(listeners);
+      stop();
+    });
+
+    it('should stay off when the build has no revision or build number', () => {
+      let isolated: typeof import('../../src/cache/cacheSnapshot') | undefined;
+      jest.isolateModules(() => {
+        jest.doMock('../../src/utils/buildInfo', () => ({
+          BUILD_INFO: { version: '1.0.0', revision: 'unknown', branch: 'unknown' },
+        }));
+        isolated = require('../../src/cache/cacheSnapshot') as typeof isolated;
+      });
+      const snapshots = isolated as typeof import('../../src/cache/cacheSnapshot');
+      const listeners = process.listenerCount('exit');
+
+      const stop = snapshots.startCacheSnapshots(target, path.join(os.tmpdir(), 'unused.ndjson'));
+
+      expect(snapshots.getSnapshotTag()).toBeUndefined();
+      expect(process.listenerCount('exit')).toBe(listeners);
+      stop();
+      jest.dontMock('../../src/utils/buildInfo');
+    });
+
+    it('should register and remove its shutdown handlers', () => {
+      const listeners = process.listenerCount('SIGTERM');
+      const file = path.join(os.tmpdir(), `cache-snapshot-${process.pid}.ndjson`);
+
+      const stop = startCacheSnapshots(target, file);
+      expect(process.listenerCount('SIGTERM')).toBe(listeners + 1);
+
+      stop();
+      expect(process.listenerCount('SIGTERM')).toBe(listeners);
+    });
+  });
+});
@@ -0,0 +1,63 @@
+import { ExpiryHeap } from '../../src/cache/expiryHeap';
+
+describe('ExpiryHeap', () => {
+  let heap: ExpiryHeap;
+
+  beforeEach(() => {
+    heap = new ExpiryHeap();
+  });
+
+  it('should return only keys whose deadline has passed', () => {
+    heap.schedule('late', 3000);
+    heap.schedule('early', 1000);
+    heap.schedule('middle', 2000);
+
+    expect(heap.popExpired(2500).sort()).toEqual(['early', 'middle']);
+    expect(heap.popExpired(2500)).toEqual([]);
+    expect(heap.size).toBe(1);
+  });
+
+  it('should not expire a key at exactly its deadline', () => {
+    heap.schedule('key', 1000);
+
+    expect(heap.popExpired(1000)).toEqual([]);
+    expect(heap.popExpired(1001)).toEqual(['key']);
+  });
+
+  it('should use the latest deadline for rescheduled keys', () => {
+    heap.schedule('key', 1000);
+    heap.schedule('key', 5000);
+
+    expect(heap.popExpired(2000)).toEqual([]);
+    expect(heap.popExpired(6000)).toEqual(['key']);
+  });
+
+  it('should skip cancelled keys', () => {
+    heap.schedule('kept', 1000);
+    heap.schedule('cancelled', 1000);
+    heap.cancel('cancelled');
+
+    expect(heap.popExpired(2000)).toEqual(['kept']);
+  });
+
+  it('should stay bounded when keys are rescheduled repeatedly', () => {
+    for (let i = 0; i < 10000; i++) {
+      heap.schedule('hot', 1000 + i);
+    }
+
+    expect(heap.size).toBe(1);
+    expect(heap.popExpired(20000)).toEqual(['hot']);
+  });
+
+  it('should pop many keys in deadline order', () => {
+    const deadlines = Array.from({ length: 500 }, (_, i) => (i * 7919) % 500);
+    deadlines.forEach((deadline) => heap.schedule(`k${deadline}`, deadline));
+
+    const popped: string[] = [];
+    for (let now = 1; now <= 500; now++) {
+      popped.push(...heap.popExpired(now));
+    }
+
+    expect(popped).toEqual(Array.from({ length: 500 }, (_, i) => `k${i}`));
+  });
+});
@@ -67,10 +67,10 @@ describe('MemoryAwareCache', () => {
 
   describe('memory limits', () => {
     it('should reject set when memory limit would be exceeded', () => {
-      // Fill cache near limit (650 chars = ~871 bytes)
+      // Fill cache near limit (650 chars = ~952 bytes with entry overhead)
       cache.set('big', { data: 'x'.repeat(650) });
 
-      // Try to add more (200 chars = ~292 bytes) - would exceed 1024
+      // Try to add more (200 chars = ~496 bytes) - would exceed 1024
       const result = cache.set('overflow', { data: 'x'.repeat(200) });
 
       expect(result).toBe(false);
@@ -84,7 +84,7 @@ describe('MemoryAwareCache', () => {
         done();
       });
 
-      // Add data to exceed 90% (690 chars = ~923 bytes = 90.1%)
+      // Add data to exceed 90% (690 chars = ~992 bytes = 96.9%)
       cache.set('big', { data: 'x'.repeat(690) });
     });
 
@@ -138,6 +138,68 @@ describe('MemoryAwareCache', () => {
     });
   });
 
+  describe('entries', () => {
+    it('should list live entries without touching stats', () => {
+      const now = Date.now();
+      const clock = jest.spyOn(Date, 'now').mockReturnValue(now);
+      const value = { data: 'test' };
+      cache.set('forever', value);
+      cache.set('expired', 'old', 1);
+      cache.set('live', 'new', 60);
+      clock.mockReturnValue(now + 2000);
+
+      const entries = [...cache.entries()];
+      clock.mockRestore();
+
+      expect(entries.map((entry) => entry.key)).toEqual(['forever', 'live']);
+      expect(entries[0]).toEqual({ key: 'forever', value, expiresAt: 0 });
+      expect(cache.getStats().hits).toBe(0);
+      expect(cache.getMemoryStats().hitRate).toBe(0);
+    });
+  });
+
+  describe('expiry', () => {
+    afterEach(() => {
+      jest.useRealTimers();
+    });
+
+    it('should reclaim memory of expired entries without a read', () => {
+      jest.useFakeTimers();
+      const expiring = new MemoryAwareCache({ stdTTL: 1, checkperiod: 1 });
+
+      expiring.set('short', { data: 'x' });
+      expiring.set('long', { data: 'y' }, 60);
+      jest.advanceTimersByTime(2000);
+
+      expect(expiring.getMemoryStats().entryCount).toBe(1);
+      expect(expiring.keys()).toEqual(['long']);
+      expiring.close();
+    });
+
+    it('should follow TTL changes', () => {
+      jest.useFakeTimers();
+      const expiring = new MemoryAwareCache({ stdTTL: 1, checkperiod: 0 });
+
+      expiring.set('key', 'value');
+      expiring.ttl('key', 60);
+      jest.advanceTimersByTime(2000);
+
+      expect(expiring.sweepExpired()).toBe(0);
+      expect(expiring.has('key')).toBe(true);
+      expiring.close();
+    });
+
+    it('should only charge expiry bookkeeping to expiring entries', () => {
+      cache.set('forever', 'value');
+      const permanent = cache.getMemoryStats().usedMemory;
+
+      cache.flushAll();
+      cache.set('forever', 'value', 60);
+
+      expect(cache.getMemoryStats().usedMemory).toBeGreaterThan(permanent);
+    });
+  });
+
   describe('memory calculation accuracy', () => {
     it('should handle various data types', () => {
       const testCases = [
@@ -0,0 +1,91 @@
+import { executeToolFunction } from '../../src/index';
+import { cache } from '../../src/cache/timeCache';
+import { responseCache } from '../../src/cache/responseCache';
+import { captureCacheExpiry, withCache } from '../../src/utils/withCache';
+
+describe('responseCache', () => {
+  beforeEach(() => {
+    cache.flushAll();
+    responseCache.flushAll();
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+    jest.restoreAllMocks();
+  });
+
+  describe('executeToolFunction', () => {
+    it('should serve repeat calls without touching the result cache', async () => {
+      const args = { time: '2025-01-15T10:00:00Z', amount: 2, unit: 'hours' };
+      const first = await executeToolFunction('add_time', args);
+
+      const getSpy = jest.spyOn(cache, 'get');
+      const second = await executeToolFunction('add_time', args);
+
+      expect(second).toEqual(first);
+      expect(getSpy).not.toHaveBeenCalled();
+    });
+
+    it('should expire responses together with the result entry', async () => {
+      jest.useFakeTimers();
+      jest.setSystemTime(new Date('2025-07-18T16:58:42.000Z'));
+      const first = await executeToolFunction('get_current_time', { timezone: 'UTC' });
+
+      jest.setSystemTime(new Date('2025-07-18T16:58:44.000Z'));
+      const second = await executeToolFunction('get_current_time', { timezone: 'UTC' });
+
+      expect(second).not.toEqual(first);
+      expect(JSON.stringify(second)).toContain('16:58:44');
+    });
+
+    it('should not store responses for tools without result caching', async () => {
+      await executeToolFunction('get_server_info', {});
+
+      expect(responseCache.keys()).toHaveLength(0);
+    });
+
+    it('should not store errors', async () => {
+      const result = await executeToolFunction('add_time', { time: 'not a date', amount: 1 });
+
+      expect(result).toHaveProperty('error');
+      expect(responseCache.keys()).toHaveLength(0);
+    });
+  });
+
+  describe('captureCacheExpiry', () => {
+    it('should report the expiry of freshly computed values', () => {
+      jest.useFakeTimers();
+      jest.setSystemTime(new Date('2025-01-15T00:00:00.000Z'));
+
+      const { value, expiresAt } = captureCacheExpiry(() =>
+        withCache('capture_fresh', 30, () => 'computed')
+      );
+
+      expect(value).toBe('computed');
+      expect(expiresAt).toBe(Date.now() + 30_000);
+    });
+
+    it('should use the earliest expiry across nested calls', () => {
+      const { expiresAt } = captureCacheExpiry(() =>
+        withCache('capture_outer', 3600, () => withCache('capture_inner', 1, () => 1))
+      );
+
+      expect(expiresAt).toBeLessThanOrEqual(Date.now() + 1000);
+    });
+
+    it('should not report an expiry when a value came from the cache', () => {
+      withCache('capture_hit', 30, () => 'first');
+
+      const { value, expiresAt } = captureCacheExpiry(() =>
+        withCache('capture_hit', 30, () => 'second')
+      );
+
+      expect(value).toBe('first');
+      expect(expiresAt).toBeUndefined();
+    });
+
+    it('should not report an expiry when nothing was cached', () => {
+      expect(captureCacheExpiry(() => 42).expiresAt).toBeUndefined();
+    });
+  });
+});
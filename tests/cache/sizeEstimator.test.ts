@@ -0,0 +1,140 @@
+import * as v8 from 'v8';
+import { runInNewContext } from 'vm';
+
+import { MemoryAwareCache } from '../../src/cache/memoryAwareCache';
+import {
+  ENTRY_OVERHEAD,
+  estimateEntrySize,
+  estimateSize,
+  estimateStringSize,
+} from '../../src/cache/sizeEstimator';
+
+// Expose the garbage collector so heap deltas are not polluted by garbage
+v8.setFlagsFromString('--expose-gc');
+const gc = runInNewContext('gc') as () => void;
+
+/**
+ * Measure average retained heap bytes per value produced by `make`
+ */
+function measureHeapPerValue(make: (i: number) => unknown, count: number): number {
+  const values: unknown[] = new Array<unknown>(count);
+  gc();
+  gc();
+  const before = v8.getHeapStatistics().used_heap_size;
+  for (let i = 0; i < count; i++) {
+    values[i] = make(i);
+  }
+  gc();
+  gc();
+  const after = v8.getHeapStatistics().used_heap_size;
+  // Subtract the slot each value takes in the holding array
+  const perValue = (after - before) / values.length - 8;
+  return perValue;
+}
+
+const BASE = Date.UTC(2025, 0, 15);
+const iso = (ms: number): string => new Date(ms).toISOString();
+
+describe('sizeEstimator', () => {
+  describe('estimateSize', () => {
+    it('should treat shared primitives as free', () => {
+      expect(estimateSize(true)).toBe(0);
+      expect(estimateSize(null)).toBe(0);
+      expect(estimateSize(undefined)).toBe(0);
+      expect(estimateSize(42)).toBe(0);
+    });
+
+    it('should charge heap numbers for doubles', () => {
+      expect(estimateSize(1.5)).toBe(16);
+    });
+
+    it('should size strings by encoding', () => {
+      expect(estimateStringSize('abcd')).toBe(24);
+      expect(estimateStringSize('a'.repeat(100))).toBe(120);
+      // Two-byte strings take twice the space
+      expect(estimateStringSize('日本語日本語')).toBe(32);
+    });
+
+    it('should not count property names', () => {
+      const short = estimateSize({ a: 'value' });
+      const long = estimateSize({ aVeryLongPropertyNameThatIsShared: 'value' });
+      expect(long).toBe(short);
+    });
+
+    it('should include array backing store', () => {
+      expect(estimateSize([])).toBe(48);
+      expect(estimateSize([1, 2, 3])).toBe(72);
+    });
+
+    it('should include key and bookkeeping for entries', () => {
+      const key = 'a'.repeat(64);
+      expect(estimateEntrySize(key, null)).toBe(ENTRY_OVERHEAD + estimateStringSize(key));
+    });
+  });
+
+  describe('calibration against v8 heap statistics', () => {
+    const cases: Array<{ name: string; count: number; make: (i: number) => unknown }> = [
+      {
+        name: 'add_time result',
+        count: 5000,
+        make: (i) => ({
+          original: iso(BASE + i * 1000),
+          result: iso(BASE + i * 2000 + 7),
+          unix_original: Math.floor((BASE + i * 1000) / 1000),
+          unix_result: Math.floor((BASE + i * 2000) / 1000),
+        }),
+      },
+      {
+        name: 'calculate_duration result',
+        count: 5000,
+        make: (i) => ({
+          milliseconds: i * 1000 + 1,
+          seconds: i + 0.001,
+          minutes: (i + 0.001) / 60,
+          hours: i / 3600 + 0.1,
+          days: i / 86400 + 0.1,
+          formatted: `${i} days ${i % 24} hours`,
+          is_negative: false,
+        }),
+      },
+      {
+        name: 'calculate_business_hours result',
+        count: 500,
+        make: (i) => ({
+          total_business_minutes: i,
+          total_business_hours: i / 60,
+          breakdown: Array.from({ length: 30 }, (_, d) => ({
+            date: iso(BASE + (i * 30 + d) * 86400000),
+            day_of_week: 'Monday',
+            business_minutes: 480,
+            is_weekend: false,
+            is_holiday: false,
+          })),
+        }),
+      },
+    ];
+
+    it.each(cases)('should track real heap use for $name', ({ make, count }) => {
+      const measured = measureHeapPerValue(make, count);
+      const estimated = estimateSize(make(0));
+
+      // Measured ratios are 0.9-1.2 on Node 20; the band leaves room for
+      // other V8 versions. The old JSON * 1.3 measure was off by 2-3x.
+      expect(estimated / measured).toBeGreaterThan(0.5);
+      expect(estimated / measured).toBeLessThan(2);
+    });
+  });
+
+  describe('MemoryAwareCache integration', () => {
+    it('should not serialize values on the write path', () => {
+      const cache = new MemoryAwareCache({ stdTTL: 0, checkperiod: 0, useClones: false });
+      const stringifySpy = jest.spyOn(JSON, 'stringify');
+
+      cache.set('key', { original: '2025-01-15T10:30:00.000Z', unix_original: 1736937000 });
+
+      expect(stringifySpy).not.toHaveBeenCalled();
+      stringifySpy.mockRestore();
+      cache.close();
+    });
+  });
+});
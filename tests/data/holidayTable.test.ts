@@ -0,0 +1,104 @@
+import {
+  compileHolidayTable,
+  evaluateHolidayRules,
+  getHolidayDefinitions,
+  getHolidaysForYear,
+  setHolidayTable,
+} from '../../src/data/holidays';
+import type { CalculatedHoliday } from '../../src/data/holidays';
+import {
+  DEFAULT_TABLE_FIRST_YEAR,
+  DEFAULT_TABLE_LAST_YEAR,
+  encodeHolidayTable,
+  loadHolidayTable,
+  parseHolidayTable,
+  readCompiledHolidays,
+} from '../../src/data/holidayTable';
+import type { HolidayTable } from '../../src/data/holidayTable';
+
+const COUNTRIES = ['US', 'UK', 'CA', 'AU', 'VE', 'CL'];
+
+function describeHolidays(holidays: CalculatedHoliday[]): string[] {
+  return holidays.map(
+    (h) => `${h.name}|${h.date.toDateString()}|${h.observedDate?.toDateString() ?? '-'}`
+  );
+}
+
+describe('Compiled holiday table', () => {
+  let table: HolidayTable;
+
+  beforeAll(() => {
+    const compiled = parseHolidayTable(
+      compileHolidayTable(DEFAULT_TABLE_FIRST_YEAR, DEFAULT_TABLE_LAST_YEAR)
+    );
+    expect(compiled).not.toBeNull();
+    table = compiled as HolidayTable;
+  });
+
+  afterEach(() => {
+    setHolidayTable(null);
+  });
+
+  it('should cover every supported calendar', () => {
+    expect(table.countries.sort()).toEqual([...COUNTRIES].sort());
+    for (const country of COUNTRIES) {
+      expect(getHolidayDefinitions(country).length).toBeGreaterThan(0);
+    }
+  });
+
+  it.each(COUNTRIES)('should match the rule engine for every year in %s', (country) => {
+    for (let year = DEFAULT_TABLE_FIRST_YEAR; year <= DEFAULT_TABLE_LAST_YEAR; year++) {
+      const compiled = readCompiledHolidays(table, country, year);
+      expect(compiled).toBeDefined();
+      expect(describeHolidays(compiled as CalculatedHoliday[])).toEqual(
+        describeHolidays(evaluateHolidayRules(country, year))
+      );
+    }
+  });
+
+  it('should not answer outside its span or for unknown countries', () => {
+    expect(readCompiledHolidays(table, 'US', DEFAULT_TABLE_FIRST_YEAR - 1)).toBeUndefined();
+    expect(readCompiledHolidays(table, 'US', DEFAULT_TABLE_LAST_YEAR + 1)).toBeUndefined();
+    expect(readCompiledHolidays(table, 'XX', 2025)).toBeUndefined();
+  });
+
+  it('should keep observed dates that fall in the previous year', () => {
+    // New Year's Day 2022 was a Saturday, observed Friday Dec 31, 2021
+    const newYear = readCompiledHolidays(table, 'US', 2022)?.find(
+      (h) => h.name === "New Year's Day"
+    );
+    expect(newYear?.observedDate?.toDateString()).toBe(new Date(2021, 11, 31).toDateString());
+  });
+
+  it('should be used by getHolidaysForYear inside its span', () => {
+    const fake = encodeHolidayTable(['US'], 2025, 2025, () => [
+      { name: 'Compiled Day', date: new Date(2025, 2, 3) },
+    ]);
+    setHolidayTable(parseHolidayTable(fake));
+
+    expect(getHolidaysForYear('US', 2025).map((h) => h.name)).toEqual(['Compiled Day']);
+    // Outside the span and for other countries the rules still apply
+    expect(getHolidaysForYear('US', 2026).map((h) => h.name)).toContain('Independence Day');
+    expect(getHolidaysForYear('UK', 2025).map((h) => h.name)).toContain('Christmas Day');
+  });
+
+  it('should read tables from unaligned buffers', () => {
+    const bytes = compileHolidayTable(2025, 2026);
+    const shifted = new Uint8Array(bytes.byteLength + 1);
+    shifted.set(bytes, 1);
+
+    const parsed = parseHolidayTable(shifted.subarray(1));
+    expect(parsed && describeHolidays(readCompiledHolidays(parsed, 'UK', 2026) ?? [])).toEqual(
+      describeHolidays(evaluateHolidayRules('UK', 2026))
+    );
+  });
+
+  it('should reject bytes that are not a table', () => {
+    expect(parseHolidayTable(new Uint8Array(4))).toBeNull();
+    expect(parseHolidayTable(new Uint8Array(64))).toBeNull();
+  });
+
+  it('should fall back to rules when no table file exists', () => {
+    expect(loadHolidayTable('/nonexistent/holidays.bin')).toBeNull();
+  });
+});
@@ -5,6 +5,11 @@ import {
   calculateFixedHoliday,
   getObservedDate,
   isHoliday,
+  getHolidayIndex,
+  getHolidayName,
+  holidayIndexHas,
+  toEpochDay,
+  fromEpochDay,
 } from '../../src/data/holidays';
 
 describe('Holiday Data Module', () => {
@@ -223,5 +228,64 @@ describe('Holiday Data Module', () => {
       expect(isHoliday(july3_2026, 'US', { checkObserved: true })).toBe(true);
       expect(isHoliday(july3_2026, 'US', { checkObserved: false })).toBe(false);
     });
+
+    it('should match a scan of getHolidaysForYear for every day of the year', () => {
+      const holidays = getHolidaysForYear('UK', 2027);
+      for (let d = 0; d < 365; d++) {
+        const date = new Date(2027, 0, 1 + d);
+        const key = date.toDateString();
+        const actual = holidays.some((h) => h.date.toDateString() === key);
+        const observed = holidays.some((h) => h.observedDate?.toDateString() === key);
+
+        expect(isHoliday(date, 'UK')).toBe(actual);
+        expect(isHoliday(date, 'UK', { checkObserved: true })).toBe(actual || observed);
+      }
+    });
+  });
+
+  describe('getHolidayIndex', () => {
+    it('should be memoized per country, year and mode', () => {
+      const index = getHolidayIndex('US', 2025, 'actual');
+      expect(getHolidayIndex('US', 2025, 'actual')).toBe(index);
+      expect(getHolidayIndex('US', 2025, 'observed')).not.toBe(index);
+    });
+
+    it('should list marked days in ascending order', () => {
+      const { days } = getHolidayIndex('US', 2025, 'actual');
+      expect(days).toHaveLength(getHolidaysForYear('US', 2025).length);
+      expect([...days].sort((a, b) => a - b)).toEqual(days);
+      expect(fromEpochDay(days[0]).toDateString()).toBe(new Date(2025, 0, 1).toDateString());
+    });
+
+    it('should mark observed dates that fall in the previous year', () => {
+      // New Year's Day 2022 was a Saturday, observed Friday Dec 31, 2021
+      const dec31 = toEpochDay(new Date(2021, 11, 31));
+      const jan1 = toEpochDay(new Date(2022, 0, 1));
+
+      const observed = getHolidayIndex('US', 2022, 'observed');
+      expect(holidayIndexHas(observed, dec31)).toBe(true);
+      expect(holidayIndexHas(observed, jan1)).toBe(false);
+
+      const both = getHolidayIndex('US', 2022, 'both');
+      expect(holidayIndexHas(both, dec31)).toBe(true);
+      expect(holidayIndexHas(both, jan1)).toBe(true);
+    });
+
+    it('should report days outside the indexed range as not holidays', () => {
+      const index = getHolidayIndex('US', 2025, 'both');
+      expect(holidayIndexHas(index, toEpochDay(new Date(2024, 0, 1)))).toBe(false);
+      expect(holidayIndexHas(index, toEpochDay(new Date(2026, 6, 4)))).toBe(false);
+    });
+  });
+
+  describe('getHolidayName', () => {
+    it('should return the holiday name for actual and observed dates', () => {
+      expect(getHolidayName(new Date(2025, 6, 4), 'US')).toBe('Independence Day');
+      expect(getHolidayName(new Date(2026, 6, 3), 'US')).toBeUndefined();
+      expect(getHolidayName(new Date(2026, 6, 3), 'US', { checkObserved: true })).toBe(
+        'Independence Day'
+      );
+      expect(getHolidayName(new Date(2025, 2, 15), 'US')).toBeUndefined();
+    });
   });
 });
@@ -41,6 +41,22 @@ describe('Error Handling Chain - Full Integration', () => {
       }
     });
 
+    it('should apply per-field length limits from the input schema', async () => {
+      const result = await executeToolFunction('convert_timezone', {
+        time: '2024-01-01T12:00:00Z',
+        from_timezone: 'UTC',
+        to_timezone: 'x'.repeat(101),
+      });
+
+      expect('error' in result).toBe(true);
+      if ('error' in result) {
+        expect(result.error).toMatchObject({
+          code: ErrorCode.InvalidParams,
+          message: expect.stringContaining('to_timezone exceeds maximum length of 100 characters'),
+        });
+      }
+    });
+
     it('should map ValidationError to MCP InvalidParams for invalid pattern', async () => {
       const result = await executeToolFunction('next_occurrence', {
         pattern: 'invalid-pattern',
@@ -225,5 +241,17 @@ describe('Error Handling Chain - Full Integration', () => {
         expect(parsed).toHaveProperty('timezone');
       }
     });
+
+    it('should accept enum values in any letter case', async () => {
+      const result = await executeToolFunction('format_time', {
+        time: '2024-01-01T12:00:00Z',
+        format: 'RELATIVE',
+      });
+
+      expect('error' in result).toBe(false);
+      if (!('error' in result)) {
+        expect(JSON.parse(result.content[0].text)).toHaveProperty('formatted');
+      }
+    });
   });
 });
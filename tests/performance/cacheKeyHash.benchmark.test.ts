@@ -0,0 +1,75 @@
+import { describe, test, expect } from '@jest/globals';
+import { resolveCacheKey } from '../../src/cache/cacheKeyStrategy';
+import type { CacheKeyStrategy } from '../../src/cache/cacheKeyStrategy';
+import { buildCacheKey } from '../../src/utils/cacheKeyBuilder';
+
+import { nsPerOp } from './helpers/timing';
+
+/**
+ * Per-call key hashing cost across realistic key lengths
+ *
+ * Reference numbers (ns/op, Node 20, 8 distinct keys in rotation):
+ *
+ * | Key                           | Length | sha256 | fast | raw |
+ * |-------------------------------|--------|--------|------|-----|
+ * | get_current_time              | ~60    | ~1500  | ~300 | ~20 |
+ * | get_business_days, 2 holidays | ~100   | ~1650  | ~420 | ~20 |
+ * | get_business_days, 365 days   | ~4100  | ~6000  | sha256 fallback  |
+ */
+
+function makeKeys(): Record<string, string[]> {
+  const rotate = (build: (i: number) => string): string[] =>
+    Array.from({ length: 8 }, (_, i) => build(i));
+
+  return {
+    short: rotate((i) =>
+      buildCacheKey('current', {
+        single: { timezone: 'America/New_York', format: `yyyy-MM-dd ${i}` },
+        flags: { include_offset: true },
+      })
+    ),
+    medium: rotate((i) =>
+      buildCacheKey('business', {
+        dates: ['2025-01-01', `2025-12-${10 + i}`],
+        single: { timezone: 'America/New_York' },
+        arrays: { custom_holidays: ['2025-07-05', '2025-11-26'] },
+      })
+    ),
+    long: rotate((i) =>
+      buildCacheKey('business', {
+        dates: ['2025-01-01', `2025-12-${10 + i}`],
+        arrays: {
+          holidays: Array.from({ length: 365 }, (_, d) =>
+            new Date(Date.UTC(2025, 0, d + 1)).toISOString().slice(0, 10)
+          ),
+        },
+      })
+    ),
+  };
+}
+
+function nsPerKey(keys: string[], strategy: CacheKeyStrategy): number {
+  return nsPerOp((i) => resolveCacheKey(keys[i & 7], strategy));
+}
+
+describe('Cache key hashing cost', () => {
+  const keys = makeKeys();
+
+  test.each(['short', 'medium'])('fast strategies should beat SHA-256 for %s keys', (size) => {
+    const sha = nsPerKey(keys[size], 'sha256');
+    const fast = nsPerKey(keys[size], 'fast');
+    const raw = nsPerKey(keys[size], 'raw');
+
+    // Only ratios against the SHA-256 baseline measured here are asserted
+    expect(sha / fast).toBeGreaterThan(1);
+    expect(sha / raw).toBeGreaterThan(1);
+  });
+
+  test('long keys should cost the same as SHA-256 under every strategy', () => {
+    const sha = nsPerKey(keys.long, 'sha256');
+    const fast = nsPerKey(keys.long, 'fast');
+
+    // Both take the SHA-256 path, so the ratio should stay near 1
+    expect(fast / sha).toBeLessThan(2);
+  });
+});
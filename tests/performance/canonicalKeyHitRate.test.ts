@@ -0,0 +1,70 @@
+import { describe, test, expect, beforeEach } from '@jest/globals';
+import { cache } from '../../src/cache/timeCache';
+import { calculateDuration } from '../../src/tools/calculateDuration';
+import { getBusinessDays } from '../../src/tools/getBusinessDays';
+import { captureCacheExpiry } from '../../src/utils/withCache';
+
+/**
+ * Replay of a synthetic trace where clients send the same instants in
+ * different representations (Z, Z with millis, explicit offset, Unix).
+ *
+ * Each query is asked once per representation, for three rounds. With raw
+ * keys every representation misses once; with canonical keys only the first
+ * representation of each query misses. Expected hit rates:
+ *
+ *   raw keys:       2 of 3 rounds hit              → 66.7%
+ *   canonical keys: 1 miss per query, 11 of 12 hit → 91.7%
+ */
+
+const ROUNDS = 3;
+
+function representations(hour: number): string[] {
+  const utc = new Date(Date.UTC(2025, 0, 20, hour));
+  const iso = utc.toISOString();
+  const local = new Date(utc.getTime() - 5 * 3600_000).toISOString().slice(0, 19);
+  return [iso.replace('.000Z', 'Z'), iso, `${local}-05:00`, String(utc.getTime() / 1000)];
+}
+
+function replay(call: (start: string, end: string) => unknown, queries: number): number {
+  let hits = 0;
+  let total = 0;
+  for (let round = 0; round < ROUNDS; round++) {
+    for (let q = 0; q < queries; q++) {
+      const starts = representations(q);
+      const ends = representations(q + 30);
+      for (let r = 0; r < starts.length; r++) {
+        const { expiresAt } = captureCacheExpiry(() => call(starts[r], ends[r]));
+        // Single withCache per call: no expiry reported means it was a hit
+        if (expiresAt === undefined) {
+          hits++;
+        }
+        total++;
+      }
+    }
+  }
+  return hits / total;
+}
+
+describe('Canonical cache key hit rate', () => {
+  beforeEach(() => {
+    cache.flushAll();
+  });
+
+  test('calculate_duration should hit across representations', () => {
+    const rate = replay(
+      (start_time, end_time) => calculateDuration({ start_time, end_time, timezone: 'UTC' }),
+      10
+    );
+
+    expect(rate).toBeCloseTo(11 / 12, 2);
+  });
+
+  test('get_business_days should hit across representations', () => {
+    const rate = replay(
+      (start_date, end_date) => getBusinessDays({ start_date, end_date, timezone: 'UTC' }),
+      10
+    );
+
+    expect(rate).toBeCloseTo(11 / 12, 2);
+  });
+});
@@ -0,0 +1,194 @@
+import { describe, test, expect, afterEach } from '@jest/globals';
+import createDebugger from 'debug';
+
+import { cache } from '../../src/cache/timeCache';
+import {
+  getCurrentTime,
+  convertTimezone,
+  addTime,
+  calculateDuration,
+  getBusinessDays,
+  addBusinessDays,
+  nextOccurrence,
+  formatTime,
+  calculateBusinessHours,
+  daysUntil,
+} from '../../src/tools';
+import { processSingleBusinessDay } from '../../src/tools/calculateBusinessHours';
+import { resetDebuggerFactory, setDebuggerFactory } from '../../src/utils/debug';
+
+import { nsPerOp } from './helpers/timing';
+
+/**
+ * Per-tool cost of debug instrumentation with DEBUG unset
+ *
+ * Old path: before the guards, call sites built their debug arguments
+ * (objects, toISOString, formatted times) and the caller-named helpers
+ * captured a stack trace on every call, even with no namespace enabled.
+ * It is reproduced by a debugger factory whose instances report enabled
+ * but drop their arguments, so every guard and thunk does its work and
+ * nothing is formatted or written.
+ *
+ * New path: the real debug module with every namespace disabled.
+ *
+ * Asserted ratios (old / new):
+ *
+ * | Path                         | Work the old path did per call            | Ratio |
+ * |------------------------------|-------------------------------------------|-------|
+ * | processSingleBusinessDay     | a decision (stack trace, context object)  | > 1.2 |
+ * | (one weekday/weekend/holiday | per excluded or partial day, argument     |       |
+ * | mix of days)                 | objects and HH:mm formats                 |       |
+ * | every tool, uncached         | parse and cache-key argument objects      | > 0.9 |
+ *
+ * calculate_business_hours only takes processSingleBusinessDay on the days
+ * around a UTC offset change; steady days use arithmetic with no debug
+ * calls. Its tool case spans both 2025 US DST changes so those days are
+ * included, but they are two days in nine months, so the per-day helper is
+ * measured on its own. The tools build a handful of objects per call,
+ * which is small next to their own work, so they are only checked for not
+ * getting slower.
+ */
+
+const ITERATIONS = 200;
+const NOT_SLOWER = 0.9;
+
+const TOOLS: Array<[string, number, () => unknown]> = [
+  ['get_current_time', NOT_SLOWER, () => getCurrentTime({ timezone: 'America/New_York' })],
+  [
+    'convert_timezone',
+    NOT_SLOWER,
+    () =>
+      convertTimezone({
+        time: '2025-01-01T12:00:00',
+        from_timezone: 'America/New_York',
+        to_timezone: 'Asia/Tokyo',
+      }),
+  ],
+  [
+    'add_time',
+    NOT_SLOWER,
+    () => addTime({ time: '2025-01-01T12:00:00Z', amount: 3, unit: 'days' }),
+  ],
+  [
+    'calculate_duration',
+    NOT_SLOWER,
+    () =>
+      calculateDuration({
+        start_time: '2025-01-01T09:00:00',
+        end_time: '2025-01-01T17:30:00',
+        timezone: 'America/Chicago',
+      }),
+  ],
+  [
+    'get_business_days',
+    NOT_SLOWER,
+    () =>
+      getBusinessDays({
+        start_date: '2025-01-01',
+        end_date: '2025-03-31',
+        timezone: 'America/New_York',
+        holiday_calendar: 'US',
+      }),
+  ],
+  [
+    'add_business_days',
+    NOT_SLOWER,
+    () => addBusinessDays({ start_date: '2025-01-01', days: 20, holiday_calendar: 'US' }),
+  ],
+  [
+    'next_occurrence',
+    NOT_SLOWER,
+    () => nextOccurrence({ pattern: 'weekly', day_of_week: 1, start_from: '2025-01-01' }),
+  ],
+  [
+    'format_time',
+    NOT_SLOWER,
+    () =>
+      formatTime({
+        time: '2025-01-01T12:00:00Z',
+        format: 'custom',
+        custom_format: "EEEE, MMMM do yyyy 'at' h:mm a",
+      }),
+  ],
+  [
+    'calculate_business_hours',
+    NOT_SLOWER,
+    () =>
+      calculateBusinessHours({
+        start_time: '2025-03-03T09:00:00',
+        end_time: '2025-11-28T17:00:00',
+        timezone: 'America/New_York',
+        holidays: ['2025-05-26', '2025-07-04', '2025-09-01'],
+      }),
+  ],
+  [
+    'days_until',
+    NOT_SLOWER,
+    () => daysUntil({ target_date: '2030-01-01', timezone: 'Europe/London' }),
+  ],
+];
+
+// Fri 2025-01-03 to Tue 2025-01-21 with MLK Day off, clamped at both ends:
+// weekend and holiday days log an exclusion, the end days a partial day
+const DAY_RANGE = {
+  startDate: new Date('2025-01-03T17:00:00Z'),
+  endDate: new Date('2025-01-21T19:00:00Z'),
+  timezone: 'America/New_York',
+  holidayDates: [new Date('2025-01-20T12:00:00Z')],
+  include_weekends: false,
+};
+const DAYS = Array.from({ length: 19 }, (_, i) => {
+  const dayOfWeek = (5 + i) % 7;
+  return {
+    ...DAY_RANGE,
+    dayDateStr: `2025-01-${String(3 + i).padStart(2, '0')}`,
+    businessHours: { start: { hour: 9, minute: 0 }, end: { hour: 17, minute: 0 } },
+    dayOfWeek,
+    isWeekend: dayOfWeek === 0 || dayOfWeek === 6,
+  };
+});
+
+/**
+ * Debuggers that are always enabled and drop their arguments: call sites
+ * pay for building the arguments, as they did before the guards
+ */
+function createEagerDebugger(namespace: string): createDebugger.Debugger {
+  const instance = Object.assign((): void => {}, { namespace, enabled: true });
+  return instance as unknown as createDebugger.Debugger;
+}
+
+function nsPerCall(run: () => unknown): number {
+  return nsPerOp(run, { iterations: ITERATIONS, beforeEach: () => cache.flushAll() });
+}
+
+describe('Debug instrumentation overhead', () => {
+  const originalNamespaces = createDebugger.disable();
+
+  afterEach(() => {
+    resetDebuggerFactory();
+    if (originalNamespaces) {
+      createDebugger.enable(originalNamespaces);
+    }
+  });
+
+  test('processSingleBusinessDay should beat the eager-argument path', () => {
+    const run = (): void => DAYS.forEach((day) => processSingleBusinessDay(day));
+    createDebugger.disable();
+    setDebuggerFactory(createEagerDebugger as unknown as typeof createDebugger);
+    const old = nsPerCall(run);
+    resetDebuggerFactory();
+    const current = nsPerCall(run);
+
+    expect(old / current).toBeGreaterThan(1.2);
+  });
+
+  test.each(TOOLS)('%s should beat the eager-argument path', (_name, minRatio, run) => {
+    createDebugger.disable();
+    setDebuggerFactory(createEagerDebugger as unknown as typeof createDebugger);
+    const old = nsPerCall(run);
+    resetDebuggerFactory();
+    const current = nsPerCall(run);
+
+    expect(old / current).toBeGreaterThan(minRatio);
+  });
+});
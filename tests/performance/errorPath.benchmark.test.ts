@@ -0,0 +1,27 @@
+import { describe, test, expect } from '@jest/globals';
+
+import { TimeCalculationError, ValidationError } from '../../src/adapters/mcp-sdk/errors';
+import { mapToMcpError, toErrorResponse } from '../../src/adapters/mcp-sdk/mapper';
+
+import { nsPerOp } from './helpers/timing';
+
+/**
+ * Cost of answering a rejected input
+ *
+ * Expected errors skip stack capture and map straight to a response
+ * payload. Internal errors keep the full path (stack capture, McpError),
+ * so they serve as the baseline here.
+ */
+
+describe('Error path cost', () => {
+  test('expected errors should be cheaper than internal ones', () => {
+    const full = nsPerOp((i) =>
+      mapToMcpError(new TimeCalculationError(`Invalid unit: ${i}`), 'add_time')
+    );
+    const cheap = nsPerOp((i) =>
+      toErrorResponse(new ValidationError(`Invalid unit: ${i}`), 'add_time')
+    );
+
+    expect(full / cheap).toBeGreaterThan(1);
+  });
+});
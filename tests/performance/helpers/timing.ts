@@ -0,0 +1,60 @@
+/**
+ * Shared timing for the micro-benchmarks
+ */
+
+// Each measurement keeps the fastest round, which discounts scheduler noise
+const ROUNDS = 3;
+
+export interface TimingOptions {
+  /** Calls per warm-up and per measured round (default: 20000) */
+  iterations?: number;
+  /**
+   * Untimed work before each call, such as flushing a cache. Calls are
+   * then timed one by one, so keep this for operations well above the
+   * cost of reading the clock.
+   */
+  beforeEach?: () => void;
+}
+
+function timeRound(run: (i: number) => unknown, iterations: number): bigint {
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) {
+    run(i);
+  }
+  return process.hrtime.bigint() - start;
+}
+
+function timeEachCall(
+  run: (i: number) => unknown,
+  iterations: number,
+  beforeEach: () => void
+): bigint {
+  let total = 0n;
+  for (let i = 0; i < iterations; i++) {
+    beforeEach();
+    const start = process.hrtime.bigint();
+    run(i);
+    total += process.hrtime.bigint() - start;
+  }
+  return total;
+}
+
+/**
+ * Average nanoseconds per call of `run`, which gets the iteration index
+ *
+ * Runs one untimed round first so we measure optimized code, then keeps
+ * the fastest of three timed rounds.
+ */
+export function nsPerOp(run: (i: number) => unknown, options: TimingOptions = {}): number {
+  const { iterations = 20000, beforeEach } = options;
+  const round = (): bigint =>
+    beforeEach ? timeEachCall(run, iterations, beforeEach) : timeRound(run, iterations);
+
+  // Warm up so we measure optimized code
+  round();
+  let best = Infinity;
+  for (let r = 0; r < ROUNDS; r++) {
+    best = Math.min(best, Number(round()) / iterations);
+  }
+  return best;
+}
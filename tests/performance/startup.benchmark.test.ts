@@ -0,0 +1,58 @@
+import { describe, test, expect, beforeEach, afterEach } from '@jest/globals';
+
+/**
+ * Startup and request path must not spawn child processes
+ *
+ * Git details are stamped into version.json at build time. A synchronous
+ * git subprocess blocks the event loop for tens of milliseconds, so even
+ * one on the request path would dominate the cost of get_server_info.
+ */
+
+// The real module object, so spies see calls from any importer
+// eslint-disable-next-line @typescript-eslint/no-require-imports
+const childProcess = require('child_process') as typeof import('child_process');
+
+const ITERATIONS = 1000;
+const SPAWNERS = [
+  'exec',
+  'execFile',
+  'execFileSync',
+  'execSync',
+  'fork',
+  'spawn',
+  'spawnSync',
+] as const;
+
+type ExecuteToolFunction = typeof import('../../src/index').executeToolFunction;
+
+describe('Server startup', () => {
+  let spies: Array<{ mock: { calls: unknown[][] }; mockRestore(): void }>;
+
+  function spawnedCommands(): unknown[] {
+    return spies.flatMap((spy) => spy.mock.calls.map((call) => call[0]));
+  }
+
+  beforeEach(() => {
+    spies = SPAWNERS.map((name) => jest.spyOn(childProcess, name as 'execSync'));
+  });
+
+  afterEach(() => {
+    spies.forEach((spy) => spy.mockRestore());
+  });
+
+  test('loading the server and answering get_server_info should spawn nothing', async () => {
+    let executeToolFunction: ExecuteToolFunction | undefined;
+    jest.isolateModules(() => {
+      ({ executeToolFunction } = require('../../src/index') as typeof import('../../src/index'));
+    });
+    const execute = executeToolFunction as ExecuteToolFunction;
+
+    const first = await execute('get_server_info', {});
+    for (let i = 0; i < ITERATIONS; i++) {
+      await execute('get_server_info', {});
+    }
+
+    expect(first).toHaveProperty('content');
+    expect(spawnedCommands()).toEqual([]);
+  });
+});
@@ -0,0 +1,112 @@
+import { ValidationError } from '../../src/adapters/mcp-sdk';
+import { addBusinessDays } from '../../src/tools/addBusinessDays';
+import { getBusinessDays } from '../../src/tools/getBusinessDays';
+import { subtractBusinessDays } from '../../src/tools/subtractBusinessDays';
+
+describe('addBusinessDays', () => {
+  it('should skip the weekend', () => {
+    const result = addBusinessDays({ start_date: '2025-01-17', days: 1 }); // Friday
+
+    expect(result).toEqual({
+      start_date: '2025-01-17',
+      result_date: '2025-01-20',
+      business_days: 1,
+      calendar_days: 3,
+    });
+  });
+
+  it('should skip calendar holidays', () => {
+    // Monday Jan 20, 2025 is MLK Day
+    const result = addBusinessDays({ start_date: '2025-01-17', days: 1, holiday_calendar: 'US' });
+    expect(result.result_date).toBe('2025-01-21');
+  });
+
+  it('should step 45 business days under the UK calendar', () => {
+    // Skips Good Friday, Easter Monday and the Early May bank holiday
+    const withCalendar = addBusinessDays({
+      start_date: '2025-03-03',
+      days: 45,
+      holiday_calendar: 'UK',
+    });
+    const withoutCalendar = addBusinessDays({ start_date: '2025-03-03', days: 45 });
+
+    expect(withCalendar.result_date).toBe('2025-05-08');
+    expect(withoutCalendar.result_date).toBe('2025-05-05');
+  });
+
+  it('should skip custom holidays that are not already weekends or calendar holidays', () => {
+    const result = addBusinessDays({
+      start_date: '2025-01-17',
+      days: 2,
+      holiday_calendar: 'US',
+      custom_holidays: ['2025-01-18', '2025-01-20', '2025-01-21'],
+    });
+    expect(result.result_date).toBe('2025-01-23');
+  });
+
+  it('should count weekends when exclude_weekends is false', () => {
+    const result = addBusinessDays({
+      start_date: '2025-01-17',
+      days: 1,
+      exclude_weekends: false,
+    });
+    expect(result.result_date).toBe('2025-01-18');
+  });
+
+  it('should return the start date for zero days', () => {
+    const result = addBusinessDays({ start_date: '2025-01-18', days: 0 });
+    expect(result.result_date).toBe('2025-01-18');
+    expect(result.calendar_days).toBe(0);
+  });
+
+  it.each([1, 10, 45, 250, 2600])('should agree with get_business_days for %d days', (days) => {
+    const result = addBusinessDays({ start_date: '2025-03-03', days, holiday_calendar: 'US' });
+    const counted = getBusinessDays({
+      start_date: '2025-03-03',
+      end_date: result.result_date,
+      holiday_calendar: 'US',
+    });
+
+    // The range includes the start date, a Monday that isn't a holiday
+    expect(counted.business_days).toBe(days + 1);
+  });
+
+  it('should reject fractional day counts', () => {
+    expect(() => addBusinessDays({ start_date: '2025-01-17', days: 1.5 })).toThrow(
+      ValidationError
+    );
+  });
+
+  it('should reject steps beyond the maximum range', () => {
+    expect(() => addBusinessDays({ start_date: '2025-01-17', days: 1_000_000 })).toThrow(
+      'exceeds maximum range'
+    );
+  });
+});
+
+describe('subtractBusinessDays', () => {
+  it('should step backwards over weekends and holidays', () => {
+    const result = subtractBusinessDays({
+      start_date: '2025-01-21',
+      days: 1,
+      holiday_calendar: 'US',
+    });
+
+    expect(result).toEqual({
+      start_date: '2025-01-21',
+      result_date: '2025-01-17',
+      business_days: -1,
+      calendar_days: -4,
+    });
+  });
+
+  it('should undo addBusinessDays from a business day', () => {
+    const forward = addBusinessDays({ start_date: '2025-03-03', days: 45, holiday_calendar: 'UK' });
+    const back = subtractBusinessDays({
+      start_date: forward.result_date,
+      days: 45,
+      holiday_calendar: 'UK',
+    });
+    expect(back.result_date).toBe('2025-03-03');
+  });
+});
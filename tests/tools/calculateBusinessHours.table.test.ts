@@ -0,0 +1,192 @@
+import { formatInTimeZone } from 'date-fns-tz';
+
+import { cache } from '../../src/cache/timeCache';
+import {
+  calculateBusinessHours,
+  generateDateRange,
+  processSingleBusinessDay,
+} from '../../src/tools/calculateBusinessHours';
+import type {
+  BusinessHours,
+  CalculateBusinessHoursParams,
+  CalculateBusinessHoursResult,
+  WeeklyBusinessHours,
+} from '../../src/types';
+import { parseHolidayDates, parseDateWithTimezone } from '../../src/utils/businessUtils';
+import { getConfig } from '../../src/utils/config';
+import { parseTimeInput } from '../../src/utils/parseTimeInput';
+
+jest.mock('../../src/utils/config');
+jest.mock('../../src/cache/timeCache');
+
+const NINE_TO_FIVE: BusinessHours = {
+  start: { hour: 9, minute: 0 },
+  end: { hour: 17, minute: 0 },
+};
+
+/** Date strings the way the range used to be walked: formatting every 24h step */
+function walkDates(startDate: Date, endDate: Date, timezone: string): string[] {
+  const dates = new Set<string>();
+  for (let t = startDate.getTime(); t <= endDate.getTime(); t += 24 * 60 * 60 * 1000) {
+    dates.add(formatInTimeZone(new Date(t), timezone, 'yyyy-MM-dd'));
+  }
+  dates.add(formatInTimeZone(endDate, timezone, 'yyyy-MM-dd'));
+  return Array.from(dates).sort();
+}
+
+/** Reference: parse and format every day like calculateBusinessHours used to */
+function walkBusinessHours(params: CalculateBusinessHoursParams): CalculateBusinessHoursResult {
+  const timezone = params.timezone ?? 'UTC';
+  const startDate = parseDateWithTimezone(params.start_time, timezone, 'start_time');
+  const endDate = parseDateWithTimezone(params.end_time, timezone, 'end_time');
+  const holidayDates = parseHolidayDates(params.holidays ?? [], timezone);
+  const hoursFor = (dayOfWeek: number): BusinessHours | null => {
+    const hours = params.business_hours;
+    if (!hours) return NINE_TO_FIVE;
+    if ('start' in hours) return hours as BusinessHours;
+    return (hours as WeeklyBusinessHours)[dayOfWeek] ?? NINE_TO_FIVE;
+  };
+
+  const breakdown = walkDates(startDate, endDate, timezone).map((dayDateStr) => {
+    const noon = parseTimeInput(dayDateStr + 'T12:00:00', timezone).date;
+    const dayOfWeek = parseInt(formatInTimeZone(noon, timezone, 'c'), 10) - 1;
+    return processSingleBusinessDay({
+      dayDateStr,
+      startDate,
+      endDate,
+      timezone,
+      businessHours: hoursFor(dayOfWeek),
+      holidayDates,
+      include_weekends: params.include_weekends ?? false,
+      dayOfWeek,
+      isWeekend: dayOfWeek === 0 || dayOfWeek === 6,
+    });
+  });
+  const totalMinutes = breakdown.reduce((sum, day) => sum + day.minutes, 0);
+
+  return {
+    total_business_minutes: totalMinutes,
+    total_business_hours: totalMinutes / 60,
+    breakdown: breakdown.map((day) => day.dayResult),
+  };
+}
+
+describe('calculateBusinessHours day table', () => {
+  const mockGetConfig = getConfig as jest.MockedFunction<typeof getConfig>;
+  const mockCache = cache as jest.Mocked<typeof cache>;
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    mockGetConfig.mockReturnValue({ defaultTimezone: 'UTC' });
+    mockCache.get.mockReturnValue(undefined);
+    mockCache.set.mockImplementation(() => true);
+  });
+
+  const cases: Array<[string, CalculateBusinessHoursParams]> = [
+    [
+      'a year in New York with holidays on DST days',
+      {
+        start_time: '2025-01-01T10:30:00',
+        end_time: '2025-12-31T15:45:00',
+        timezone: 'America/New_York',
+        holidays: ['2025-03-10', '2025-07-04', '2025-11-03', '2025-11-27T23:30:00Z'],
+      },
+    ],
+    [
+      'London weekends with a weekly schedule',
+      {
+        start_time: '2025-03-20T00:00:00',
+        end_time: '2025-11-05T00:00:00',
+        timezone: 'Europe/London',
+        include_weekends: true,
+        business_hours: {
+          0: { start: { hour: 0, minute: 30 }, end: { hour: 2, minute: 30 } },
+          3: null,
+          6: { start: { hour: 1, minute: 0 }, end: { hour: 23, minute: 59 } },
+        },
+      },
+    ],
+    [
+      'wall-clock times in the gap and the overlap',
+      {
+        start_time: '2024-03-01T00:00:00',
+        end_time: '2024-11-30T00:00:00',
+        timezone: 'America/St_Johns',
+        include_weekends: true,
+        business_hours: { start: { hour: 1, minute: 15 }, end: { hour: 2, minute: 45 } },
+      },
+    ],
+    [
+      'midnight DST changes in Sao Paulo',
+      {
+        start_time: '2018-10-01T00:00:00',
+        end_time: '2019-03-01T00:00:00',
+        timezone: 'America/Sao_Paulo',
+        include_weekends: true,
+        business_hours: { start: { hour: 0, minute: 0 }, end: { hour: 23, minute: 59 } },
+      },
+    ],
+    [
+      'the day Samoa skipped',
+      {
+        start_time: '2011-12-20T09:00:00',
+        end_time: '2012-01-10T17:00:00',
+        timezone: 'Pacific/Apia',
+        holidays: ['2011-12-30', '2011-12-31'],
+      },
+    ],
+    [
+      'half-hour DST on Lord Howe Island',
+      {
+        start_time: '2024-01-01T00:00:00',
+        end_time: '2025-12-31T23:59:59',
+        timezone: 'Australia/Lord_Howe',
+        include_weekends: true,
+        business_hours: { start: { hour: 1, minute: 45 }, end: { hour: 2, minute: 15 } },
+      },
+    ],
+    [
+      'UTC instants read in Kathmandu',
+      {
+        start_time: '2025-01-01T18:20:00Z',
+        end_time: '2025-06-30T03:10:00Z',
+        timezone: 'Asia/Kathmandu',
+        holidays: ['2025-02-26', '2025-05-12'],
+      },
+    ],
+  ];
+
+  it.each(cases)('should match walking every day for %s', (_name, params) => {
+    expect(calculateBusinessHours(params)).toEqual(walkBusinessHours(params));
+  });
+
+  it.each([
+    ['America/New_York', '2025-03-08T12:00:00Z', '2025-11-03T04:30:00Z'],
+    ['Pacific/Apia', '2011-12-28T00:00:00Z', '2012-01-02T00:00:00Z'],
+    ['America/Sao_Paulo', '2018-11-02T02:59:00Z', '2018-11-06T03:00:00Z'],
+    ['Europe/London', '2025-10-24T23:30:00Z', '2025-10-27T00:30:00Z'],
+  ])('should list the same dates as formatting every 24 hours in %s', (timezone, start, end) => {
+    const startDate = new Date(start);
+    const endDate = new Date(end);
+    expect(generateDateRange(startDate, endDate, timezone)).toEqual(
+      walkDates(startDate, endDate, timezone)
+    );
+  });
+
+  it('should count a ten-year range quickly', () => {
+    const params: CalculateBusinessHoursParams = {
+      start_time: '2015-01-01T00:00:00',
+      end_time: '2024-12-31T23:59:59',
+      timezone: 'America/New_York',
+      holidays: Array.from({ length: 100 }, (_, i) => `20${15 + (i % 10)}-07-${10 + (i % 18)}`),
+    };
+
+    const began = process.hrtime.bigint();
+    const result = calculateBusinessHours(params);
+    const elapsedMs = Number(process.hrtime.bigint() - began) / 1e6;
+
+    expect(result.breakdown).toHaveLength(3653);
+    // Generous - most days need no parsing or formatting at all
+    expect(elapsedMs).toBeLessThan(1000);
+  });
+});
@@ -1,4 +1,5 @@
 import { calculateBusinessHours } from '../../src/tools/calculateBusinessHours';
+import { ValidationError } from '../../src/adapters/mcp-sdk';
 import { getConfig } from '../../src/utils/config';
 import { cache } from '../../src/cache/timeCache';
 import type { CalculateBusinessHoursParams, CalculateBusinessHoursResult } from '../../src/types';
@@ -411,4 +412,69 @@ describe('calculateBusinessHours', () => {
       expect(firstCall).not.toBe(secondCall);
     });
   });
+
+  describe('Breakdown modes', () => {
+    const range: CalculateBusinessHoursParams = {
+      start_time: '2025-01-01T09:00:00',
+      end_time: '2025-03-31T17:00:00',
+      timezone: 'Europe/London',
+      holidays: ['2025-01-01'],
+    };
+
+    it('should return only the totals for breakdown none', () => {
+      const full = calculateBusinessHours(range);
+      const summary = calculateBusinessHours({ ...range, breakdown: 'none' });
+
+      expect(summary).toEqual({
+        total_business_minutes: full.total_business_minutes,
+        total_business_hours: full.total_business_hours,
+        total_days: 90,
+        breakdown: [],
+      });
+      // Neither the aggregate nor anything else cached holds per-day entries
+      mockCache.set.mockClear();
+      calculateBusinessHours({ ...range, breakdown: 'none', start_time: '2025-01-02T09:00:00' });
+      expect(JSON.stringify(mockCache.set.mock.calls)).not.toContain('day_of_week');
+    });
+
+    it('should split the breakdown into pages that follow each other', () => {
+      const full = calculateBusinessHours(range);
+      const pages: CalculateBusinessHoursResult[] = [];
+      let cursor: string | undefined;
+      do {
+        const page = calculateBusinessHours({
+          ...range,
+          breakdown: 'paged',
+          page_size: 40,
+          cursor,
+        });
+        pages.push(page);
+        cursor = page.next_cursor;
+      } while (cursor !== undefined);
+
+      expect(pages.map((page) => page.breakdown.length)).toEqual([40, 40, 10]);
+      expect(pages.flatMap((page) => page.breakdown)).toEqual(full.breakdown);
+      expect(pages[2].total_business_minutes).toBe(full.total_business_minutes);
+      expect(pages[2].total_days).toBe(90);
+    });
+
+    it('should default to pages of 31 days', () => {
+      const page = calculateBusinessHours({ ...range, breakdown: 'paged' });
+      expect(page.breakdown).toHaveLength(31);
+      expect(page.breakdown[0].date).toBe('2025-01-01');
+      expect(page.next_cursor).toBe('31');
+    });
+
+    it.each([
+      [{ breakdown: 'daily' }],
+      [{ breakdown: 'paged', page_size: 0 }],
+      [{ breakdown: 'paged', page_size: 1.5 }],
+      [{ breakdown: 'paged', cursor: 'abc' }],
+      [{ breakdown: 'paged', cursor: '90' }],
+    ])('should reject invalid breakdown options %o', (options) => {
+      expect(() =>
+        calculateBusinessHours({ ...range, ...(options as Partial<CalculateBusinessHoursParams>) })
+      ).toThrow(ValidationError);
+    });
+  });
 });
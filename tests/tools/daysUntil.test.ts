@@ -275,4 +275,19 @@ describe('daysUntil', () => {
       expect(result).toBe(14);
     });
   });
+
+  describe('Caching', () => {
+    afterEach(() => {
+      jest.useRealTimers();
+    });
+
+    it('should not serve a cached count after local midnight', () => {
+      jest.useFakeTimers();
+      jest.setSystemTime(new Date('2025-01-15T23:59:00.000Z'));
+      expect(daysUntil({ target_date: '2025-01-20', timezone: 'UTC' })).toBe(5);
+
+      jest.setSystemTime(new Date('2025-01-16T00:00:01.000Z'));
+      expect(daysUntil({ target_date: '2025-01-20', timezone: 'UTC' })).toBe(4);
+    });
+  });
 });
@@ -622,6 +622,23 @@ describe('formatTime', () => {
       });
 
       // Should include system timezone in cache key when no timezone provided
+      // Relative output expires at the next Chicago midnight (06:00Z, 19.5h away)
+      expect(mockedCache.set).toHaveBeenCalledWith(
+        expect.stringMatching(/^[a-f0-9]{64}$/),
+        expect.any(Object),
+        70200
+      );
+    });
+
+    it('should keep the fixed TTL for custom formats', () => {
+      mockedCache.get.mockReturnValue(undefined);
+
+      formatTime({
+        time: '2025-01-20T14:30:00.000Z',
+        format: 'custom',
+        custom_format: 'yyyy-MM-dd',
+      });
+
       expect(mockedCache.set).toHaveBeenCalledWith(
         expect.stringMatching(/^[a-f0-9]{64}$/),
         expect.any(Object),
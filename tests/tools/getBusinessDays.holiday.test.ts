@@ -211,4 +211,22 @@ describe('getBusinessDays with holiday calendar support', () => {
       expect(resultUS.holiday_count).not.toBe(resultUK.holiday_count);
     });
   });
+
+  describe('long ranges', () => {
+    it('should count ranges longer than 100 years', () => {
+      const result = getBusinessDays({
+        start_date: '1990-01-01',
+        end_date: '2189-12-31',
+        holiday_calendar: 'US',
+      });
+
+      expect(result.total_days).toBe(73049);
+      expect(result.weekend_days).toBe(20870);
+      // 11 federal holidays a year, each observed on a weekday
+      expect(result.holiday_count).toBeGreaterThan(200 * 10);
+      expect(result.business_days).toBe(
+        result.total_days - result.weekend_days - result.holiday_count
+      );
+    });
+  });
 });
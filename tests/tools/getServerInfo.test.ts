@@ -181,6 +181,12 @@ describe('getServerInfo tool', () => {
       expect(() => getServerInfo(undefined)).not.toThrow();
     });
 
+    it('should collect the information only once', () => {
+      const { getServerInfo } = require('../../src/tools/getServerInfo');
+
+      expect(getServerInfo()).toBe(getServerInfo());
+    });
+
     it('should return JSON-serializable object', () => {
       const { getServerInfo } = require('../../src/tools/getServerInfo');
       const info = getServerInfo();
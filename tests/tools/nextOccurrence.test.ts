@@ -497,7 +497,7 @@ describe('nextOccurrence', () => {
   });
 
   describe('Caching', () => {
-    it('should cache results for 1 hour', () => {
+    it('should cache results until the occurrence passes', () => {
       mockedCache.get.mockReturnValue(undefined);
 
       nextOccurrence({
@@ -505,6 +505,38 @@ describe('nextOccurrence', () => {
         time: '14:00',
       });
 
+      expect(mockedCache.set).toHaveBeenCalledWith(
+        expect.stringMatching(/^[a-f0-9]{64}$/),
+        expect.any(Object),
+        12600 // 10:30 → 14:00
+      );
+    });
+
+    it('should cache results with start_from until local midnight', () => {
+      mockedCache.get.mockReturnValue(undefined);
+
+      nextOccurrence({
+        pattern: 'daily',
+        time: '14:00',
+        start_from: '2025-03-01T00:00:00Z',
+      });
+
+      // Only days_until depends on the current time
+      expect(mockedCache.set).toHaveBeenCalledWith(
+        expect.stringMatching(/^[a-f0-9]{64}$/),
+        expect.any(Object),
+        48600 // 10:30 → midnight UTC
+      );
+    });
+
+    it('should cache sliding patterns for 1 hour', () => {
+      mockedCache.get.mockReturnValue(undefined);
+
+      // Without a time of day the result moves with the current time
+      nextOccurrence({
+        pattern: 'daily',
+      });
+
       expect(mockedCache.set).toHaveBeenCalledWith(
         expect.stringMatching(/^[a-f0-9]{64}$/),
         expect.any(Object),
@@ -0,0 +1,159 @@
+import { eachDayOfInterval } from 'date-fns';
+
+import { fromEpochDay, getHolidayIndex, toEpochDay } from '../../src/data/holidays';
+import {
+  countBusinessDays,
+  countCalendarHolidays,
+  countWeekendDays,
+  isWeekendDay,
+  stepBusinessDays,
+} from '../../src/utils/businessDayCounter';
+import { categorizeDays } from '../../src/utils/businessDayHelpers';
+
+/** Per-day reference: walk the range like getBusinessDays used to */
+function walkRange(
+  start: Date,
+  end: Date,
+  calendar: string | undefined,
+  includeObserved: boolean,
+  extra: Date[] = []
+): ReturnType<typeof categorizeDays> {
+  const holidays = new Set(extra.map((d) => d.toDateString()));
+  if (calendar) {
+    for (let year = start.getFullYear() - 1; year <= end.getFullYear() + 1; year++) {
+      const mode = includeObserved ? 'observed' : 'actual';
+      for (const day of getHolidayIndex(calendar, year, mode).days) {
+        holidays.add(fromEpochDay(day).toDateString());
+      }
+    }
+  }
+  return categorizeDays(eachDayOfInterval({ start, end }), holidays);
+}
+
+function count(
+  start: Date,
+  end: Date,
+  calendar: string | undefined,
+  includeObserved: boolean,
+  extra: Date[] = []
+): ReturnType<typeof countBusinessDays> {
+  return countBusinessDays({
+    startDay: toEpochDay(start),
+    endDay: toEpochDay(end),
+    calendar,
+    includeObserved,
+    extraHolidays: new Set(extra.map(toEpochDay)),
+  });
+}
+
+describe('businessDayCounter', () => {
+  describe('weekends', () => {
+    it('should identify Saturdays and Sundays', () => {
+      expect(isWeekendDay(toEpochDay(new Date(2025, 0, 18)))).toBe(true); // Saturday
+      expect(isWeekendDay(toEpochDay(new Date(2025, 0, 19)))).toBe(true); // Sunday
+      expect(isWeekendDay(toEpochDay(new Date(2025, 0, 20)))).toBe(false); // Monday
+      expect(isWeekendDay(toEpochDay(new Date(1969, 11, 31)))).toBe(false); // Wednesday
+      expect(isWeekendDay(toEpochDay(new Date(1969, 11, 28)))).toBe(true); // Sunday
+    });
+
+    it('should count weekend days in any range', () => {
+      const first = toEpochDay(new Date(2025, 0, 1)); // Wednesday
+      expect(countWeekendDays(first, first)).toBe(0);
+      expect(countWeekendDays(first, first + 6)).toBe(2);
+      expect(countWeekendDays(first, first + 364)).toBe(104);
+    });
+  });
+
+  describe('countBusinessDays', () => {
+    it.each([
+      ['US', true, new Date(2025, 0, 1), new Date(2025, 11, 31)],
+      ['US', false, new Date(2026, 6, 1), new Date(2026, 6, 31)],
+      ['UK', true, new Date(2020, 11, 15), new Date(2022, 0, 15)],
+      ['CL', true, new Date(2024, 0, 1), new Date(2024, 11, 31)],
+      ['AU', false, new Date(2199, 5, 1), new Date(2201, 5, 1)],
+      ['CA', true, new Date(1965, 0, 1), new Date(1972, 11, 31)],
+    ])('should match walking every day for %s (observed: %s)', (calendar, observed, start, end) => {
+      expect(count(start, end, calendar, observed)).toEqual(
+        walkRange(start, end, calendar, observed)
+      );
+    });
+
+    it('should count observed dates from the neighbouring year', () => {
+      // New Year's Day 2022 (Saturday) was observed Friday Dec 31, 2021
+      const dec31 = toEpochDay(new Date(2021, 11, 31));
+      expect(countCalendarHolidays('US', true, dec31, dec31)).toBe(1);
+      expect(countCalendarHolidays('US', false, dec31, dec31)).toBe(0);
+    });
+
+    it('should not double count explicit holidays on calendar holidays or weekends', () => {
+      const start = new Date(2025, 0, 1);
+      const end = new Date(2025, 0, 31);
+      const extra = [
+        new Date(2025, 0, 1), // New Year's Day
+        new Date(2025, 0, 4), // Saturday
+        new Date(2025, 0, 15), // Wednesday
+      ];
+
+      const result = count(start, end, 'US', true, extra);
+      expect(result).toEqual(walkRange(start, end, 'US', true, extra));
+      expect(result.holidayCount).toBe(3); // Jan 1, Jan 15, MLK Day
+    });
+
+    it('should accept ranges given end first', () => {
+      const start = new Date(2025, 0, 17);
+      const end = new Date(2025, 0, 13);
+      expect(count(start, end, undefined, true)).toEqual(walkRange(end, start, undefined, true));
+    });
+
+    it('should count unknown calendars as having no holidays', () => {
+      const result = count(new Date(2025, 0, 1), new Date(2025, 0, 31), 'ZZ', true);
+      expect(result.holidayCount).toBe(0);
+    });
+
+    it('should count multi-century ranges without walking them', () => {
+      const start = new Date(1900, 0, 1);
+      const end = new Date(2299, 11, 31);
+
+      const began = process.hrtime.bigint();
+      const result = count(start, end, 'US', true);
+      const elapsedMs = Number(process.hrtime.bigint() - began) / 1e6;
+
+      expect(result).toEqual(walkRange(start, end, 'US', true));
+      // Generous - the first call builds the prefix sums for US
+      expect(elapsedMs).toBeLessThan(2000);
+    });
+  });
+
+  describe('stepBusinessDays', () => {
+    const rules = {
+      calendar: 'UK',
+      includeObserved: true,
+      excludeWeekends: true,
+      extraHolidays: new Set([toEpochDay(new Date(2025, 3, 22))]),
+    };
+
+    /** Reference: walk one day at a time */
+    function walk(from: number, amount: number): number {
+      const direction = Math.sign(amount);
+      let day = from;
+      for (let left = Math.abs(amount); left > 0; ) {
+        day += direction;
+        const isHoliday =
+          rules.extraHolidays.has(day) || countCalendarHolidays('UK', true, day, day) > 0;
+        if (!isWeekendDay(day) && !isHoliday) {
+          left--;
+        }
+      }
+      return day;
+    }
+
+    it.each([1, 5, 23, 260, -1, -5, -23, -260])('should match a daily walk for %d days', (n) => {
+      const from = toEpochDay(new Date(2025, 3, 17)); // Thursday before Easter
+      expect(stepBusinessDays(from, n, rules, 365250)).toBe(walk(from, n));
+    });
+
+    it('should give up beyond the maximum span', () => {
+      expect(stepBusinessDays(0, 100, rules, 50)).toBeUndefined();
+    });
+  });
+});
@@ -0,0 +1,50 @@
+import { canonicalInstant, canonicalList, canonicalTimezone } from '../../src/utils/canonicalKey';
+
+describe('canonicalKey', () => {
+  describe('canonicalTimezone', () => {
+    it('should map legacy aliases to their canonical IANA id', () => {
+      expect(canonicalTimezone('US/Eastern')).toBe('America/New_York');
+      expect(canonicalTimezone('America/New_York')).toBe('America/New_York');
+    });
+
+    it('should not fold UTC aliases into "UTC"', () => {
+      // Code paths special-case the literal "UTC" string
+      expect(canonicalTimezone('UTC')).toBe('UTC');
+      expect(canonicalTimezone('Etc/UTC')).toBe('Etc/UTC');
+    });
+
+    it('should return undefined for invalid timezones', () => {
+      expect(canonicalTimezone('Invalid/Zone')).toBeUndefined();
+      // Second lookup is served from the memo
+      expect(canonicalTimezone('Invalid/Zone')).toBeUndefined();
+    });
+  });
+
+  describe('canonicalInstant', () => {
+    it('should reduce equivalent representations to the same instant', () => {
+      const expected = Date.UTC(2025, 0, 20, 15);
+
+      expect(canonicalInstant('2025-01-20T15:00:00Z', 'UTC')).toBe(expected);
+      expect(canonicalInstant('2025-01-20T15:00:00.000Z', 'UTC')).toBe(expected);
+      expect(canonicalInstant('2025-01-20T10:00:00-05:00', 'UTC')).toBe(expected);
+      expect(canonicalInstant('1737385200', 'UTC')).toBe(expected);
+      expect(canonicalInstant('2025-01-20T10:00:00', 'America/New_York')).toBe(expected);
+    });
+
+    it('should return undefined for unparseable input', () => {
+      expect(canonicalInstant('not a date', 'UTC')).toBeUndefined();
+    });
+  });
+
+  describe('canonicalList', () => {
+    it('should ignore order and duplicates', () => {
+      expect(canonicalList(['2025-12-25', '2025-01-01', '2025-12-25'])).toBe(
+        canonicalList(['2025-01-01', '2025-12-25'])
+      );
+    });
+
+    it('should not confuse values containing separators', () => {
+      expect(canonicalList(['a,b'])).not.toBe(canonicalList(['a', 'b']));
+    });
+  });
+});
@@ -1,12 +1,12 @@
 import { getConfig, resetConfigCache } from '../../src/utils/config';
-import { getTimezoneOffset } from 'date-fns-tz';
+import { isKnownTimezone } from '../../src/utils/timezoneRegistry';
 
-// Mock date-fns-tz
-jest.mock('date-fns-tz', () => ({
-  getTimezoneOffset: jest.fn(),
+// Mock the timezone registry
+jest.mock('../../src/utils/timezoneRegistry', () => ({
+  isKnownTimezone: jest.fn(),
 }));
 
-const mockedGetTimezoneOffset = getTimezoneOffset as jest.MockedFunction<typeof getTimezoneOffset>;
+const mockedIsKnownTimezone = isKnownTimezone as jest.MockedFunction<typeof isKnownTimezone>;
 
 describe('TimeServerConfig', () => {
   // Save original env vars
@@ -23,8 +23,8 @@ describe('TimeServerConfig', () => {
     // Reset mocks
     jest.clearAllMocks();
 
-    // Mock timezone validation - valid timezones return a number, invalid return NaN
-    mockedGetTimezoneOffset.mockImplementation((tz: string) => {
+    // Mock timezone validation
+    mockedIsKnownTimezone.mockImplementation((tz: string) => {
       const validTimezones = [
         'UTC',
         'America/New_York',
@@ -32,10 +32,7 @@ describe('TimeServerConfig', () => {
         'Europe/London',
         'America/Indianapolis',
       ];
-      if (validTimezones.includes(tz) || tz === '') {
-        return 0; // Simplified - just return 0 for valid
-      }
-      return NaN; // Invalid timezone
+      return validTimezones.includes(tz);
     });
 
     // Reset config cache
@@ -219,11 +216,8 @@ describe('TimeServerConfig', () => {
 
     it('should handle unusual but valid timezone strings', () => {
       // Based on our research, these are technically valid
-      mockedGetTimezoneOffset.mockImplementation((tz: string) => {
-        if (tz === 'undefined' || tz === 'null') {
-          return 0; // These weird strings are valid
-        }
-        return NaN;
+      mockedIsKnownTimezone.mockImplementation((tz: string) => {
+        return tz === 'undefined' || tz === 'null'; // These weird strings are valid
       });
 
       process.env.DEFAULT_TIMEZONE = 'undefined';
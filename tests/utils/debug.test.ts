@@ -168,4 +168,28 @@ describe('Debug utilities', () => {
       expect(output).toContain('Rate limit exceeded. Retry after: 45s');
     });
   });
+
+  describe('decision logging', () => {
+    it('should not build lazy contexts when debug is off', async () => {
+      delete process.env.DEBUG;
+
+      const { debug } = await import('../../src/utils/debug');
+      const context = jest.fn(() => ({ path: 'fast' }));
+      debug.decision('Path chosen', context);
+
+      expect(context).not.toHaveBeenCalled();
+      expect(stderrOutput).toHaveLength(0);
+    });
+
+    it('should build lazy contexts when the decision is logged', async () => {
+      process.env.DEBUG = 'mcp:decision:*';
+
+      const { debug } = await import('../../src/utils/debug');
+      debug.decision('Path chosen', () => ({ path: 'fast' }));
+
+      const output = stderrOutput.join('');
+      expect(output).toContain('Path chosen');
+      expect(output).toContain('path="fast"');
+    });
+  });
 });
@@ -0,0 +1,130 @@
+import * as fs from 'fs';
+import * as os from 'os';
+import * as path from 'path';
+
+import { debug } from '../../src/utils/debug';
+import {
+  dumpDebugBuffer,
+  dumpDebugBufferOnError,
+  ERROR_DUMP_INTERVAL_MS,
+  formatDebugBuffer,
+  isDebugBufferActive,
+  startDebugBuffer,
+  withDebugRequest,
+} from '../../src/utils/debugBuffer';
+
+describe('debugBuffer', () => {
+  const originalDebug = process.env.DEBUG;
+  let stop: () => void = () => undefined;
+  let dir: string;
+
+  beforeEach(() => {
+    delete process.env.DEBUG;
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'debug-buffer-'));
+  });
+
+  afterEach(() => {
+    stop();
+    if (originalDebug === undefined) {
+      delete process.env.DEBUG;
+    } else {
+      process.env.DEBUG = originalDebug;
+    }
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('should do nothing without a buffer size', () => {
+    stop = startDebugBuffer(0);
+    expect(isDebugBufferActive()).toBe(false);
+    expect(withDebugRequest(() => 42)).toBe(42);
+    expect(dumpDebugBufferOnError('test')).toBeNull();
+  });
+
+  it('should record debug calls instead of writing them', () => {
+    const write = jest.spyOn(process.stderr, 'write');
+    stop = startDebugBuffer(10);
+
+    debug.cache('Cache %s for %s', 'HIT', 'key');
+    debug.business('Range: %O', { days: 3 });
+
+    expect(write).not.toHaveBeenCalled();
+    const lines = formatDebugBuffer();
+    expect(lines).toHaveLength(2);
+    expect(lines[0]).toMatch(/^\S+Z \d+\.\d{3} \[-\] mcp:cache Cache HIT for key$/);
+    expect(lines[1]).toContain('mcp:business Range: { days: 3 }');
+    write.mockRestore();
+  });
+
+  it('should keep only the most recent events', () => {
+    stop = startDebugBuffer(3);
+    for (let i = 0; i < 5; i++) {
+      debug.trace('event %d', i);
+    }
+
+    const messages = formatDebugBuffer().map((line) => line.split(' mcp:trace ')[1]);
+    expect(messages).toEqual(['event 2', 'event 3', 'event 4']);
+  });
+
+  it('should follow DEBUG namespaces when set', () => {
+    process.env.DEBUG = 'mcp:cache';
+    stop = startDebugBuffer(10);
+
+    debug.cache('kept');
+    debug.trace('dropped');
+
+    expect(formatDebugBuffer()).toHaveLength(1);
+    expect(debug.trace.enabled).toBe(false);
+  });
+
+  it('should tag events with the request that made them', async () => {
+    stop = startDebugBuffer(10);
+
+    debug.server('outside');
+    await withDebugRequest(async () => {
+      await Promise.resolve();
+      debug.server('inside');
+    });
+
+    const [outside, inside] = formatDebugBuffer();
+    expect(outside).toContain('[-]');
+    expect(inside).toMatch(/\[req \d+\] mcp:server inside$/);
+  });
+
+  it('should dump the buffer to a file', () => {
+    stop = startDebugBuffer(10);
+    debug.error('Something failed: %s', 'boom');
+
+    const result = dumpDebugBuffer('test', dir);
+
+    expect(result.events).toBe(1);
+    expect(path.dirname(result.path)).toBe(dir);
+    const text = fs.readFileSync(result.path, 'utf8');
+    expect(text).toContain('# Reason: test');
+    expect(text).toContain('mcp:error Something failed: boom');
+  });
+
+  it('should throttle dumps on error', () => {
+    process.env.DEBUG_BUFFER_DIR = dir;
+    try {
+      stop = startDebugBuffer(10);
+      const now = Date.now();
+
+      expect(dumpDebugBufferOnError('first', now)).not.toBeNull();
+      expect(dumpDebugBufferOnError('second', now + 1000)).toBeNull();
+      expect(dumpDebugBufferOnError('third', now + ERROR_DUMP_INTERVAL_MS)).not.toBeNull();
+    } finally {
+      delete process.env.DEBUG_BUFFER_DIR;
+    }
+  });
+
+  it('should restore normal debug output when stopped', () => {
+    stop = startDebugBuffer(10);
+    const handlers = process.listenerCount('SIGUSR2');
+    stop();
+
+    expect(isDebugBufferActive()).toBe(false);
+    expect(process.listenerCount('SIGUSR2')).toBe(process.platform === 'win32' ? 0 : handlers - 1);
+    debug.cache('not recorded');
+    expect(formatDebugBuffer()).toEqual([]);
+  });
+});
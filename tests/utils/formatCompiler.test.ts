@@ -0,0 +1,87 @@
+import { formatInTimeZone } from 'date-fns-tz';
+
+import { compileFormat, formatCompiled } from '../../src/utils/formatCompiler';
+
+describe('formatCompiler', () => {
+  describe('compileFormat', () => {
+    it('should validate formats against the allow-list', () => {
+      expect(compileFormat('yyyy-MM-dd').valid).toBe(true);
+      expect(compileFormat("EEEE, MMMM do 'at' h:mm a").valid).toBe(true);
+      expect(compileFormat('yyyy; rm -rf /').valid).toBe(false);
+      expect(compileFormat('yyyy-MM-dd ${x}').valid).toBe(false);
+      expect(compileFormat('Hello World').valid).toBe(false);
+    });
+
+    it('should reuse the compiled format', () => {
+      expect(compileFormat('HH:mm:ss')).toBe(compileFormat('HH:mm:ss'));
+    });
+
+    it('should recompile formats dropped from the cache', () => {
+      const first = compileFormat('dd/MM/yyyy');
+      for (let i = 0; i < 300; i++) {
+        compileFormat(`'${i}' yyyy`);
+      }
+      const again = compileFormat('dd/MM/yyyy');
+      expect(again).not.toBe(first);
+
+      const date = new Date(Date.UTC(2025, 0, 5));
+      expect(formatCompiled(date, 'UTC', again)).toBe(formatCompiled(date, 'UTC', first));
+    });
+
+    it('should leave names, ordinals and zone names to date-fns', () => {
+      for (const format of ['EEEEE', 'MMM d', 'do', 'ccc', 'zzz', 'OOOO', "HH'X'XXX", 'xX']) {
+        expect(compileFormat(format).parts).toBeUndefined();
+      }
+      expect(compileFormat("yyyy-MM-dd'T'HH:mm:ss.SSSXXX").parts).toBeDefined();
+    });
+  });
+
+  describe('formatCompiled', () => {
+    const formats = [
+      "yyyy-MM-dd'T'HH:mm:ss.SSSXXX",
+      'yyyy-MM-dd HH:mm:ss',
+      'MM/dd/yyyy h:mm a',
+      'y yy yyy yyyyy M d H h m s S SS SSS a aa aaa',
+      'X XX XXX XXXX XXXXX x xx xxx xxxx xxxxx',
+      "'Week of' yyyy-MM-dd, HH 'o''clock'",
+      "''HH''",
+      'c cc E EE EEE EEEE',
+      'EEEE, MMMM do yyyy zzz',
+    ];
+    const instants = [
+      Date.UTC(2025, 0, 5, 15, 4, 5, 67),
+      Date.UTC(2025, 2, 9, 7, 0, 0), // New York springs forward
+      Date.UTC(2025, 10, 2, 5, 30, 0, 999), // inside New York's repeated hour
+      Date.UTC(1890, 5, 1, 12), // local mean time offsets
+      Date.UTC(-50, 0, 1),
+    ];
+    const timezones = [
+      'UTC',
+      'America/New_York',
+      'Asia/Kolkata',
+      'America/St_Johns',
+      'Australia/Lord_Howe',
+      'Europe/Dublin',
+      '+05:45',
+      '-08',
+    ];
+
+    it.each(formats)('should match formatInTimeZone for %s', (format) => {
+      const compiled = compileFormat(format);
+      for (const timezone of timezones) {
+        for (const instant of instants) {
+          const date = new Date(instant);
+          expect(formatCompiled(date, timezone, compiled)).toBe(
+            formatInTimeZone(date, timezone, format)
+          );
+        }
+      }
+    });
+
+    it('should raise the same errors as formatInTimeZone', () => {
+      const date = new Date(Date.UTC(2025, 0, 5));
+      expect(() => formatCompiled(date, 'Invalid/Zone', compileFormat('yyyy'))).toThrow(RangeError);
+      expect(() => formatCompiled(new Date(NaN), 'UTC', compileFormat('yyyy'))).toThrow(RangeError);
+    });
+  });
+});
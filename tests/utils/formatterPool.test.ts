@@ -0,0 +1,53 @@
+import {
+  getDateTimeFormat,
+  getFormatterPoolStats,
+  resetFormatterPool,
+} from '../../src/utils/formatterPool';
+
+describe('formatterPool', () => {
+  beforeEach(() => {
+    resetFormatterPool();
+  });
+
+  it('should return the same formatter for the same timezone and preset', () => {
+    const formatter = getDateTimeFormat('America/New_York', 'fields');
+    expect(getDateTimeFormat('America/New_York', 'fields')).toBe(formatter);
+    expect(getDateTimeFormat('America/New_York', 'zone')).not.toBe(formatter);
+    expect(getDateTimeFormat('Europe/London', 'fields')).not.toBe(formatter);
+  });
+
+  it('should apply the preset options', () => {
+    const options = getDateTimeFormat('Asia/Tokyo', 'fields').resolvedOptions();
+    expect(options.timeZone).toBe('Asia/Tokyo');
+    expect(options.hourCycle).toBe('h23');
+    expect(options.locale).toBe('en-US');
+  });
+
+  it('should count hits and misses', () => {
+    getDateTimeFormat('UTC', 'fields');
+    getDateTimeFormat('UTC', 'fields');
+    getDateTimeFormat('UTC', 'zone');
+    expect(getFormatterPoolStats()).toEqual({ size: 2, hits: 1, misses: 2, evictions: 0 });
+  });
+
+  it('should evict the least recently used formatter when full', () => {
+    const zones = Intl.supportedValuesOf('timeZone').slice(0, 129);
+    const first = getDateTimeFormat(zones[0], 'fields');
+    const second = getDateTimeFormat(zones[1], 'fields');
+    for (const zone of zones.slice(2)) {
+      getDateTimeFormat(zone, 'fields');
+    }
+    getDateTimeFormat(zones[0], 'fields'); // rebuilt, evicting zones[1]
+
+    const stats = getFormatterPoolStats();
+    expect(stats.size).toBe(128);
+    expect(stats.evictions).toBe(2);
+    expect(getDateTimeFormat(zones[0], 'fields')).not.toBe(first);
+    expect(getDateTimeFormat(zones[1], 'fields')).not.toBe(second);
+  });
+
+  it('should throw for unknown timezones without pooling anything', () => {
+    expect(() => getDateTimeFormat('Invalid/Zone', 'fields')).toThrow(RangeError);
+    expect(getFormatterPoolStats().size).toBe(0);
+  });
+});
@@ -1,8 +1,22 @@
-import { aggregateHolidays } from '../../src/utils/holidayAggregator';
-import { getHolidaysForYear } from '../../src/data/holidays';
+import {
+  aggregateExplicitHolidayDays,
+  aggregateHolidays,
+} from '../../src/utils/holidayAggregator';
+import { getHolidaysForYear, toEpochDay } from '../../src/data/holidays';
 
-// Mock the holidays data module
-jest.mock('../../src/data/holidays');
+// Mock the holiday rules; the index is rebuilt from the mock on every call
+// (the real getHolidayIndex memoizes, which would leak data between tests)
+jest.mock('../../src/data/holidays', () => {
+  const actual = jest.requireActual('../../src/data/holidays');
+  const getHolidaysForYear = jest.fn();
+  return {
+    ...actual,
+    getHolidaysForYear,
+    getHolidayIndex: jest.fn((country: string, year: number, mode: string) =>
+      actual.buildHolidayIndex(getHolidaysForYear(country, year) ?? [], year, mode)
+    ),
+  };
+});
 
 describe('holidayAggregator', () => {
   const mockGetHolidaysForYear = getHolidaysForYear as jest.MockedFunction<
@@ -284,4 +298,26 @@ describe('holidayAggregator', () => {
       expect(result.has(new Date('2025-12-25').toDateString())).toBe(true); // Calendar holiday (year 2025)
     });
   });
+
+  describe('aggregateExplicitHolidayDays', () => {
+    it('should return custom and legacy holidays in range as epoch days', () => {
+      const result = aggregateExplicitHolidayDays({
+        calendar: 'US',
+        custom: ['2025-02-14', '2025-03-15'],
+        legacy: ['2025-03-15', '2025-06-20'],
+        includeObserved: true,
+        timezone: 'UTC',
+        dateRange: {
+          start: new Date('2025-03-01'),
+          end: new Date('2025-12-31'),
+        },
+      });
+
+      expect(result).toEqual(
+        new Set([toEpochDay(new Date('2025-03-15')), toEpochDay(new Date('2025-06-20'))])
+      );
+      // Calendar holidays are counted separately
+      expect(mockGetHolidaysForYear).not.toHaveBeenCalled();
+    });
+  });
 });
@@ -1,3 +1,6 @@
+import { parseISO } from 'date-fns';
+import { toDate } from 'date-fns-tz';
+
 import { DateParsingError } from '../../src/adapters/mcp-sdk/errors';
 import { parseTimeInput } from '../../src/utils/parseTimeInput';
 
@@ -156,6 +159,80 @@ describe('parseTimeInput', () => {
       expect(result.date).toBeInstanceOf(Date);
       // The time should jump to 3:30am due to DST
     });
+
+    it.each([
+      ['2025-03-09T02:30:00', '2025-03-09T06:30:00.000Z'], // in the gap
+      ['2025-11-02T01:30:00', '2025-11-02T05:30:00.000Z'], // in the overlap
+      ['2025-11-02 01:30', '2025-11-02T05:30:00.000Z'],
+      ['2025-07-04', '2025-07-04T04:00:00.000Z'],
+    ])('should resolve %s in New York like date-fns-tz', (input, expected) => {
+      const result = parseTimeInput(input, 'America/New_York');
+      expect(result.date.toISOString()).toBe(expected);
+    });
+  });
+
+  describe('Canonical ISO fast path', () => {
+    const OFFSETS = ['Z', '+05:30', '-08:00', '+00:00', '-03:45', '+14:00'];
+    const TIMEZONES = ['', 'UTC', 'America/New_York', 'Australia/Lord_Howe', 'Asia/Kolkata'];
+
+    /** Canonical ISO strings in every shape the fast path scans */
+    function generateCorpus(count: number): string[] {
+      let seed = 42;
+      const random = (n: number): number => {
+        seed = (seed * 1103515245 + 12345) % 2147483648;
+        return Math.floor((seed / 2147483648) * n);
+      };
+      const span = Date.UTC(2100, 0, 1) - Date.UTC(1900, 0, 1);
+      return Array.from({ length: count }, () => {
+        const iso = new Date(Date.UTC(1900, 0, 1) + random(span)).toISOString();
+        const date = iso.slice(0, 10);
+        const time = [
+          iso.slice(11, 16),
+          iso.slice(11, 19),
+          iso.slice(11, 21),
+          iso.slice(11, 23),
+          iso.slice(11, 23) + String(random(1000)).padStart(3, '0'),
+        ][random(5)];
+        const zone = ['', ...OFFSETS][random(OFFSETS.length + 1)];
+        return random(10) === 0 ? date : `${date}${random(2) ? 'T' : ' '}${time}${zone}`;
+      });
+    }
+
+    it('should agree with the general strategies over a generated corpus', () => {
+      const mismatches: string[] = [];
+      generateCorpus(5000).forEach((input, i) => {
+        const timezone = TIMEZONES[i % TIMEZONES.length];
+        const zone = /(?:Z|[+-]\d{2}:\d{2})$/.exec(input)?.[0];
+        const expected = zone ? parseISO(input) : toDate(input, { timeZone: timezone || 'UTC' });
+        const result = parseTimeInput(input, timezone);
+        if (
+          result.date.getTime() !== expected.getTime() ||
+          result.hasExplicitTimezone !== (zone !== undefined)
+        ) {
+          mismatches.push(`${input} (${timezone}): ${result.date.toISOString()}`);
+        }
+      });
+      expect(mismatches).toEqual([]);
+    });
+
+    it.each([
+      ['2025-01-01T12:00:00Z', 'UTC', undefined],
+      ['2025-01-01T12:00:00.5+05:30', 'offset', 330],
+      ['2025-01-01 12:00-00:30', 'offset', -30],
+    ])('should report the zone of %s', (input, detectedTimezone, offset) => {
+      const result = parseTimeInput(input, 'Asia/Tokyo');
+      expect(result.detectedTimezone).toBe(detectedTimezone);
+      expect(result.offset).toBe(offset);
+    });
+
+    it.each([
+      '1970-01-01T00:00:01.001Z', // parseISO's float seconds truncate to .000
+      '2025-01-01T12:00:00,5Z',
+      '2025-01-01T24:00:00Z',
+      '2025-01-01T12:00:00.123456789012345Z',
+    ])('should match parseISO for %s', (input) => {
+      expect(parseTimeInput(input).date.getTime()).toBe(parseISO(input).getTime());
+    });
   });
 
   describe('Backwards compatibility', () => {
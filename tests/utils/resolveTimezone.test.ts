@@ -1,4 +1,4 @@
-import { resolveTimezone } from '../../src/utils/timezoneUtils';
+import { getNextLocalMidnight, resolveTimezone } from '../../src/utils/timezoneUtils';
 
 describe('resolveTimezone', () => {
   const systemTimezone = Intl.DateTimeFormat().resolvedOptions().timeZone;
@@ -81,3 +81,27 @@ describe('resolveTimezone', () => {
     });
   });
 });
+
+describe('getNextLocalMidnight', () => {
+  it('should return the next midnight in UTC', () => {
+    const result = getNextLocalMidnight(new Date('2025-01-15T10:30:00Z'), 'UTC');
+    expect(result.toISOString()).toBe('2025-01-16T00:00:00.000Z');
+  });
+
+  it('should use the local date of the timezone', () => {
+    // 03:00Z is still Jan 14 in New York
+    const result = getNextLocalMidnight(new Date('2025-01-15T03:00:00Z'), 'America/New_York');
+    expect(result.toISOString()).toBe('2025-01-15T05:00:00.000Z');
+  });
+
+  it('should handle days shortened by DST', () => {
+    // Mar 9 2025 has 23 hours in New York; the next midnight is EDT
+    const result = getNextLocalMidnight(new Date('2025-03-09T12:00:00Z'), 'America/New_York');
+    expect(result.toISOString()).toBe('2025-03-10T04:00:00.000Z');
+  });
+
+  it('should move to the next day exactly at midnight', () => {
+    const result = getNextLocalMidnight(new Date('2025-01-16T00:00:00Z'), 'UTC');
+    expect(result.toISOString()).toBe('2025-01-17T00:00:00.000Z');
+  });
+});
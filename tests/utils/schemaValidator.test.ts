@@ -0,0 +1,90 @@
+import { ValidationError } from '../../src/adapters/mcp-sdk/errors';
+import { compileSchema } from '../../src/utils/schemaValidator';
+import type { ObjectSchema } from '../../src/utils/schemaValidator';
+
+const SCHEMA: ObjectSchema = {
+  type: 'object',
+  properties: {
+    time: { type: 'string' },
+    target: { type: ['string', 'number'] },
+    amount: { type: 'number' },
+    unit: { type: 'string', enum: ['days', 'hours'] },
+    holidays: { type: 'array', items: { type: 'string' } },
+    business_hours: { type: 'object' },
+    short: { type: 'string', maxLength: 5 },
+    flag: { type: 'boolean' },
+  },
+  required: ['time', 'amount'],
+};
+
+describe('compileSchema', () => {
+  const validate = compileSchema(SCHEMA);
+
+  function messageFor(args: unknown): string {
+    try {
+      validate(args);
+    } catch (error) {
+      expect(error).toBeInstanceOf(ValidationError);
+      return (error as Error).message;
+    }
+    throw new Error('expected a ValidationError');
+  }
+
+  it('should pass valid arguments through unchanged', () => {
+    const args = { time: '2025-01-01', amount: 3, unit: 'days', extra: 'kept' };
+    expect(validate(args)).toBe(args);
+  });
+
+  it('should treat missing arguments as an empty object', () => {
+    expect(compileSchema({ type: 'object', properties: {} })(undefined)).toEqual({});
+  });
+
+  it('should reject arguments that are not an object', () => {
+    expect(messageFor([1, 2])).toBe('Arguments must be an object');
+    expect(messageFor('text')).toBe('Arguments must be an object');
+  });
+
+  it('should require required properties', () => {
+    expect(messageFor({ amount: 1 })).toBe('time is required');
+    expect(messageFor({ time: '2025-01-01', amount: null })).toBe('amount is required');
+  });
+
+  it('should check types, ignoring null optional properties', () => {
+    const base = { time: '2025-01-01', amount: 1 };
+    expect(messageFor({ ...base, amount: '1' })).toBe('amount must be a number');
+    expect(messageFor({ ...base, target: true })).toBe('target must be a string or a number');
+    expect(messageFor({ ...base, holidays: 'x' })).toBe('holidays must be an array');
+    expect(messageFor({ ...base, holidays: ['2025-01-01', 5] })).toBe(
+      'holidays[1] must be a string'
+    );
+    expect(messageFor({ ...base, business_hours: [] })).toBe('business_hours must be an object');
+    expect(messageFor({ ...base, flag: 'yes' })).toBe('flag must be a boolean');
+    expect(validate({ ...base, target: 1700000000, flag: null })).toBeDefined();
+  });
+
+  it('should check enums with the tools message', () => {
+    expect(messageFor({ time: 'now', amount: 1, unit: 'weeks' })).toBe(
+      'Invalid unit: weeks. Must be one of: days, hours'
+    );
+  });
+
+  it('should normalise enum values into a copy', () => {
+    const args = { time: 'now', amount: 1, unit: 'HOURS' };
+    const result = validate(args);
+    expect(result).toEqual({ time: 'now', amount: 1, unit: 'hours' });
+    expect(args.unit).toBe('HOURS');
+  });
+
+  it('should limit string and array lengths', () => {
+    const base = { time: '2025-01-01', amount: 1 };
+    expect(messageFor({ ...base, short: 'toolong' })).toBe(
+      'short exceeds maximum length of 5 characters'
+    );
+    expect(messageFor({ ...base, time: 'x'.repeat(1001) })).toBe(
+      'time exceeds maximum length of 1000 characters'
+    );
+    expect(messageFor({ ...base, holidays: new Array(366).fill('2025-01-01') })).toBe(
+      'holidays exceeds maximum array length of 365 items'
+    );
+  });
+});
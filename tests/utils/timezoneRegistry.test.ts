@@ -0,0 +1,64 @@
+import { getTimezoneId, isKnownTimezone } from '../../src/utils/timezoneRegistry';
+
+describe('timezoneRegistry', () => {
+  describe('getTimezoneId', () => {
+    it('should know every zone Intl lists', () => {
+      for (const id of Intl.supportedValuesOf('timeZone')) {
+        expect(getTimezoneId(id)).toBe(id);
+      }
+    });
+
+    it('should resolve aliases to their canonical id', () => {
+      expect(getTimezoneId('US/Eastern')).toBe('America/New_York');
+      expect(getTimezoneId('Etc/UTC')).toBe('UTC');
+      expect(getTimezoneId('UTC')).toBe('UTC');
+      expect(getTimezoneId('america/new_york')).toBe('America/New_York');
+    });
+
+    it('should return undefined for names Intl rejects', () => {
+      expect(getTimezoneId('Invalid/Zone')).toBeUndefined();
+    });
+
+    it('should ask Intl about a rejected name only once', () => {
+      getTimezoneId('UTC'); // registry built
+      const spy = jest.spyOn(Intl, 'DateTimeFormat');
+      try {
+        expect(getTimezoneId('Test/Zone1')).toBeUndefined();
+        expect(getTimezoneId('Test/Zone1')).toBeUndefined();
+        expect(getTimezoneId('America/Chicago')).toBe('America/Chicago');
+        expect(spy).toHaveBeenCalledTimes(1);
+      } finally {
+        spy.mockRestore();
+      }
+    });
+
+    it('should keep answering correctly after a flood of unknown names', () => {
+      for (let i = 0; i < 2500; i++) {
+        expect(getTimezoneId(`Test/Zone${i}`)).toBeUndefined();
+      }
+      expect(getTimezoneId('Test/Zone0')).toBeUndefined();
+      expect(getTimezoneId('US/Pacific')).toBe('America/Los_Angeles');
+    });
+  });
+
+  describe('isKnownTimezone', () => {
+    it('should accept IANA names and aliases', () => {
+      expect(isKnownTimezone('Asia/Tokyo')).toBe(true);
+      expect(isKnownTimezone('EST5EDT')).toBe(true);
+      expect(isKnownTimezone('GMT')).toBe(true);
+    });
+
+    it('should accept fixed offsets like date-fns-tz', () => {
+      expect(isKnownTimezone('Z')).toBe(true);
+      expect(isKnownTimezone('+05')).toBe(true);
+      expect(isKnownTimezone('-08:00')).toBe(true);
+      expect(isKnownTimezone('+0530')).toBe(true);
+      expect(isKnownTimezone('+24:00')).toBe(false);
+    });
+
+    it('should reject unknown names', () => {
+      expect(isKnownTimezone('Invalid/Zone')).toBe(false);
+      expect(isKnownTimezone('NotATimezone')).toBe(false);
+    });
+  });
+});
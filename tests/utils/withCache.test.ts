@@ -8,6 +8,7 @@ jest.mock('../../src/cache/timeCache', () => ({
   cache: {
     get: jest.fn(),
     set: jest.fn(),
+    getTtl: jest.fn(),
   },
   CacheTTL: {
     CALCULATIONS: 3600,
@@ -284,4 +285,171 @@ describe('withCacheAsync', () => {
     // Should not cache errors
     expect(cache.set).not.toHaveBeenCalled();
   });
+
+  describe('single-flight', () => {
+    it('should share one computation between concurrent callers', async () => {
+      (cache.get as jest.Mock).mockReturnValue(undefined);
+      let resolve: (value: string) => void = () => undefined;
+      const compute = jest.fn(
+        () =>
+          new Promise<string>((r) => {
+            resolve = r;
+          })
+      );
+
+      const first = withCacheAsync('flight_key', 1, compute);
+      const second = withCacheAsync('flight_key', 1, compute);
+      resolve('computed');
+
+      await expect(Promise.all([first, second])).resolves.toEqual(['computed', 'computed']);
+      expect(compute).toHaveBeenCalledTimes(1);
+    });
+
+    it('should share errors and retry on the next call', async () => {
+      (cache.get as jest.Mock).mockReturnValue(undefined);
+      const compute = jest.fn(async () => {
+        throw new Error('boom');
+      });
+
+      const results = await Promise.allSettled([
+        withCacheAsync('flight_error', 1, compute),
+        withCacheAsync('flight_error', 1, compute),
+      ]);
+      expect(results.map((r) => r.status)).toEqual(['rejected', 'rejected']);
+      expect(compute).toHaveBeenCalledTimes(1);
+
+      await expect(withCacheAsync('flight_error', 1, compute)).rejects.toThrow('boom');
+      expect(compute).toHaveBeenCalledTimes(2);
+    });
+  });
+
+  describe('early refresh', () => {
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    it('should serve the cached value and refresh near expiry', async () => {
+      (cache.get as jest.Mock).mockReturnValue('stale');
+      (cache.getTtl as jest.Mock).mockReturnValue(Date.now() + 1);
+      (cache.set as jest.Mock).mockImplementation(() => true);
+      jest.spyOn(Math, 'random').mockReturnValue(0.5);
+      const compute = jest.fn(async () => 'fresh');
+
+      const result = await withCacheAsync('refresh_key', 1, compute, { earlyRefreshBeta: 1 });
+      await Promise.resolve();
+
+      expect(result).toBe('stale');
+      expect(compute).toHaveBeenCalledTimes(1);
+      expect(cache.set).toHaveBeenCalledWith('hashed_refresh_key', 'fresh', 1);
+    });
+
+    it('should not refresh entries far from expiry', async () => {
+      (cache.get as jest.Mock).mockReturnValue('cached');
+      (cache.getTtl as jest.Mock).mockReturnValue(Date.now() + 3_600_000);
+      const compute = jest.fn(async () => 'fresh');
+
+      await withCacheAsync('refresh_far', 3600, compute, { earlyRefreshBeta: 1 });
+
+      expect(compute).not.toHaveBeenCalled();
+    });
+
+    it('should not refresh unless enabled', async () => {
+      (cache.get as jest.Mock).mockReturnValue('cached');
+      (cache.getTtl as jest.Mock).mockReturnValue(Date.now() + 1);
+      const compute = jest.fn(async () => 'fresh');
+
+      await withCacheAsync('refresh_off', 1, compute);
+
+      expect(compute).not.toHaveBeenCalled();
+      expect(cache.getTtl).not.toHaveBeenCalled();
+    });
+  });
+});
+
+describe('withCache canonical keys', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+  });
+
+  it('should not build the canonical key on a raw hit', () => {
+    (cache.get as jest.Mock).mockReturnValue('cached');
+    const canonicalKey = jest.fn(() => 'canonical');
+
+    const result = withCache('raw', 3600, () => 'computed', { canonicalKey });
+
+    expect(result).toBe('cached');
+    expect(canonicalKey).not.toHaveBeenCalled();
+  });
+
+  it('should serve a canonical hit and alias the raw key', () => {
+    (cache.get as jest.Mock).mockImplementation((key: string) =>
+      key === 'hashed_canonical' ? 'cached' : undefined
+    );
+    (cache.getTtl as jest.Mock).mockReturnValue(undefined);
+    const compute = jest.fn(() => 'computed');
+
+    const result = withCache('raw', 3600, compute, { canonicalKey: () => 'canonical' });
+
+    expect(result).toBe('cached');
+    expect(compute).not.toHaveBeenCalled();
+    expect(cache.set).toHaveBeenCalledWith('hashed_raw', 'cached', 3600);
+  });
+
+  it('should store under both keys on a miss', () => {
+    (cache.get as jest.Mock).mockReturnValue(undefined);
+
+    withCache('raw', 3600, () => 'computed', { canonicalKey: () => 'canonical' });
+
+    expect(cache.set).toHaveBeenCalledWith('hashed_raw', 'computed', 3600);
+    expect(cache.set).toHaveBeenCalledWith('hashed_canonical', 'computed', 3600);
+  });
+
+  it('should fall back to the raw key when canonicalization fails', () => {
+    (cache.get as jest.Mock).mockReturnValue(undefined);
+
+    const result = withCache('raw', 3600, () => 'computed', {
+      canonicalKey: () => {
+        throw new Error('unparseable');
+      },
+    });
+
+    expect(result).toBe('computed');
+    expect(cache.set).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe('withCache validity intervals', () => {
+  beforeEach(() => {
+    jest.clearAllMocks();
+    jest.useFakeTimers();
+    jest.setSystemTime(new Date('2025-01-15T10:30:00.000Z'));
+    (cache.get as jest.Mock).mockReturnValue(undefined);
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  it('should expire entries when the value stops being valid', () => {
+    withCache('valid_key', 3600, () => 'computed', {
+      validUntil: () => Date.parse('2025-01-16T00:00:00.000Z'),
+    });
+
+    expect(cache.set).toHaveBeenCalledWith('hashed_valid_key', 'computed', 48600);
+  });
+
+  it('should use the fixed TTL when no instant is returned', () => {
+    withCache('valid_fixed', 3600, () => 'computed', { validUntil: () => undefined });
+
+    expect(cache.set).toHaveBeenCalledWith('hashed_valid_fixed', 'computed', 3600);
+  });
+
+  it('should not store values that are already stale', () => {
+    const result = withCache('valid_stale', 3600, () => 'computed', {
+      validUntil: () => Date.now(),
+    });
+
+    expect(result).toBe('computed');
+    expect(cache.set).not.toHaveBeenCalled();
+  });
 });
@@ -0,0 +1,135 @@
+import { fromZonedTime, getTimezoneOffset, toDate, toZonedTime } from 'date-fns-tz';
+
+import {
+  fromZonedDate,
+  getLocalDayNumber,
+  getWallClockOffset,
+  getZoneOffset,
+  MS_PER_DAY,
+  toZonedDate,
+  wallClockToInstant,
+  zoneOffsetChanges,
+} from '../../src/utils/zoneOffsets';
+
+const HOUR = 60 * 60 * 1000;
+
+/** Every 15 minutes from two days before to two days after an instant */
+function around(iso: string): Date[] {
+  const center = new Date(iso).getTime();
+  const dates: Date[] = [];
+  for (let t = center - 2 * MS_PER_DAY; t <= center + 2 * MS_PER_DAY; t += HOUR / 4) {
+    dates.push(new Date(t));
+  }
+  return dates;
+}
+
+describe('zoneOffsets', () => {
+  describe('getZoneOffset', () => {
+    it('should give the offset on either side of a DST change', () => {
+      // US spring forward: 2025-03-09 02:00 EST = 07:00Z
+      expect(getZoneOffset('America/New_York', Date.UTC(2025, 2, 9, 6, 59, 59))).toBe(-5 * HOUR);
+      expect(getZoneOffset('America/New_York', Date.UTC(2025, 2, 9, 7))).toBe(-4 * HOUR);
+    });
+
+    it('should handle half-hour offsets and half-hour DST', () => {
+      expect(getZoneOffset('Asia/Kolkata', Date.UTC(2025, 0, 1))).toBe(5.5 * HOUR);
+      expect(getZoneOffset('Australia/Lord_Howe', Date.UTC(2025, 0, 1))).toBe(11 * HOUR);
+      expect(getZoneOffset('Australia/Lord_Howe', Date.UTC(2025, 6, 1))).toBe(10.5 * HOUR);
+    });
+
+    it('should match Intl far from the epoch', () => {
+      for (const instant of [Date.UTC(1901, 5, 1), Date.UTC(2099, 11, 31, 23)]) {
+        expect(getZoneOffset('Europe/Paris', instant)).toBe(
+          getTimezoneOffset('Europe/Paris', new Date(instant))
+        );
+        expect(toZonedDate(new Date(instant), 'Europe/Paris')).toEqual(
+          toZonedTime(new Date(instant), 'Europe/Paris')
+        );
+      }
+    });
+
+    it('should accept fixed offsets and UTC', () => {
+      expect(getZoneOffset('UTC', 0)).toBe(0);
+      expect(getZoneOffset('', 0)).toBe(0);
+      expect(getZoneOffset('Z', 0)).toBe(0);
+      expect(getZoneOffset('+05:30', 0)).toBe(5.5 * HOUR);
+      expect(getZoneOffset('-0800', 0)).toBe(-8 * HOUR);
+      expect(getZoneOffset('+02', 0)).toBe(2 * HOUR);
+    });
+
+    it('should give NaN for unknown zones and out-of-range offsets', () => {
+      expect(getZoneOffset('Invalid/Zone', 0)).toBeNaN();
+      expect(getZoneOffset('+25:00', 0)).toBeNaN();
+      expect(getWallClockOffset('Invalid/Zone', 0)).toBeNaN();
+      expect(toZonedDate(new Date(0), 'Invalid/Zone').getTime()).toBeNaN();
+    });
+  });
+
+  describe('zoneOffsetChanges', () => {
+    it('should find a change within the range only', () => {
+      const change = Date.UTC(2025, 2, 9, 7);
+      expect(zoneOffsetChanges('America/New_York', change - 1000, change)).toBe(true);
+      expect(zoneOffsetChanges('America/New_York', change, change + MS_PER_DAY)).toBe(false);
+    });
+
+    it('should look across table spans', () => {
+      const from = Date.UTC(2000, 0, 1);
+      const to = Date.UTC(2030, 0, 1);
+      expect(zoneOffsetChanges('America/New_York', from, to)).toBe(true);
+      expect(zoneOffsetChanges('Asia/Tokyo', from, to)).toBe(false);
+      expect(zoneOffsetChanges('+05:00', from, to)).toBe(false);
+    });
+  });
+
+  describe('agreement with date-fns-tz', () => {
+    const transitions: Array<[string, string]> = [
+      ['America/New_York', '2025-03-09T07:00:00Z'],
+      ['America/New_York', '2025-11-02T06:00:00Z'],
+      ['Europe/London', '2025-10-26T01:00:00Z'],
+      ['America/St_Johns', '2024-03-10T05:30:00Z'],
+      ['America/Sao_Paulo', '2018-11-04T03:00:00Z'],
+      ['Australia/Lord_Howe', '2025-04-05T15:00:00Z'],
+      ['Pacific/Apia', '2011-12-30T10:00:00Z'],
+      ['Asia/Tehran', '2022-03-21T20:30:00Z'],
+    ];
+
+    it.each(transitions)('should convert times around %s %s the same way', (timezone, iso) => {
+      for (const date of around(iso)) {
+        expect(toZonedDate(date, timezone)).toEqual(toZonedTime(date, timezone));
+        // The same Date read as a wall-clock time, including times in the gap and overlap
+        expect(fromZonedDate(date, timezone)).toEqual(fromZonedTime(date, timezone));
+        expect(getWallClockOffset(timezone, date.getTime())).toBe(
+          getTimezoneOffset(timezone, date)
+        );
+      }
+    });
+
+    it('should resolve skipped and repeated wall-clock times like toDate', () => {
+      for (const wall of ['2025-03-09T02:30:00', '2025-11-02T01:30:00']) {
+        const expected = toDate(wall, { timeZone: 'America/New_York' });
+        const instant = wallClockToInstant('America/New_York', new Date(wall + 'Z').getTime());
+        expect(instant).toBe(expected.getTime());
+      }
+    });
+  });
+
+  describe('getLocalDayNumber', () => {
+    it('should count calendar days in the zone', () => {
+      const instant = Date.UTC(2025, 0, 1, 3); // Dec 31 in New York
+      expect(getLocalDayNumber('UTC', instant)).toBe(Date.UTC(2025, 0, 1) / MS_PER_DAY);
+      expect(getLocalDayNumber('America/New_York', instant)).toBe(
+        Date.UTC(2024, 11, 31) / MS_PER_DAY
+      );
+    });
+  });
+
+  it('should rebuild tables for zones dropped from the cache', () => {
+    const zones = Intl.supportedValuesOf('timeZone').slice(0, 100);
+    const instant = Date.UTC(2025, 6, 1);
+    const first = zones.map((zone) => getZoneOffset(zone, instant));
+    const again = zones.map((zone) => getZoneOffset(zone, instant));
+
+    expect(again).toEqual(first);
+    expect(first).toEqual(zones.map((zone) => getTimezoneOffset(zone, new Date(instant))));
+  });
+});